@@ -2,23 +2,31 @@ from __future__ import annotations
 
 import logging
 import os
+import shutil
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 import pendulum
 import requests
 from airflow.decorators import dag, task
-from airflow.exceptions import AirflowFailException
-from airflow.operators.bash import BashOperator
+from airflow.exceptions import AirflowFailException, AirflowSkipException
 from airflow.operators.empty import EmptyOperator
+from airflow.sensors.base import PokeReturnValue
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
 LOGGER = logging.getLogger(__name__)
 SUPPORTED_DATASETS = ("diary", "profile", "ratings", "reviews", "watched", "watchlist")
 RAW_PREFIX = os.getenv("LETTERBOXD_RAW_PREFIX", "letterboxd/")
+COMPONENT = "airflow"
+DBT_PROJECT_DIR = "/opt/airflow/project/dbt"
 DBT_LOG_PATH = "/opt/airflow/logs/dbt"
+# Kept between runs so dbt can reuse partial_parse.msgpack instead of re-parsing the project.
 DBT_TARGET_PATH = "/opt/airflow/logs/dbt/target"
+# Manifest of the last successful run, used for --defer/--state.
+DBT_STATE_PATH = Path("/opt/airflow/logs/dbt/state")
+DBT_POOL = os.getenv("LETTERBOXD_DBT_POOL", "dbt")
 
 
 def _api_base_url() -> str:
@@ -38,7 +46,11 @@ def _file_glob() -> str:
     return os.getenv("LETTERBOXD_INGESTION_FILE_GLOB", "*.csv")
 
 
-def _build_session() -> requests.Session:
+def _upload_workers() -> int:
+    return max(1, int(os.getenv("LETTERBOXD_UPLOAD_WORKERS", "4")))
+
+
+def _build_session(pool_size: int = 10) -> requests.Session:
     retry_strategy = Retry(
         total=4,
         connect=4,
@@ -48,7 +60,11 @@ def _build_session() -> requests.Session:
         allowed_methods=frozenset({"GET", "POST"}),
         raise_on_status=False,
     )
-    adapter = HTTPAdapter(max_retries=retry_strategy)
+    adapter = HTTPAdapter(
+        max_retries=retry_strategy,
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+    )
     session = requests.Session()
     session.mount("http://", adapter)
     session.mount("https://", adapter)
@@ -99,28 +115,182 @@ def _discover_local_exports(source_dir: Path, pattern: str) -> list[Path]:
     return sorted(path for path in source_dir.glob(pattern) if path.is_file())
 
 
-def _discover_raw_datasets() -> list[str]:
-    from bronze_loader.loader import find_latest_key_for_dataset
+def _upload_export(
+    session: requests.Session,
+    upload_url: str,
+    csv_path: Path,
+    timer=None,
+) -> tuple[str, dict]:
+    dataset = _infer_dataset(csv_path)
+    LOGGER.info("Uploading %s for dataset=%s", csv_path.name, dataset)
+
+    started = time.perf_counter()
+    with csv_path.open("rb") as handle:
+        response = session.post(
+            upload_url,
+            files={"file": (csv_path.name, handle, "text/csv")},
+            timeout=(10, 120),
+        )
+
+    if not response.ok:
+        raise AirflowFailException(
+            f"Upload failed for {csv_path.name} with status={response.status_code} body={response.text}"
+        )
+
+    payload = response.json()
+    if timer is not None:
+        timer.record("upload", time.perf_counter() - started, subject=dataset, bytes=csv_path.stat().st_size)
+    LOGGER.info(
+        "Uploaded dataset=%s status=%s object_key=%s ingestion_id=%s",
+        dataset,
+        payload.get("status"),
+        payload.get("object_key"),
+        payload.get("ingestion_id"),
+    )
+    return dataset, payload
 
-    available_datasets: list[str] = []
-    for dataset in SUPPORTED_DATASETS:
-        try:
-            object_key = find_latest_key_for_dataset(dataset=dataset, prefix=RAW_PREFIX)
-            LOGGER.info(
-                "Found existing raw object for dataset=%s object_key=%s",
-                dataset,
-                object_key,
-            )
-            available_datasets.append(dataset)
-        except FileNotFoundError:
-            continue
 
-    if not available_datasets:
+def _discover_raw_datasets() -> list[str]:
+    from bronze_loader.loader import find_latest_keys_for_datasets
+
+    latest_keys = find_latest_keys_for_datasets(SUPPORTED_DATASETS, prefix=RAW_PREFIX)
+    for dataset, object_key in latest_keys.items():
+        LOGGER.info(
+            "Found existing raw object for dataset=%s object_key=%s",
+            dataset,
+            object_key,
+        )
+
+    if not latest_keys:
         raise AirflowFailException(
             "No CSV exports were found in the mounted ingestion directory and no matching raw objects were found in MinIO."
         )
 
-    return available_datasets
+    return sorted(latest_keys)
+
+
+def _dbt_selection(changed_datasets: list[str]) -> list[str]:
+    """
+    dbt --select arguments for the silver models fed by the changed bronze
+    tables and the gold models downstream of them (graph operator
+    intersected with the gold folder).
+    """
+    silver_models = [f"silver_{dataset}" for dataset in sorted(changed_datasets)]
+    return silver_models + [f"{model}+,gold" for model in silver_models]
+
+
+def _persist_stage_metrics(metrics) -> None:
+    """Best effort, like the loader: timings go to public.pipeline_stage_metrics when the metadata DB is configured."""
+    from bronze_loader.instrumentation import persist_stage_metrics
+    from bronze_loader.loader import metadata_engine
+
+    if not metrics:
+        return
+    try:
+        engine = metadata_engine()
+    except RuntimeError as exc:
+        LOGGER.info("Not persisting %s stage metrics: %s", len(metrics), exc)
+        return
+    try:
+        persist_stage_metrics(engine, metrics)
+    finally:
+        engine.dispose()
+
+
+def _load_queue_poke_seconds() -> int:
+    return max(5, int(os.getenv("LETTERBOXD_LOAD_QUEUE_POKE_SECONDS", "30")))
+
+
+def _dbt_threads() -> int:
+    return max(1, int(os.getenv("DBT_THREADS", "4")))
+
+
+def _dbt_run_args(select: list[str]) -> list[str]:
+    args = [
+        "run",
+        "--project-dir",
+        DBT_PROJECT_DIR,
+        "--profiles-dir",
+        os.getenv("DBT_PROFILES_DIR", f"{DBT_PROJECT_DIR}/profiles"),
+        "--log-path",
+        DBT_LOG_PATH,
+        "--target-path",
+        DBT_TARGET_PATH,
+        "--target",
+        os.environ["DBT_TARGET"],
+        "--threads",
+        str(_dbt_threads()),
+        "--partial-parse",
+        "--select",
+        *select,
+    ]
+    if (DBT_STATE_PATH / "manifest.json").exists():
+        # Unselected parents that do not exist in the target resolve to the last good build.
+        args += ["--defer", "--state", str(DBT_STATE_PATH)]
+    return args
+
+
+def _save_dbt_state() -> None:
+    DBT_STATE_PATH.mkdir(parents=True, exist_ok=True)
+    staged = DBT_STATE_PATH / "manifest.json.tmp"
+    shutil.copyfile(Path(DBT_TARGET_PATH) / "manifest.json", staged)
+    os.replace(staged, DBT_STATE_PATH / "manifest.json")
+
+
+@task
+def plan_dbt_selection(changed_datasets: list[str]) -> list[str]:
+    if not changed_datasets:
+        raise AirflowSkipException("No bronze dataset changed; skipping dbt.")
+
+    selection = _dbt_selection(changed_datasets)
+    LOGGER.info("dbt selection for changed datasets %s: %s", changed_datasets, selection)
+    return selection
+
+
+@task(
+    execution_timeout=pendulum.duration(minutes=30),
+    retries=2,
+    retry_delay=pendulum.duration(minutes=10),
+    # One slot: the nightly and queue-driven DAGs never run dbt at the same time.
+    pool=DBT_POOL,
+)
+def run_dbt_models(select: list[str], run_id: str | None = None) -> None:
+    """Build the selected silver and gold models in a single in-process dbt invocation."""
+    from bronze_loader.instrumentation import StageTimer
+    from dbt.cli.main import dbtRunner
+
+    Path(DBT_TARGET_PATH).mkdir(parents=True, exist_ok=True)
+    args = _dbt_run_args(select)
+    LOGGER.info("Invoking dbt %s", " ".join(args))
+
+    started = time.monotonic()
+    result = dbtRunner().invoke(args)
+    elapsed = time.monotonic() - started
+
+    if result.exception is not None:
+        raise result.exception
+
+    timer = StageTimer(COMPONENT, run_id=run_id)
+    for node_result in result.result or []:
+        LOGGER.info(
+            "dbt %s %s in %.2fs",
+            node_result.node.name,
+            node_result.status,
+            node_result.execution_time,
+        )
+        timer.record(
+            "dbt_model",
+            node_result.execution_time,
+            subject=node_result.node.name,
+            rows=(node_result.adapter_response or {}).get("rows_affected"),
+        )
+    timer.record("dbt_invocation", elapsed, subject="dbt")
+    _persist_stage_metrics(timer.metrics)
+    if not result.success:
+        raise RuntimeError(f"dbt run failed for selection {select} after {elapsed:.1f}s")
+
+    _save_dbt_state()
+    LOGGER.info("dbt run completed in %.1fs", elapsed)
 
 
 default_args = {
@@ -132,7 +302,7 @@ default_args = {
 
 @dag(
     dag_id="letterboxd_pipeline",
-    description="Upload Letterboxd exports, refresh bronze tables, and build silver/gold marts.",
+    description="Upload Letterboxd exports for the load queue, or refresh bronze and the marts from MinIO when there are none.",
     schedule=os.getenv("LETTERBOXD_PIPELINE_SCHEDULE", "0 2 * * *"),
     start_date=pendulum.datetime(2026, 1, 1, tz="UTC"),
     catchup=False,
@@ -143,10 +313,19 @@ default_args = {
 )
 def letterboxd_pipeline():
     @task(retries=2, retry_delay=pendulum.duration(minutes=5))
-    def upload_exports() -> list[str]:
+    def upload_exports(run_id: str | None = None) -> list[str]:
+        """
+        Upload the local exports. The API queues a bronze load for every new one
+        and letterboxd_load_queue runs it, so uploaded datasets are not loaded
+        here. Returns the datasets to load straight from MinIO, which is only
+        the fallback when there is nothing to upload.
+        """
+        from bronze_loader.instrumentation import StageTimer
+
         source_dir = _source_dir()
         pattern = _file_glob()
-        session = _build_session()
+        workers = _upload_workers()
+        session = _build_session(pool_size=workers)
 
         _wait_for_api(session=session)
 
@@ -159,88 +338,166 @@ def letterboxd_pipeline():
             return _discover_raw_datasets()
 
         datasets: set[str] = set()
+        unchanged: set[str] = set()
+        failures: dict[str, str] = {}
         upload_url = f"{_api_base_url()}/ingest/letterboxd/upload"
+        timer = StageTimer(COMPONENT, run_id=run_id)
+
+        # Uploads run concurrently so stage wall time tracks the slowest file.
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="upload") as executor:
+            futures = {
+                executor.submit(_upload_export, session, upload_url, csv_path, timer): csv_path
+                for csv_path in local_exports
+            }
+            for future in as_completed(futures):
+                csv_path = futures[future]
+                try:
+                    dataset, payload = future.result()
+                except (AirflowFailException, requests.RequestException) as exc:
+                    LOGGER.error("Upload failed for %s: %s", csv_path.name, exc)
+                    failures[csv_path.name] = str(exc)
+                    continue
+                if payload.get("status") == "duplicate":
+                    unchanged.add(dataset)
+                else:
+                    datasets.add(dataset)
+
+        _persist_stage_metrics(timer.metrics)
+        if failures:
+            raise AirflowFailException(
+                f"{len(failures)} of {len(local_exports)} uploads failed: "
+                + "; ".join(f"{name}: {error}" for name, error in sorted(failures.items()))
+            )
 
-        for csv_path in local_exports:
-            dataset = _infer_dataset(csv_path)
-            LOGGER.info("Uploading %s for dataset=%s", csv_path.name, dataset)
+        # An identical export is already in MinIO (and so already in bronze); skip its load.
+        unchanged -= datasets
+        if unchanged:
+            LOGGER.info("Datasets unchanged since their last upload: %s", sorted(unchanged))
 
-            with csv_path.open("rb") as handle:
-                response = session.post(
-                    upload_url,
-                    files={"file": (csv_path.name, handle, "text/csv")},
-                    timeout=(10, 120),
-                )
+        LOGGER.info("Uploaded datasets for this run, queued for letterboxd_load_queue: %s", sorted(datasets))
+        return []
 
-            if not response.ok:
-                raise AirflowFailException(
-                    f"Upload failed for {csv_path.name} with status={response.status_code} body={response.text}"
-                )
+    @task(retries=0)
+    def load_bronze_datasets(datasets: list[str]) -> list[str]:
+        """Returns only the datasets whose bronze table actually changed."""
+        from bronze_loader.loader import load_all_latest_to_bronze
 
-            payload = response.json()
+        if not datasets:
+            LOGGER.info("Nothing to load from MinIO directly; uploads are loaded by letterboxd_load_queue.")
+            return []
+
+        LOGGER.info("Loading latest raw objects into bronze for datasets=%s", datasets)
+        results = load_all_latest_to_bronze(datasets, prefix=RAW_PREFIX)
+        for dataset, result in results.items():
             LOGGER.info(
-                "Uploaded dataset=%s object_key=%s ingestion_id=%s",
+                "Bronze load %s for dataset=%s object_key=%s rows=%s",
+                "skipped" if result.skipped else "complete",
                 dataset,
-                payload.get("object_key"),
-                payload.get("ingestion_id"),
+                result.object_key,
+                result.rows_loaded,
             )
-            datasets.add(dataset)
+        return sorted(dataset for dataset, result in results.items() if not result.skipped)
 
-        ordered_datasets = sorted(datasets)
-        LOGGER.info("Uploaded datasets for this run: %s", ordered_datasets)
-        return ordered_datasets
+    uploaded_datasets = upload_exports()
+    changed_datasets = load_bronze_datasets(uploaded_datasets)
+    dbt_selection = plan_dbt_selection(changed_datasets)
 
-    @task(retries=0)
-    def load_bronze_dataset(dataset: str) -> str:
-        from bronze_loader.loader import load_latest_to_bronze
+    bronze_load_complete = EmptyOperator(task_id="bronze_load_complete")
 
-        LOGGER.info("Loading latest raw object into bronze.%s", dataset)
-        object_key = load_latest_to_bronze(target_table=dataset)
-        LOGGER.info("Bronze load complete for dataset=%s object_key=%s", dataset, object_key)
-        return object_key
+    dbt_run_models = run_dbt_models(dbt_selection)
 
-    uploaded_datasets = upload_exports()
-    bronze_loads = load_bronze_dataset.expand(dataset=uploaded_datasets)
+    changed_datasets >> bronze_load_complete >> dbt_selection >> dbt_run_models
 
-    bronze_load_complete = EmptyOperator(task_id="bronze_load_complete")
 
-    dbt_run_silver = BashOperator(
-        task_id="dbt_run_silver",
-        bash_command=(
-            "set -euo pipefail && "
-            f"mkdir -p {DBT_LOG_PATH} {DBT_TARGET_PATH} && "
-            "cd /opt/airflow/project/dbt && "
-            "dbt run --project-dir /opt/airflow/project/dbt "
-            "--profiles-dir /opt/airflow/project/dbt/profiles "
-            f"--log-path {DBT_LOG_PATH} "
-            f"--target-path {DBT_TARGET_PATH} "
-            "--select silver --target \"$DBT_TARGET\""
-        ),
-        execution_timeout=pendulum.duration(minutes=30),
-        retries=2,
-        retry_delay=pendulum.duration(minutes=10),
-        append_env=True,
-    )
+letterboxd_pipeline()
+
 
-    dbt_run_gold = BashOperator(
-        task_id="dbt_run_gold",
-        bash_command=(
-            "set -euo pipefail && "
-            f"mkdir -p {DBT_LOG_PATH} {DBT_TARGET_PATH} && "
-            "cd /opt/airflow/project/dbt && "
-            "dbt run --project-dir /opt/airflow/project/dbt "
-            "--profiles-dir /opt/airflow/project/dbt/profiles "
-            f"--log-path {DBT_LOG_PATH} "
-            f"--target-path {DBT_TARGET_PATH} "
-            "--select gold --target \"$DBT_TARGET\""
-        ),
-        execution_timeout=pendulum.duration(minutes=30),
-        retries=2,
-        retry_delay=pendulum.duration(minutes=10),
-        append_env=True,
+@dag(
+    dag_id="letterboxd_load_queue",
+    description="Load each export into bronze as soon as the API queues it, then refresh the models it feeds.",
+    schedule="@continuous",
+    start_date=pendulum.datetime(2026, 1, 1, tz="UTC"),
+    catchup=False,
+    max_active_runs=1,
+    default_args=default_args,
+    tags=["letterboxd", "elt", "dbt"],
+)
+def letterboxd_load_queue():
+    @task.sensor(
+        poke_interval=_load_queue_poke_seconds(),
+        timeout=60 * 60,
+        mode="reschedule",
+        soft_fail=True,
+        retries=0,
     )
+    def wait_for_load_jobs() -> PokeReturnValue:
+        """Claims queued jobs as soon as there are any; a quiet hour ends the run as skipped."""
+        from bronze_loader.jobs import claim_load_jobs
+        from bronze_loader.loader import metadata_engine
+
+        engine = metadata_engine()
+        try:
+            jobs = claim_load_jobs(engine)
+        finally:
+            engine.dispose()
+
+        if jobs:
+            LOGGER.info("Claimed bronze load jobs: %s", [(job.dataset, job.object_key) for job in jobs])
+        return PokeReturnValue(is_done=bool(jobs), xcom_value=[job.as_dict() for job in jobs])
+
+    @task(retries=0, multiple_outputs=True)
+    def load_claimed_jobs(jobs: list[dict]) -> dict:
+        """Loads exactly the claimed objects; failed jobs go back on the queue until their attempts run out."""
+        from bronze_loader.jobs import complete_load_jobs, fail_load_jobs
+        from bronze_loader.loader import RAW_BUCKET, load_objects_to_bronze, metadata_engine
+
+        jobs_by_dataset = {job["dataset"]: job for job in jobs}
+        failed: dict[str, str] = {
+            job["dataset"]: f"bucket {job['bucket']} is not the loader's raw bucket {RAW_BUCKET}"
+            for job in jobs
+            if job["bucket"] != RAW_BUCKET
+        }
+        object_keys = {
+            dataset: job["object_key"] for dataset, job in jobs_by_dataset.items() if dataset not in failed
+        }
+
+        results, failures = load_objects_to_bronze(object_keys)
+        failed.update({dataset: str(exc) for dataset, exc in failures.items()})
+
+        engine = metadata_engine()
+        try:
+            complete_load_jobs(engine, [jobs_by_dataset[dataset]["job_id"] for dataset in results])
+            for dataset, error in failed.items():
+                fail_load_jobs(engine, [jobs_by_dataset[dataset]["job_id"]], error)
+        finally:
+            engine.dispose()
 
-    bronze_loads >> bronze_load_complete >> dbt_run_silver >> dbt_run_gold
+        for dataset, result in results.items():
+            LOGGER.info(
+                "Bronze load %s for dataset=%s object_key=%s rows=%s",
+                "skipped" if result.skipped else "complete",
+                dataset,
+                result.object_key,
+                result.rows_loaded,
+            )
+        return {
+            "changed": sorted(dataset for dataset, result in results.items() if not result.skipped),
+            "failed": failed,
+        }
+
+    @task(trigger_rule="all_done", retries=0)
+    def report_failed_jobs(failed: dict[str, str] | None) -> None:
+        # Runs after dbt so one bad export does not hold back the others' dashboards.
+        if failed:
+            raise AirflowFailException(
+                "Bronze load failed for "
+                + "; ".join(f"{dataset}: {error}" for dataset, error in sorted(failed.items()))
+            )
 
+    claimed_jobs = wait_for_load_jobs()
+    loaded = load_claimed_jobs(claimed_jobs)
+    dbt_run_models = run_dbt_models(plan_dbt_selection(loaded["changed"]))
+    dbt_run_models >> report_failed_jobs(loaded["failed"])
 
-letterboxd_pipeline()
+
+letterboxd_load_queue()
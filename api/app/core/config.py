@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from functools import lru_cache
+from typing import Optional
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -15,6 +16,38 @@ class Settings(BaseSettings):
     postgres_meta_password: str = Field(alias="POSTGRES_META_PASSWORD")
     postgres_meta_db: str = Field(alias="POSTGRES_META_DB")
 
+    # The API never writes to the warehouse; it is only probed for /health/ready.
+    postgres_warehouse_host: str = Field(default="postgres-warehouse", alias="POSTGRES_WAREHOUSE_HOST")
+    postgres_warehouse_port: int = Field(default=5432, alias="POSTGRES_WAREHOUSE_PORT")
+    postgres_warehouse_user: Optional[str] = Field(default=None, alias="POSTGRES_WAREHOUSE_USER")
+    postgres_warehouse_password: Optional[str] = Field(default=None, alias="POSTGRES_WAREHOUSE_PASSWORD")
+    postgres_warehouse_db: Optional[str] = Field(default=None, alias="POSTGRES_WAREHOUSE_DB")
+
+    io_thread_pool_size: int = Field(default=16, alias="IO_THREAD_POOL_SIZE", ge=1)
+
+    upload_chunk_size_bytes: int = Field(default=1024 * 1024, alias="UPLOAD_CHUNK_SIZE_BYTES")
+    # S3 requires every multipart part except the last to be at least 5 MiB.
+    multipart_part_size_bytes: int = Field(
+        default=8 * 1024 * 1024,
+        alias="MULTIPART_PART_SIZE_BYTES",
+        ge=5 * 1024 * 1024,
+    )
+    # Resumable upload sessions still open after this long are aborted in MinIO and marked expired.
+    upload_session_expiry_hours: float = Field(default=24, alias="UPLOAD_SESSION_EXPIRY_HOURS", gt=0)
+    upload_session_sweep_interval_seconds: float = Field(
+        default=15 * 60,
+        alias="UPLOAD_SESSION_SWEEP_INTERVAL_SECONDS",
+        gt=0,
+    )
+
+    # How far back /metrics looks for the last persisted observation of each stage.
+    metrics_lookback_hours: int = Field(default=168, alias="METRICS_LOOKBACK_HOURS", ge=1)
+
+    # Dependency probes run in the background; /health/ready only reads their cached results.
+    health_check_interval_seconds: float = Field(default=10, alias="HEALTH_CHECK_INTERVAL_SECONDS", gt=0)
+    health_check_timeout_seconds: float = Field(default=2, alias="HEALTH_CHECK_TIMEOUT_SECONDS", gt=0)
+    health_cache_ttl_seconds: float = Field(default=30, alias="HEALTH_CACHE_TTL_SECONDS", gt=0)
+
     @property
     def metadata_database_url(self) -> str:
         return (
@@ -23,6 +56,16 @@ class Settings(BaseSettings):
             f"@{self.postgres_meta_host}:{self.postgres_meta_port}/{self.postgres_meta_db}"
         )
 
+    @property
+    def warehouse_database_url(self) -> Optional[str]:
+        if not (self.postgres_warehouse_user and self.postgres_warehouse_db):
+            return None
+        return (
+            "postgresql+psycopg2://"
+            f"{self.postgres_warehouse_user}:{self.postgres_warehouse_password or ''}"
+            f"@{self.postgres_warehouse_host}:{self.postgres_warehouse_port}/{self.postgres_warehouse_db}"
+        )
+
 
 @lru_cache
 def get_settings() -> Settings:
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional
+from uuid import UUID
+
+from prometheus_client import Counter, Gauge, Histogram
+
+COMPONENT = "api"
+
+STAGE_DURATION_SECONDS = Histogram(
+    "letterboxd_stage_duration_seconds",
+    "Duration of one pipeline stage handled by this API process.",
+    ["component", "stage"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120),
+)
+STAGE_ROWS = Counter(
+    "letterboxd_stage_rows_total",
+    "Rows processed by pipeline stages in this API process.",
+    ["component", "stage"],
+)
+STAGE_BYTES = Counter(
+    "letterboxd_stage_bytes_total",
+    "Bytes processed by pipeline stages in this API process.",
+    ["component", "stage"],
+)
+
+DEPENDENCY_PROBE_SECONDS = Histogram(
+    "letterboxd_dependency_probe_seconds",
+    "Latency of background readiness probes against API dependencies.",
+    ["dependency"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5),
+)
+DEPENDENCY_UP = Gauge(
+    "letterboxd_dependency_up",
+    "Whether the last background probe of an API dependency succeeded.",
+    ["dependency"],
+)
+
+
+@dataclass
+class StageMetric:
+    component: str
+    stage: str
+    duration_seconds: float
+    subject: Optional[str] = None
+    object_key: Optional[str] = None
+    rows: Optional[int] = None
+    bytes: Optional[int] = None
+
+    def as_row(self, *, ingestion_id: Optional[UUID] = None, run_id: Optional[str] = None) -> Dict[str, object]:
+        return {
+            "component": self.component,
+            "stage": self.stage,
+            "subject": self.subject,
+            "run_id": run_id,
+            "ingestion_id": ingestion_id,
+            "object_key": self.object_key,
+            "duration_ms": self.duration_seconds * 1000,
+            "rows_processed": self.rows,
+            "bytes_processed": self.bytes,
+        }
+
+
+class StageTimer:
+    """
+    Times the stages of one unit of work (an upload, a load). Each stage is
+    observed in Prometheus as it finishes and kept for persisting afterwards.
+    """
+
+    def __init__(self, component: str = COMPONENT, *, subject: Optional[str] = None) -> None:
+        self.component = component
+        self.subject = subject
+        self.metrics: List[StageMetric] = []
+
+    @contextmanager
+    def stage(self, name: str, *, object_key: Optional[str] = None) -> Iterator[StageMetric]:
+        """Yields the metric so the caller can fill in rows/bytes; failed stages are not recorded."""
+        metric = StageMetric(
+            component=self.component,
+            stage=name,
+            duration_seconds=0.0,
+            subject=self.subject,
+            object_key=object_key,
+        )
+        started = time.perf_counter()
+        yield metric
+        metric.duration_seconds = time.perf_counter() - started
+        self.metrics.append(metric)
+
+        STAGE_DURATION_SECONDS.labels(self.component, name).observe(metric.duration_seconds)
+        if metric.rows is not None:
+            STAGE_ROWS.labels(self.component, name).inc(metric.rows)
+        if metric.bytes is not None:
+            STAGE_BYTES.labels(self.component, name).inc(metric.bytes)
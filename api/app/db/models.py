@@ -3,7 +3,18 @@ from __future__ import annotations
 from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import BigInteger, DateTime, Index, String, Text, UniqueConstraint, func
+from sqlalchemy import (
+    BigInteger,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    func,
+    text,
+)
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
@@ -15,18 +26,46 @@ class Base(DeclarativeBase):
 class IngestionRun(Base):
     __tablename__ = "ingestion_runs"
     __table_args__ = (
-        UniqueConstraint("bucket", "object_key", name="ingestion_runs_bucket_object_key_key"),
-        Index("idx_ingestion_runs_created_at", "created_at"),
-        Index("idx_ingestion_runs_status", "status"),
+        Index(
+            "idx_ingestion_runs_uploaded_dataset_sha256",
+            "bucket",
+            "dataset",
+            "sha256",
+            unique=True,
+            postgresql_where=text("status = 'uploaded' AND sha256 IS NOT NULL"),
+        ),
+        # An older run superseded by a re-upload of its content shares its object.
+        Index(
+            "idx_ingestion_runs_uploaded_object_key",
+            "bucket",
+            "object_key",
+            unique=True,
+            postgresql_where=text("status = 'uploaded'"),
+        ),
+        Index("idx_ingestion_runs_created_at_id", text("created_at DESC"), text("ingestion_id DESC")),
+        Index(
+            "idx_ingestion_runs_status_created_at_id",
+            "status",
+            text("created_at DESC"),
+            text("ingestion_id DESC"),
+        ),
+        Index(
+            "idx_ingestion_runs_source_created_at_id",
+            "source",
+            text("created_at DESC"),
+            text("ingestion_id DESC"),
+        ),
         {"schema": "public"},
     )
 
     ingestion_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), primary_key=True)
     source: Mapped[str] = mapped_column(Text, nullable=False)
+    dataset: Mapped[str | None] = mapped_column(Text, nullable=True)
     original_filename: Mapped[str] = mapped_column(Text, nullable=False)
     bucket: Mapped[str] = mapped_column(Text, nullable=False)
     object_key: Mapped[str] = mapped_column(Text, nullable=False)
     size_bytes: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    sha256: Mapped[str | None] = mapped_column(Text, nullable=True)
     content_type: Mapped[str | None] = mapped_column(Text, nullable=True)
     status: Mapped[str] = mapped_column(String(50), nullable=False)
     created_at: Mapped[datetime] = mapped_column(
@@ -39,3 +78,124 @@ class IngestionRun(Base):
         nullable=False,
         server_default=func.now(),
     )
+
+
+# Declared after the class so the DESC ordering can use the mapped column,
+# matching metadata.sql's (dataset, created_at DESC).
+Index(
+    "idx_ingestion_runs_dataset_created_at",
+    IngestionRun.dataset,
+    IngestionRun.created_at.desc(),
+)
+
+
+class PipelineStageMetric(Base):
+    __tablename__ = "pipeline_stage_metrics"
+    __table_args__ = (
+        Index(
+            "idx_pipeline_stage_metrics_stage_recorded_at",
+            "component",
+            "stage",
+            "subject",
+            "recorded_at",
+        ),
+        Index("idx_pipeline_stage_metrics_ingestion_id", "ingestion_id"),
+        {"schema": "public"},
+    )
+
+    metric_id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    component: Mapped[str] = mapped_column(Text, nullable=False)
+    stage: Mapped[str] = mapped_column(Text, nullable=False)
+    subject: Mapped[str | None] = mapped_column(Text, nullable=True)
+    run_id: Mapped[str | None] = mapped_column(Text, nullable=True)
+    ingestion_id: Mapped[UUID | None] = mapped_column(PG_UUID(as_uuid=True), nullable=True)
+    object_key: Mapped[str | None] = mapped_column(Text, nullable=True)
+    duration_ms: Mapped[float] = mapped_column(Float, nullable=False)
+    rows_processed: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    bytes_processed: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    recorded_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+
+
+class BronzeLoadJob(Base):
+    __tablename__ = "bronze_load_jobs"
+    __table_args__ = (
+        Index(
+            "idx_bronze_load_jobs_queued",
+            "enqueued_at",
+            postgresql_where=text("status = 'queued'"),
+        ),
+        Index(
+            "idx_bronze_load_jobs_running",
+            "started_at",
+            postgresql_where=text("status = 'running'"),
+        ),
+        {"schema": "public"},
+    )
+
+    job_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), primary_key=True)
+    ingestion_id: Mapped[UUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("public.ingestion_runs.ingestion_id"),
+        nullable=False,
+        unique=True,
+    )
+    dataset: Mapped[str] = mapped_column(Text, nullable=False)
+    bucket: Mapped[str] = mapped_column(Text, nullable=False)
+    object_key: Mapped[str] = mapped_column(Text, nullable=False)
+    status: Mapped[str] = mapped_column(Text, nullable=False, server_default="queued")
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    enqueued_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+    started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+
+class UploadSession(Base):
+    __tablename__ = "upload_sessions"
+    __table_args__ = (
+        Index(
+            "idx_upload_sessions_open_sha256",
+            "bucket",
+            "sha256",
+            "size_bytes",
+            postgresql_where=text("status = 'open'"),
+        ),
+        Index(
+            "idx_upload_sessions_open_created_at",
+            "created_at",
+            postgresql_where=text("status = 'open'"),
+        ),
+        {"schema": "public"},
+    )
+
+    upload_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), primary_key=True)
+    # Reserved up front so completing the session twice writes one ingestion run.
+    ingestion_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), nullable=False, unique=True)
+    s3_upload_id: Mapped[str] = mapped_column(Text, nullable=False)
+    bucket: Mapped[str] = mapped_column(Text, nullable=False)
+    object_key: Mapped[str] = mapped_column(Text, nullable=False)
+    original_filename: Mapped[str] = mapped_column(Text, nullable=False)
+    content_type: Mapped[str | None] = mapped_column(Text, nullable=True)
+    dataset: Mapped[str | None] = mapped_column(Text, nullable=True)
+    size_bytes: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    sha256: Mapped[str] = mapped_column(Text, nullable=False)
+    part_size_bytes: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    status: Mapped[str] = mapped_column(Text, nullable=False, server_default="open")
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
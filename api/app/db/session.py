@@ -10,7 +10,12 @@ from app.core.config import get_settings
 
 settings = get_settings()
 
-engine = create_engine(settings.metadata_database_url, pool_pre_ping=True)
+# One connection per I/O worker so metadata writes are not serialized on the pool.
+engine = create_engine(
+    settings.metadata_database_url,
+    pool_pre_ping=True,
+    pool_size=settings.io_thread_pool_size,
+)
 SessionLocal = sessionmaker(
     bind=engine,
     autocommit=False,
@@ -1,59 +1,52 @@
 # app/main.py
 from __future__ import annotations
 
+import asyncio
 import os
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Optional
 
-from botocore.exceptions import BotoCoreError, ClientError
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse
 from fastapi.responses import JSONResponse
+from fastapi.responses import Response
+from prometheus_client import CONTENT_TYPE_LATEST
 from fastapi.staticfiles import StaticFiles
-from sqlalchemy import text
 
-from app.db.session import engine
+from app.core.config import get_settings
+from app.core.executor import get_io_executor, run_blocking, shutdown_io_executor
 from app.routes.ingest import router as ingest_router
-from app.services.minio_client import s3_client
-
-
-def must(name: str) -> str:
-    value = os.getenv(name)
-    if value is None or value.strip() == "":
-        raise RuntimeError(f"Missing required environment variable: {name}")
-    return value
+from app.services.dependency_health import build_dependency_health
+from app.services.pipeline_metrics import render_metrics
+from app.services.resumable_uploads import sweep_stale_upload_sessions
 
 
 def now_utc_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
-def check_minio_ready() -> Dict[str, str]:
-    try:
-        bucket = must("MINIO_BUCKET_RAW")
-        s3_client().head_bucket(Bucket=bucket)
-    except (BotoCoreError, ClientError, RuntimeError) as exc:
-        return {"status": "error", "detail": str(exc)}
-    return {"status": "ok", "detail": f"bucket '{bucket}' reachable"}
-
-
-def check_postgres_meta_ready() -> Dict[str, str]:
-    try:
-        with engine.connect() as connection:
-            connection.execute(text("SELECT 1"))
-    except Exception as exc:
-        return {"status": "error", "detail": str(exc)}
-    return {"status": "ok", "detail": "metadata database reachable"}
-
-
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Startup/shutdown hook."""
     app.state.started_at = now_utc_iso()
+    get_io_executor()
+    app.state.dependency_health = build_dependency_health()
+    app.state.dependency_health.start()
+    upload_sweep = asyncio.get_running_loop().create_task(
+        sweep_stale_upload_sessions(get_settings().upload_session_sweep_interval_seconds),
+        name="upload-session-sweep",
+    )
     yield
+    upload_sweep.cancel()
+    try:
+        await upload_sweep
+    except asyncio.CancelledError:
+        pass
+    await app.state.dependency_health.stop()
+    shutdown_io_executor()
 
 
 app = FastAPI(
@@ -95,12 +88,12 @@ def health() -> Dict[str, Any]:
 
 
 @app.get("/health/ready", tags=["health"], response_model=None)
-def readiness():
-    dependencies = {
-        "minio": check_minio_ready(),
-        "postgres_meta": check_postgres_meta_ready(),
-    }
-    ready = all(dependency["status"] == "ok" for dependency in dependencies.values())
+async def readiness():
+    """
+    Readiness from the cached background probes; never touches a dependency.
+    Probes that have not run yet, failed, or are older than HEALTH_CACHE_TTL_SECONDS make it 503.
+    """
+    ready, dependencies = app.state.dependency_health.snapshot()
     payload = {
         "status": "ok" if ready else "not_ready",
         "dependencies": dependencies,
@@ -111,6 +104,13 @@ def readiness():
     return payload
 
 
+@app.get("/metrics", tags=["health"], include_in_schema=False)
+async def metrics() -> Response:
+    """Prometheus scrape endpoint; reading the persisted metrics hits the metadata database."""
+    body = await run_blocking(render_metrics)
+    return Response(content=body, media_type=CONTENT_TYPE_LATEST)
+
+
 @app.get("/debug/env", tags=["debug"])
 def debug_env() -> Dict[str, Optional[str]]:
     """
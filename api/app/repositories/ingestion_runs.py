@@ -1,8 +1,12 @@
 from __future__ import annotations
 
-from typing import Optional
+import base64
+import binascii
+from datetime import datetime
+from typing import List, Mapping, Optional, Sequence, Tuple
 from uuid import UUID
 
+from sqlalchemy import Row, func, select, tuple_, update
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 
@@ -14,28 +18,191 @@ def upsert_ingestion_run(
     *,
     ingestion_id: UUID,
     source: str,
+    dataset: Optional[str],
     original_filename: str,
     bucket: str,
     object_key: str,
     size_bytes: int,
+    sha256: Optional[str],
     content_type: Optional[str],
     status: str = "uploaded",
 ) -> UUID:
+    if status == "uploaded" and sha256:
+        supersede_older_uploads(session, bucket=bucket, dataset=dataset, sha256=sha256)
     stmt = (
         insert(IngestionRun)
         .values(
             ingestion_id=ingestion_id,
             source=source,
+            dataset=dataset,
             original_filename=original_filename,
             bucket=bucket,
             object_key=object_key,
             size_bytes=size_bytes,
+            sha256=sha256,
             content_type=content_type,
             status=status,
         )
-        .on_conflict_do_nothing(index_elements=[IngestionRun.ingestion_id])
+        .on_conflict_do_nothing()
         .returning(IngestionRun.ingestion_id)
     )
 
-    inserted_id = session.execute(stmt).scalar_one_or_none()
-    return inserted_id or ingestion_id
+    if session.execute(stmt).scalar_one_or_none() is not None:
+        return ingestion_id
+    if session.get(IngestionRun, ingestion_id) is not None:
+        return ingestion_id
+    # Identical content was recorded first by a concurrent upload (idx_ingestion_runs_uploaded_dataset_sha256).
+    existing = find_uploaded_run_by_sha256(session, bucket=bucket, dataset=dataset, sha256=sha256) if sha256 else None
+    if existing is None:
+        raise ValueError(f"Ingestion run for s3://{bucket}/{object_key} conflicts with an existing run")
+    return existing.ingestion_id
+
+
+def insert_ingestion_runs(session: Session, runs: Sequence[Mapping[str, object]]) -> List[UUID]:
+    """
+    Insert several runs with a single multi-row INSERT and return the ids that
+    were inserted; a run whose content is the newest upload of its dataset is
+    skipped.
+    """
+    if not runs:
+        return []
+
+    for run in runs:
+        if run.get("status") == "uploaded" and run.get("sha256"):
+            supersede_older_uploads(session, bucket=run["bucket"], dataset=run.get("dataset"), sha256=run["sha256"])
+
+    stmt = (
+        insert(IngestionRun)
+        .values(list(runs))
+        .on_conflict_do_nothing()
+        .returning(IngestionRun.ingestion_id)
+    )
+    return list(session.execute(stmt).scalars())
+
+
+def _same_dataset(dataset: Optional[str]):
+    return IngestionRun.dataset.is_(None) if dataset is None else IngestionRun.dataset == dataset
+
+
+def find_latest_uploaded_run(session: Session, *, bucket: str, dataset: Optional[str]) -> Optional[IngestionRun]:
+    """Newest successful upload of the dataset (idx_ingestion_runs_dataset_created_at)."""
+    stmt = (
+        select(IngestionRun)
+        .where(IngestionRun.bucket == bucket, _same_dataset(dataset), IngestionRun.status == "uploaded")
+        .order_by(IngestionRun.created_at.desc())
+        .limit(1)
+    )
+    return session.execute(stmt).scalar_one_or_none()
+
+
+def find_uploaded_run_by_sha256(
+    session: Session,
+    *,
+    bucket: str,
+    dataset: Optional[str],
+    sha256: str,
+) -> Optional[IngestionRun]:
+    """Successful upload of identical content for the dataset (idx_ingestion_runs_uploaded_dataset_sha256)."""
+    stmt = (
+        select(IngestionRun)
+        .where(
+            IngestionRun.bucket == bucket,
+            _same_dataset(dataset),
+            IngestionRun.sha256 == sha256,
+            IngestionRun.status == "uploaded",
+        )
+        .order_by(IngestionRun.created_at.desc())
+        .limit(1)
+    )
+    return session.execute(stmt).scalar_one_or_none()
+
+
+def supersede_older_uploads(session: Session, *, bucket: str, dataset: Optional[str], sha256: str) -> None:
+    """
+    Retire an uploaded run that holds this content unless it is the dataset's
+    newest, so an export that went A -> B -> A can record A again. The newest
+    run is left alone: recording its content again conflicts and is a duplicate.
+    """
+    latest = (
+        select(IngestionRun.ingestion_id)
+        .where(IngestionRun.bucket == bucket, _same_dataset(dataset), IngestionRun.status == "uploaded")
+        .order_by(IngestionRun.created_at.desc())
+        .limit(1)
+        .scalar_subquery()
+    )
+    session.execute(
+        update(IngestionRun)
+        .where(
+            IngestionRun.bucket == bucket,
+            _same_dataset(dataset),
+            IngestionRun.sha256 == sha256,
+            IngestionRun.status == "uploaded",
+            IngestionRun.ingestion_id != latest,
+        )
+        .values(status="superseded", updated_at=func.now())
+    )
+
+
+# Only what a run listing needs; the wide sha256/content_type/bucket columns stay on disk.
+RUN_LIST_COLUMNS = (
+    IngestionRun.ingestion_id,
+    IngestionRun.source,
+    IngestionRun.dataset,
+    IngestionRun.original_filename,
+    IngestionRun.object_key,
+    IngestionRun.size_bytes,
+    IngestionRun.status,
+    IngestionRun.created_at,
+    IngestionRun.updated_at,
+)
+
+RunCursor = Tuple[datetime, UUID]
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+def encode_run_cursor(created_at: datetime, ingestion_id: UUID) -> str:
+    raw = f"{created_at.isoformat()}|{ingestion_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_run_cursor(cursor: str) -> RunCursor:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, ingestion_id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), UUID(ingestion_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise InvalidCursorError(f"Invalid cursor: {cursor!r}") from exc
+
+
+def list_ingestion_runs(
+    session: Session,
+    *,
+    limit: int,
+    after: Optional[RunCursor] = None,
+    status: Optional[str] = None,
+    source: Optional[str] = None,
+    dataset: Optional[str] = None,
+    since: Optional[datetime] = None,
+) -> List[Row]:
+    """
+    Newest-first page of runs after the (created_at, ingestion_id) keyset cursor.
+    Unfiltered, status- and source-filtered pages are index range scans of limit
+    rows (idx_ingestion_runs_*_created_at_id) however large the table grows;
+    dataset uses idx_ingestion_runs_dataset_created_at.
+    """
+    stmt = select(*RUN_LIST_COLUMNS)
+    if status is not None:
+        stmt = stmt.where(IngestionRun.status == status)
+    if source is not None:
+        stmt = stmt.where(IngestionRun.source == source)
+    if dataset is not None:
+        stmt = stmt.where(IngestionRun.dataset == dataset)
+    if since is not None:
+        stmt = stmt.where(IngestionRun.created_at >= since)
+    if after is not None:
+        stmt = stmt.where(tuple_(IngestionRun.created_at, IngestionRun.ingestion_id) < tuple_(*after))
+    stmt = stmt.order_by(IngestionRun.created_at.desc(), IngestionRun.ingestion_id.desc()).limit(limit)
+    return list(session.execute(stmt).all())
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from typing import Mapping, Sequence
+from uuid import uuid4
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.db.models import BronzeLoadJob
+
+
+def enqueue_load_jobs(session: Session, runs: Sequence[Mapping[str, object]]) -> int:
+    """
+    Queue a bronze load for every run with a known dataset. Called in the
+    transaction that writes the ingestion_runs rows, so a job exists exactly
+    when its run does.
+    """
+    jobs = [
+        {
+            "job_id": uuid4(),
+            "ingestion_id": run["ingestion_id"],
+            "dataset": run["dataset"],
+            "bucket": run["bucket"],
+            "object_key": run["object_key"],
+        }
+        for run in runs
+        if run.get("dataset")
+    ]
+    if not jobs:
+        return 0
+
+    stmt = (
+        insert(BronzeLoadJob)
+        .values(jobs)
+        .on_conflict_do_nothing(index_elements=[BronzeLoadJob.ingestion_id])
+    )
+    return session.execute(stmt).rowcount
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import List, Mapping, Sequence
+
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+from app.db.models import PipelineStageMetric
+
+
+def insert_stage_metrics(session: Session, metrics: Sequence[Mapping[str, object]]) -> None:
+    if not metrics:
+        return
+    session.execute(insert(PipelineStageMetric), list(metrics))
+
+
+def latest_stage_metrics(session: Session, *, since: datetime) -> List[PipelineStageMetric]:
+    """Most recent observation per (component, stage, subject) recorded after since."""
+    stmt = (
+        select(PipelineStageMetric)
+        .where(PipelineStageMetric.recorded_at > since)
+        .distinct(
+            PipelineStageMetric.component,
+            PipelineStageMetric.stage,
+            PipelineStageMetric.subject,
+        )
+        .order_by(
+            PipelineStageMetric.component,
+            PipelineStageMetric.stage,
+            PipelineStageMetric.subject,
+            PipelineStageMetric.recorded_at.desc(),
+        )
+    )
+    return list(session.execute(stmt).scalars())
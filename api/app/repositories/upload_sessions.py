@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import List, Mapping, Optional
+from uuid import UUID
+
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session
+
+from app.db.models import UploadSession
+
+
+def insert_upload_session(session: Session, values: Mapping[str, object]) -> UploadSession:
+    upload_session = UploadSession(**values)
+    session.add(upload_session)
+    session.flush()
+    return upload_session
+
+
+def get_upload_session(session: Session, upload_id: UUID) -> Optional[UploadSession]:
+    return session.get(UploadSession, upload_id)
+
+
+def find_open_upload_session(
+    session: Session,
+    *,
+    bucket: str,
+    sha256: str,
+    size_bytes: int,
+    original_filename: str,
+) -> Optional[UploadSession]:
+    """Newest open session for the same content (idx_upload_sessions_open_sha256)."""
+    stmt = (
+        select(UploadSession)
+        .where(
+            UploadSession.bucket == bucket,
+            UploadSession.sha256 == sha256,
+            UploadSession.size_bytes == size_bytes,
+            UploadSession.original_filename == original_filename,
+            UploadSession.status == "open",
+        )
+        .order_by(UploadSession.created_at.desc())
+        .limit(1)
+    )
+    return session.execute(stmt).scalar_one_or_none()
+
+
+def find_stale_upload_sessions(session: Session, *, created_before: datetime, limit: int) -> List[UploadSession]:
+    """Oldest sessions still open that were created before the cutoff (idx_upload_sessions_open_created_at)."""
+    stmt = (
+        select(UploadSession)
+        .where(UploadSession.status == "open", UploadSession.created_at < created_before)
+        .order_by(UploadSession.created_at)
+        .limit(limit)
+    )
+    return list(session.execute(stmt).scalars())
+
+
+def set_upload_session_status(session: Session, upload_id: UUID, status: str) -> None:
+    session.execute(
+        update(UploadSession)
+        .where(UploadSession.upload_id == upload_id)
+        .values(status=status, updated_at=func.now())
+    )
@@ -1,69 +1,404 @@
-import hashlib
+import asyncio
 import os
-from datetime import datetime, timezone
-from uuid import uuid4
-
-from fastapi import APIRouter, File, UploadFile, HTTPException
-
-from app.services.minio_client import s3_client
-from app.services.meta import upsert_ingestion_run
+import zipfile
+from dataclasses import replace
+from functools import partial
+from pathlib import PurePosixPath
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence
+from uuid import UUID, uuid4
+
+from fastapi import APIRouter, BackgroundTasks, File, Path, Query, Request, UploadFile, HTTPException
+from pydantic import BaseModel, Field
+
+from app.core.config import get_settings
+from app.core.executor import run_blocking
+from app.core.metrics import StageMetric, StageTimer
+from app.services.datasets import infer_dataset
+from app.repositories.ingestion_runs import InvalidCursorError
+from app.services.meta import (
+    find_uploaded_content,
+    ingestion_run_page_async,
+    record_ingestion_runs_async,
+    upsert_ingestion_run_async,
+)
+from app.services.minio_client import delete_objects
+from app.services.pipeline_metrics import persist_stage_metrics
+from app.services.raw_objects import EmptyUploadError, RawObject, store_raw_object
+from app.services.resumable_uploads import (
+    ChecksumMismatchError,
+    InvalidPartError,
+    UploadSessionConflict,
+    UploadSessionNotFound,
+    abort_upload_session,
+    complete_upload_session,
+    start_upload_session,
+    store_session_part,
+    upload_session_state,
+)
 
 router = APIRouter(prefix="/ingest", tags=["ingest"])
 
 RAW_BUCKET = os.getenv("MINIO_BUCKET_RAW", "raw")
+SOURCE = "letterboxd_csv"
+
+
+def _zip_dataset_members(archive: zipfile.ZipFile) -> List[zipfile.ZipInfo]:
+    """
+    Top-level CSVs whose names map to a dataset. Letterboxd exports also carry
+    deleted/ and orphaned/ copies of the same filenames, which are ignored.
+    """
+    return [
+        info
+        for info in archive.infolist()
+        if not info.is_dir()
+        and len(PurePosixPath(info.filename).parts) == 1
+        and infer_dataset(info.filename) is not None
+    ]
+
+
+def _store_zip_member(archive: zipfile.ZipFile, info: zipfile.ZipInfo) -> RawObject:
+    with archive.open(info) as stream:
+        return store_raw_object(
+            stream,
+            bucket=RAW_BUCKET,
+            filename=PurePosixPath(info.filename).name,
+            content_type="text/csv",
+        )
+
+
+def _ingestion_row(raw_object: RawObject) -> Dict[str, Any]:
+    return {
+        "ingestion_id": uuid4(),
+        "source": SOURCE,
+        "dataset": raw_object.dataset,
+        "original_filename": raw_object.original_filename,
+        "bucket": RAW_BUCKET,
+        "object_key": raw_object.object_key,
+        "size_bytes": raw_object.size_bytes,
+        "sha256": raw_object.sha256,
+        "content_type": raw_object.content_type,
+        "status": "uploaded",
+    }
+
+
+@router.get("/runs")
+async def list_runs(
+    limit: int = Query(50, ge=1, le=500),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    status: Optional[str] = None,
+    source: Optional[str] = None,
+    dataset: Optional[str] = None,
+    since: Optional[datetime] = Query(None, description="Only runs created at or after this time"),
+):
+    """Ingestion runs, newest first, paged with an opaque keyset cursor."""
+    try:
+        return await ingestion_run_page_async(
+            limit=limit,
+            cursor=cursor,
+            status=status,
+            source=source,
+            dataset=dataset,
+            since=since,
+        )
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+
+def _duplicate_response(
+    background_tasks: BackgroundTasks,
+    raw_object: RawObject,
+    stage_metrics: Sequence[StageMetric],
+) -> Dict[str, Any]:
+    background_tasks.add_task(persist_stage_metrics, stage_metrics, ingestion_id=raw_object.duplicate_of)
+    return {
+        "status": "duplicate",
+        "ingestion_id": str(raw_object.duplicate_of),
+        "bucket": RAW_BUCKET,
+        "object_key": raw_object.object_key,
+        "size_bytes": raw_object.size_bytes,
+        "sha256": raw_object.sha256,
+    }
 
 
 @router.post("/letterboxd/upload")
-async def upload_letterboxd_csv(file: UploadFile = File(...)):
+async def upload_letterboxd_csv(background_tasks: BackgroundTasks, file: UploadFile = File(...)):
     # Basic validation
     if not file.filename.lower().endswith(".csv"):
         raise HTTPException(status_code=400, detail="Only .csv files are supported")
 
-    # Read bytes (v1: in-memory; later we’ll stream)
-    data = await file.read()
-    size_bytes = len(data)
-    if size_bytes == 0:
+    # 1) Hash and stream to MinIO in fixed-size chunks, off the event loop
+    try:
+        raw_object = await run_blocking(
+            store_raw_object,
+            file.file,
+            bucket=RAW_BUCKET,
+            filename=file.filename,
+            content_type=file.content_type,
+        )
+    except EmptyUploadError:
         raise HTTPException(status_code=400, detail="Empty file")
 
-    sha256 = hashlib.sha256(data).hexdigest()
-
-    # Build an object key
-    ts = datetime.now(timezone.utc).strftime("%Y/%m/%d/%H%M%S")
-    safe_name = file.filename.replace(" ", "_")
-    object_key = f"letterboxd/{ts}_{sha256[:12]}_{safe_name}"
-
-    # 1) Upload to MinIO
-    s3 = s3_client()
-    s3.put_object(
-        Bucket=RAW_BUCKET,
-        Key=object_key,
-        Body=data,
-        ContentType=file.content_type or "text/csv",
-    )
+    # Identical content is already stored: point at the existing object and write nothing
+    if raw_object.duplicate_of is not None:
+        return _duplicate_response(background_tasks, raw_object, raw_object.stage_metrics)
 
     # 2) Write metadata row to Postgres (public.ingestion_runs)
     ingestion_id = uuid4()
-    returned_id = upsert_ingestion_run(
-        ingestion_id=ingestion_id,
-        source="letterboxd_csv",
-        original_filename=file.filename,
-        bucket=RAW_BUCKET,
-        object_key=object_key,
-        size_bytes=size_bytes,
-        content_type=file.content_type,
-        status="uploaded",
+    timer = StageTimer(subject=raw_object.dataset)
+    with timer.stage("metadata_write", object_key=raw_object.object_key):
+        returned_id = await upsert_ingestion_run_async(
+            ingestion_id=ingestion_id,
+            source=SOURCE,
+            dataset=raw_object.dataset,
+            original_filename=raw_object.original_filename,
+            bucket=RAW_BUCKET,
+            object_key=raw_object.object_key,
+            size_bytes=raw_object.size_bytes,
+            sha256=raw_object.sha256,
+            content_type=file.content_type,
+            status="uploaded",
+        )
+
+    # A concurrent upload of the same content was recorded first: keep only its object.
+    if returned_id != ingestion_id:
+        _, existing_key = await run_blocking(
+            find_uploaded_content,
+            bucket=RAW_BUCKET,
+            dataset=raw_object.dataset,
+            sha256=raw_object.sha256,
+        )
+        if raw_object.reused_from is None and existing_key != raw_object.object_key:
+            await run_blocking(delete_objects, bucket=RAW_BUCKET, keys=[raw_object.object_key])
+        raw_object = replace(raw_object, object_key=existing_key, duplicate_of=returned_id)
+        return _duplicate_response(background_tasks, raw_object, [*raw_object.stage_metrics, *timer.metrics])
+
+    # Persisted after the response is sent so it adds no upload latency.
+    background_tasks.add_task(
+        persist_stage_metrics,
+        [*raw_object.stage_metrics, *timer.metrics],
+        ingestion_id=returned_id,
     )
 
     return {
         "status": "ok",
         "ingestion_id": str(returned_id),
         "bucket": RAW_BUCKET,
-        "object_key": object_key,
-        "size_bytes": size_bytes,
-        "sha256": sha256,
+        "object_key": raw_object.object_key,
+        "size_bytes": raw_object.size_bytes,
+        "sha256": raw_object.sha256,
+    }
+
+
+async def _discard_stored_objects(results: List[Any]) -> None:
+    """Delete the objects a failed batch already wrote, so no object is left without an ingestion_runs row."""
+    keys = sorted(
+        {
+            result.object_key
+            for result in results
+            if isinstance(result, RawObject) and result.duplicate_of is None and result.reused_from is None
+        }
+    )
+    if keys:
+        await run_blocking(delete_objects, bucket=RAW_BUCKET, keys=keys)
+
+
+@router.post("/letterboxd/upload/batch")
+async def upload_letterboxd_batch(background_tasks: BackgroundTasks, files: List[UploadFile] = File(...)):
+    """
+    Ingest a whole export in one request: any mix of .csv files and Letterboxd
+    .zip exports. Members upload concurrently and all ingestion_runs rows are
+    written in one transaction.
+    """
+    for upload in files:
+        if not upload.filename.lower().endswith((".csv", ".zip")):
+            raise HTTPException(
+                status_code=400,
+                detail=f"Only .csv and .zip files are supported: {upload.filename}",
+            )
+
+    archives: List[zipfile.ZipFile] = []
+    jobs: List[Callable[[], RawObject]] = []
+    skipped: List[str] = []
+    try:
+        for upload in files:
+            if upload.filename.lower().endswith(".csv"):
+                if upload.size == 0:
+                    raise HTTPException(status_code=400, detail=f"{upload.filename} is empty")
+                jobs.append(
+                    partial(
+                        store_raw_object,
+                        upload.file,
+                        bucket=RAW_BUCKET,
+                        filename=upload.filename,
+                        content_type=upload.content_type,
+                    )
+                )
+                continue
+
+            try:
+                archive = await run_blocking(zipfile.ZipFile, upload.file)
+            except zipfile.BadZipFile:
+                raise HTTPException(status_code=400, detail=f"Not a valid zip archive: {upload.filename}")
+            archives.append(archive)
+
+            members = _zip_dataset_members(archive)
+            skipped.extend(
+                f"{upload.filename}:{info.filename}"
+                for info in archive.infolist()
+                if not info.is_dir() and info not in members
+            )
+            empty = [info.filename for info in members if info.file_size == 0]
+            if empty:
+                raise HTTPException(status_code=400, detail=f"Empty CSVs in {upload.filename}: {empty}")
+            jobs.extend(partial(_store_zip_member, archive, info) for info in members)
+
+        if not jobs:
+            raise HTTPException(status_code=400, detail="No Letterboxd dataset CSVs found in the request")
+
+        # Let every member finish before the archives are closed, then surface the first failure.
+        results = await asyncio.gather(*(run_blocking(job) for job in jobs), return_exceptions=True)
+    finally:
+        for archive in archives:
+            archive.close()
+
+    # Empty members are rejected above from their sizes; this also covers failures mid-upload.
+    for result in results:
+        if isinstance(result, BaseException):
+            await _discard_stored_objects(results)
+            if isinstance(result, EmptyUploadError):
+                raise HTTPException(status_code=400, detail=str(result))
+            raise result
+    raw_objects: List[RawObject] = list(results)
+
+    rows = {
+        raw_object.object_key: _ingestion_row(raw_object)
+        for raw_object in raw_objects
+        if raw_object.duplicate_of is None
+    }
+    timer = StageTimer(subject="batch")
+    try:
+        with timer.stage("metadata_write") as metric:
+            raced = await record_ingestion_runs_async(list(rows.values()))
+            metric.rows = len(rows) - len(raced)
+    except Exception:
+        await _discard_stored_objects(raw_objects)
+        raise
+
+    # Content a concurrent upload recorded first: drop these copies and report that run instead.
+    if raced:
+        recorded_keys = {object_key for _, object_key in raced.values()}
+        recorded_keys.update(key for key, row in rows.items() if row["ingestion_id"] not in raced)
+        stored_keys = set()
+        for index, raw_object in enumerate(raw_objects):
+            if raw_object.duplicate_of is None and rows[raw_object.object_key]["ingestion_id"] in raced:
+                if raw_object.reused_from is None:
+                    stored_keys.add(raw_object.object_key)
+                ingestion_id, object_key = raced[rows[raw_object.object_key]["ingestion_id"]]
+                raw_objects[index] = replace(raw_object, object_key=object_key, duplicate_of=ingestion_id)
+        discarded = sorted(stored_keys - recorded_keys)
+        if discarded:
+            await run_blocking(delete_objects, bucket=RAW_BUCKET, keys=discarded)
+
+    uploads = []
+    for raw_object in raw_objects:
+        if raw_object.duplicate_of is None:
+            status, ingestion_id = "ok", rows[raw_object.object_key]["ingestion_id"]
+        else:
+            status, ingestion_id = "duplicate", raw_object.duplicate_of
+        uploads.append(
+            {
+                "status": status,
+                "ingestion_id": str(ingestion_id),
+                "dataset": raw_object.dataset,
+                "original_filename": raw_object.original_filename,
+                "object_key": raw_object.object_key,
+                "size_bytes": raw_object.size_bytes,
+                "sha256": raw_object.sha256,
+            }
+        )
+        background_tasks.add_task(persist_stage_metrics, raw_object.stage_metrics, ingestion_id=ingestion_id)
+    background_tasks.add_task(persist_stage_metrics, timer.metrics)
+
+    return {
+        "status": "ok",
+        "bucket": RAW_BUCKET,
+        "uploads": uploads,
+        "skipped": skipped,
     }
 
 
+class UploadSessionRequest(BaseModel):
+    filename: str
+    size_bytes: int = Field(gt=0)
+    sha256: str
+    content_type: Optional[str] = None
+
+
+async def _session_call(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run a resumable-upload step off the event loop and map its errors to HTTP statuses."""
+    try:
+        return await run_blocking(func, *args, **kwargs)
+    except UploadSessionNotFound as exc:
+        raise HTTPException(status_code=404, detail=str(exc))
+    except UploadSessionConflict as exc:
+        raise HTTPException(status_code=409, detail=str(exc))
+    except ChecksumMismatchError as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+    except (InvalidPartError, ValueError) as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+
+@router.post("/letterboxd/uploads")
+async def start_resumable_upload(body: UploadSessionRequest):
+    """
+    Open (or resume) a resumable upload. The client then PUTs each part of
+    part_size_bytes, in any order and in parallel, and only re-sends the part
+    numbers missing from received_parts after a failure.
+    """
+    if not body.filename.lower().endswith(".csv"):
+        raise HTTPException(status_code=400, detail="Only .csv files are supported")
+    return await _session_call(
+        start_upload_session,
+        bucket=RAW_BUCKET,
+        filename=body.filename,
+        size_bytes=body.size_bytes,
+        sha256=body.sha256,
+        content_type=body.content_type,
+        source=SOURCE,
+    )
+
+
+@router.get("/letterboxd/uploads/{upload_id}")
+async def get_resumable_upload(upload_id: UUID):
+    return await _session_call(upload_session_state, upload_id)
+
+
+@router.put("/letterboxd/uploads/{upload_id}/parts/{part_number}")
+async def put_resumable_upload_part(request: Request, upload_id: UUID, part_number: int = Path(ge=1, le=10_000)):
+    # Parts are bounded by MULTIPART_PART_SIZE_BYTES, so one is buffered whole.
+    limit = get_settings().multipart_part_size_bytes
+    data = bytearray()
+    async for chunk in request.stream():
+        data.extend(chunk)
+        if len(data) > limit:
+            raise HTTPException(status_code=413, detail=f"Parts are at most {limit} bytes")
+    return await _session_call(store_session_part, upload_id, part_number, bytes(data))
+
+
+@router.post("/letterboxd/uploads/{upload_id}/complete")
+async def complete_resumable_upload(background_tasks: BackgroundTasks, upload_id: UUID):
+    result, stage_metrics = await _session_call(complete_upload_session, upload_id, source=SOURCE)
+    background_tasks.add_task(persist_stage_metrics, stage_metrics, ingestion_id=UUID(result["ingestion_id"]))
+    return result
+
+
+@router.delete("/letterboxd/uploads/{upload_id}")
+async def abort_resumable_upload(upload_id: UUID):
+    await _session_call(abort_upload_session, upload_id)
+    return {"status": "aborted", "upload_id": str(upload_id)}
+
+
 
 
 
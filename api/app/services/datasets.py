@@ -0,0 +1,20 @@
+from pathlib import PurePosixPath
+from typing import Optional
+
+# Keep in sync with bronze_loader.loader.RENAME_MAPS / infer_dataset_from_object_name.
+SUPPORTED_DATASETS = ("diary", "profile", "ratings", "reviews", "watched", "watchlist")
+
+
+def infer_dataset(filename: str) -> Optional[str]:
+    name = PurePosixPath(filename).name.lower()
+    if not name.endswith(".csv"):
+        return None
+
+    stem = name[:-4]
+    for dataset in SUPPORTED_DATASETS:
+        if stem == dataset:
+            return dataset
+        for delimiter in ("_", "-", " "):
+            if stem.endswith(f"{delimiter}{dataset}"):
+                return dataset
+    return None
@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import os
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+
+from app.core.config import get_settings
+from app.core.metrics import DEPENDENCY_PROBE_SECONDS, DEPENDENCY_UP
+from app.services.minio_client import s3_probe_client
+
+logger = logging.getLogger(__name__)
+
+
+def must(name: str) -> str:
+    value = os.getenv(name)
+    if value is None or value.strip() == "":
+        raise RuntimeError(f"Missing required environment variable: {name}")
+    return value
+
+
+@dataclass(frozen=True)
+class DependencyStatus:
+    status: str
+    detail: str
+    latency_ms: Optional[float] = None
+    checked_at: Optional[float] = None
+    checked_at_utc: Optional[str] = None
+
+    def as_dict(self, *, now: float, ttl_seconds: float, required: bool) -> Dict[str, Any]:
+        status = self.status
+        age_seconds = None
+        if self.checked_at is not None:
+            age_seconds = round(now - self.checked_at, 3)
+            if age_seconds > ttl_seconds:
+                status = "stale"
+        return {
+            "status": status,
+            "detail": self.detail,
+            "required": required,
+            "latency_ms": self.latency_ms,
+            "checked_at_utc": self.checked_at_utc,
+            "age_seconds": age_seconds,
+        }
+
+
+PENDING = DependencyStatus(status="pending", detail="not probed yet")
+
+
+@dataclass(frozen=True)
+class DependencyProbe:
+    name: str
+    check: Callable[[], str]
+    # Optional dependencies are reported but never make the API unready.
+    required: bool = True
+
+
+def _probe_engine(url: str, timeout_seconds: float) -> Engine:
+    """One-connection engine for probes, so they never wait on the upload pool."""
+    return create_engine(
+        url,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=timeout_seconds,
+        connect_args={
+            "connect_timeout": max(1, math.ceil(timeout_seconds)),
+            "options": f"-c statement_timeout={int(timeout_seconds * 1000)}",
+        },
+    )
+
+
+def _select_one(engine: Engine) -> None:
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+
+
+class DependencyHealth:
+    """
+    Probes every dependency on a fixed interval in the background and keeps the
+    last result of each in memory; readiness is answered from that cache.
+    """
+
+    def __init__(
+        self,
+        probes: list[DependencyProbe],
+        *,
+        interval_seconds: float,
+        timeout_seconds: float,
+        ttl_seconds: float,
+        on_stop: Optional[Callable[[], None]] = None,
+    ) -> None:
+        self.probes = {probe.name: probe for probe in probes}
+        self.interval_seconds = interval_seconds
+        self.timeout_seconds = timeout_seconds
+        self.ttl_seconds = ttl_seconds
+        self._results: Dict[str, DependencyStatus] = {name: PENDING for name in self.probes}
+        self._in_flight: Dict[str, Future] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._task: Optional[asyncio.Task] = None
+        self._on_stop = on_stop
+
+    def start(self) -> None:
+        # Own threads, so a hung dependency cannot starve the upload I/O pool.
+        self._executor = ThreadPoolExecutor(max_workers=len(self.probes), thread_name_prefix="api-health")
+        self._task = asyncio.get_running_loop().create_task(self._run(), name="dependency-health")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        if self._on_stop is not None:
+            self._on_stop()
+
+    async def _run(self) -> None:
+        while True:
+            await self.refresh()
+            await asyncio.sleep(self.interval_seconds)
+
+    async def refresh(self) -> None:
+        await asyncio.gather(*(self._probe(probe) for probe in self.probes.values()))
+
+    async def _probe(self, probe: DependencyProbe) -> None:
+        previous = self._in_flight.get(probe.name)
+        if previous is not None and not previous.done():
+            # Still stuck in the driver from an earlier round; its cached result ages into "stale".
+            return
+
+        future = self._executor.submit(self._timed_check, probe)
+        self._in_flight[probe.name] = future
+        try:
+            status = await asyncio.wait_for(asyncio.wrap_future(future), timeout=self.timeout_seconds)
+        except asyncio.TimeoutError:
+            status = self._finished(probe, "error", f"probe timed out after {self.timeout_seconds:g}s", None)
+        self._results[probe.name] = status
+
+    def _timed_check(self, probe: DependencyProbe) -> DependencyStatus:
+        started = time.perf_counter()
+        try:
+            detail = probe.check()
+        except Exception as exc:
+            return self._finished(probe, "error", str(exc), time.perf_counter() - started)
+        return self._finished(probe, "ok", detail, time.perf_counter() - started)
+
+    def _finished(
+        self,
+        probe: DependencyProbe,
+        status: str,
+        detail: str,
+        elapsed_seconds: Optional[float],
+    ) -> DependencyStatus:
+        if elapsed_seconds is not None:
+            DEPENDENCY_PROBE_SECONDS.labels(probe.name).observe(elapsed_seconds)
+        DEPENDENCY_UP.labels(probe.name).set(1 if status == "ok" else 0)
+        if status != "ok":
+            logger.warning("Dependency probe %s failed: %s", probe.name, detail)
+        return DependencyStatus(
+            status=status,
+            detail=detail,
+            latency_ms=None if elapsed_seconds is None else round(elapsed_seconds * 1000, 3),
+            checked_at=time.monotonic(),
+            checked_at_utc=datetime.now(timezone.utc).isoformat(),
+        )
+
+    def snapshot(self) -> Tuple[bool, Dict[str, Dict[str, Any]]]:
+        """(ready, per-dependency status) from memory; results older than the TTL count as stale."""
+        now = time.monotonic()
+        dependencies = {
+            name: self._results[name].as_dict(now=now, ttl_seconds=self.ttl_seconds, required=probe.required)
+            for name, probe in self.probes.items()
+        }
+        ready = all(
+            dependencies[name]["status"] == "ok" for name, probe in self.probes.items() if probe.required
+        )
+        return ready, dependencies
+
+
+def build_dependency_health() -> DependencyHealth:
+    settings = get_settings()
+    timeout = settings.health_check_timeout_seconds
+    minio = s3_probe_client(timeout)
+    metadata_engine = _probe_engine(settings.metadata_database_url, timeout)
+    warehouse_url = settings.warehouse_database_url
+    warehouse_engine = _probe_engine(warehouse_url, timeout) if warehouse_url else None
+
+    def check_minio() -> str:
+        bucket = must("MINIO_BUCKET_RAW")
+        minio.head_bucket(Bucket=bucket)
+        return f"bucket '{bucket}' reachable"
+
+    def check_postgres_meta() -> str:
+        _select_one(metadata_engine)
+        return "metadata database reachable"
+
+    def check_postgres_warehouse() -> str:
+        if warehouse_engine is None:
+            raise RuntimeError("POSTGRES_WAREHOUSE_USER/POSTGRES_WAREHOUSE_DB are not set")
+        _select_one(warehouse_engine)
+        return "warehouse database reachable"
+
+    def dispose_engines() -> None:
+        metadata_engine.dispose()
+        if warehouse_engine is not None:
+            warehouse_engine.dispose()
+
+    return DependencyHealth(
+        [
+            DependencyProbe("minio", check_minio),
+            DependencyProbe("postgres_meta", check_postgres_meta),
+            # The API never writes to the warehouse, so an outage there must not stop uploads.
+            DependencyProbe("postgres_warehouse", check_postgres_warehouse, required=False),
+        ],
+        interval_seconds=settings.health_check_interval_seconds,
+        timeout_seconds=timeout,
+        ttl_seconds=settings.health_cache_ttl_seconds,
+        on_stop=dispose_engines,
+    )
@@ -1,29 +1,309 @@
-from typing import Optional
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
 from uuid import UUID
 
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.core.executor import run_blocking
 from app.db.session import session_scope
+from app.repositories.ingestion_runs import (
+    decode_run_cursor,
+    encode_run_cursor,
+    find_latest_uploaded_run,
+    find_uploaded_run_by_sha256,
+    insert_ingestion_runs,
+    list_ingestion_runs,
+)
 from app.repositories.ingestion_runs import upsert_ingestion_run as upsert_ingestion_run_record
+from app.repositories.load_jobs import enqueue_load_jobs
+from app.repositories.stage_metrics import insert_stage_metrics, latest_stage_metrics
+from app.repositories.upload_sessions import (
+    find_open_upload_session,
+    find_stale_upload_sessions,
+    get_upload_session,
+    insert_upload_session,
+    set_upload_session_status,
+)
+
+def _write_ingestion_run(
+    session: Session,
+    *,
+    ingestion_id: UUID,
+    source: str,
+    dataset: Optional[str],
+    original_filename: str,
+    bucket: str,
+    object_key: str,
+    size_bytes: int,
+    sha256: Optional[str],
+    content_type: Optional[str],
+    status: str,
+) -> UUID:
+    returned_id = upsert_ingestion_run_record(
+        session,
+        ingestion_id=ingestion_id,
+        source=source,
+        dataset=dataset,
+        original_filename=original_filename,
+        bucket=bucket,
+        object_key=object_key,
+        size_bytes=size_bytes,
+        sha256=sha256,
+        content_type=content_type,
+        status=status,
+    )
+    # A different id means identical content was already recorded; that run owns the load.
+    if status == "uploaded" and returned_id == ingestion_id:
+        enqueue_load_jobs(
+            session,
+            [
+                {
+                    "ingestion_id": returned_id,
+                    "dataset": dataset,
+                    "bucket": bucket,
+                    "object_key": object_key,
+                }
+            ],
+        )
+    return returned_id
+
 
 def upsert_ingestion_run(
     *,
     ingestion_id: UUID,
     source: str,
+    dataset: Optional[str],
     original_filename: str,
     bucket: str,
     object_key: str,
     size_bytes: int,
+    sha256: Optional[str],
     content_type: Optional[str],
     status: str = "uploaded",
 ) -> UUID:
+    """Write the run and, for a known dataset, queue its bronze load in the same transaction."""
     with session_scope() as session:
-        return upsert_ingestion_run_record(
+        return _write_ingestion_run(
             session,
             ingestion_id=ingestion_id,
             source=source,
+            dataset=dataset,
             original_filename=original_filename,
             bucket=bucket,
             object_key=object_key,
             size_bytes=size_bytes,
+            sha256=sha256,
             content_type=content_type,
             status=status,
         )
+
+
+async def upsert_ingestion_run_async(**kwargs) -> UUID:
+    """Same as upsert_ingestion_run, executed on the shared I/O pool."""
+    return await run_blocking(upsert_ingestion_run, **kwargs)
+
+
+def record_ingestion_runs(runs: Sequence[Mapping[str, object]]) -> Dict[UUID, Tuple[UUID, str]]:
+    """
+    Write every run of a batch upload, and queue their bronze loads, in one
+    transaction. Runs whose content another upload just recorded as the
+    dataset's newest are not written; they are returned as
+    ingestion_id -> (ingestion_id, object_key) of the recorded run.
+    """
+    with session_scope() as session:
+        inserted = set(insert_ingestion_runs(session, runs))
+        enqueue_load_jobs(
+            session,
+            [run for run in runs if run["ingestion_id"] in inserted and run.get("status") == "uploaded"],
+        )
+        duplicates: Dict[UUID, Tuple[UUID, str]] = {}
+        for run in runs:
+            if run["ingestion_id"] in inserted:
+                continue
+            existing = find_uploaded_run_by_sha256(
+                session,
+                bucket=run["bucket"],
+                dataset=run["dataset"],
+                sha256=run["sha256"],
+            )
+            if existing is None:
+                raise ValueError(f"Ingestion run for s3://{run['bucket']}/{run['object_key']} conflicts with an existing run")
+            duplicates[run["ingestion_id"]] = (existing.ingestion_id, existing.object_key)
+        return duplicates
+
+
+async def record_ingestion_runs_async(runs: Sequence[Mapping[str, object]]) -> Dict[UUID, Tuple[UUID, str]]:
+    return await run_blocking(record_ingestion_runs, runs)
+
+
+def find_duplicate_upload(*, bucket: str, dataset: Optional[str], sha256: str) -> Optional[Tuple[UUID, str]]:
+    """
+    (ingestion_id, object_key) of the dataset's newest upload if it has the
+    same content. An older match is not a duplicate: uploading it again moves
+    the dataset back to that content.
+    """
+    with session_scope() as session:
+        run = find_latest_uploaded_run(session, bucket=bucket, dataset=dataset)
+        if run is None or run.sha256 != sha256:
+            return None
+        return run.ingestion_id, run.object_key
+
+
+def find_uploaded_content(*, bucket: str, dataset: Optional[str], sha256: str) -> Optional[Tuple[UUID, str]]:
+    """(ingestion_id, object_key) of the dataset's upload that holds this content, newest or not."""
+    with session_scope() as session:
+        run = find_uploaded_run_by_sha256(session, bucket=bucket, dataset=dataset, sha256=sha256)
+        if run is None:
+            return None
+        return run.ingestion_id, run.object_key
+
+
+def ingestion_run_page(
+    *,
+    limit: int,
+    cursor: Optional[str] = None,
+    status: Optional[str] = None,
+    source: Optional[str] = None,
+    dataset: Optional[str] = None,
+    since: Optional[datetime] = None,
+) -> Dict[str, Any]:
+    """
+    One newest-first page of runs and the cursor of the next (older) page.
+    Raises InvalidCursorError for a cursor this API did not issue.
+    """
+    after = decode_run_cursor(cursor) if cursor else None
+    with session_scope() as session:
+        # One extra row tells whether another page exists without a COUNT(*).
+        rows = list_ingestion_runs(
+            session,
+            limit=limit + 1,
+            after=after,
+            status=status,
+            source=source,
+            dataset=dataset,
+            since=since,
+        )
+    page = rows[:limit]
+    next_cursor = None
+    if len(rows) > limit:
+        last = page[-1]
+        next_cursor = encode_run_cursor(last.created_at, last.ingestion_id)
+    return {
+        "runs": [dict(row._mapping) for row in page],
+        "next_cursor": next_cursor,
+    }
+
+
+async def ingestion_run_page_async(**kwargs) -> Dict[str, Any]:
+    return await run_blocking(ingestion_run_page, **kwargs)
+
+
+UPLOAD_SESSION_FIELDS = (
+    "upload_id",
+    "ingestion_id",
+    "s3_upload_id",
+    "bucket",
+    "object_key",
+    "original_filename",
+    "content_type",
+    "dataset",
+    "size_bytes",
+    "sha256",
+    "part_size_bytes",
+    "status",
+)
+
+
+def _upload_session_dict(upload_session) -> Dict[str, Any]:
+    return {name: getattr(upload_session, name) for name in UPLOAD_SESSION_FIELDS}
+
+
+def create_upload_session(values: Mapping[str, object]) -> Dict[str, Any]:
+    with session_scope() as session:
+        return _upload_session_dict(insert_upload_session(session, values))
+
+
+def load_upload_session(upload_id: UUID) -> Optional[Dict[str, Any]]:
+    with session_scope() as session:
+        upload_session = get_upload_session(session, upload_id)
+        return None if upload_session is None else _upload_session_dict(upload_session)
+
+
+def find_resumable_upload_session(
+    *,
+    bucket: str,
+    sha256: str,
+    size_bytes: int,
+    original_filename: str,
+) -> Optional[Dict[str, Any]]:
+    with session_scope() as session:
+        upload_session = find_open_upload_session(
+            session,
+            bucket=bucket,
+            sha256=sha256,
+            size_bytes=size_bytes,
+            original_filename=original_filename,
+        )
+        return None if upload_session is None else _upload_session_dict(upload_session)
+
+
+def stale_upload_sessions(*, created_before: datetime, limit: int) -> List[Dict[str, Any]]:
+    with session_scope() as session:
+        return [
+            _upload_session_dict(upload_session)
+            for upload_session in find_stale_upload_sessions(session, created_before=created_before, limit=limit)
+        ]
+
+
+def update_upload_session_status(upload_id: UUID, status: str) -> None:
+    with session_scope() as session:
+        set_upload_session_status(session, upload_id, status)
+
+
+def finish_upload_session(upload_session: Mapping[str, Any], *, source: str) -> UUID:
+    """
+    Write the run (and its bronze load job) and close the session in one
+    transaction. If another upload recorded the same content first, the
+    session is closed as a duplicate and that run's id is returned.
+    """
+    with session_scope() as session:
+        returned_id = _write_ingestion_run(
+            session,
+            ingestion_id=upload_session["ingestion_id"],
+            source=source,
+            dataset=upload_session["dataset"],
+            original_filename=upload_session["original_filename"],
+            bucket=upload_session["bucket"],
+            object_key=upload_session["object_key"],
+            size_bytes=upload_session["size_bytes"],
+            sha256=upload_session["sha256"],
+            content_type=upload_session["content_type"],
+            status="uploaded",
+        )
+        status = "completed" if returned_id == upload_session["ingestion_id"] else "duplicate"
+        set_upload_session_status(session, upload_session["upload_id"], status)
+        return returned_id
+
+
+def record_stage_metrics(metrics: Sequence[Mapping[str, object]]) -> None:
+    with session_scope() as session:
+        insert_stage_metrics(session, metrics)
+
+
+def recent_stage_metrics() -> List[Mapping[str, object]]:
+    """Latest persisted observation of every stage, detached from the session."""
+    since = datetime.now(timezone.utc) - timedelta(hours=get_settings().metrics_lookback_hours)
+    with session_scope() as session:
+        return [
+            {
+                "component": metric.component,
+                "stage": metric.stage,
+                "subject": metric.subject,
+                "duration_ms": metric.duration_ms,
+                "rows_processed": metric.rows_processed,
+                "bytes_processed": metric.bytes_processed,
+                "recorded_at": metric.recorded_at,
+            }
+            for metric in latest_stage_metrics(session, since=since)
+        ]
@@ -1,12 +1,165 @@
 import os
+import threading
+from typing import Dict, Iterator, List, Optional
+
 import boto3
+from botocore.config import Config
+from botocore.exceptions import ClientError
 
-def s3_client():
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def s3_client_config() -> Config:
+    return Config(
+        max_pool_connections=int(os.getenv("S3_MAX_POOL_CONNECTIONS", "16")),
+        connect_timeout=float(os.getenv("S3_CONNECT_TIMEOUT_SECONDS", "5")),
+        read_timeout=float(os.getenv("S3_READ_TIMEOUT_SECONDS", "60")),
+        retries={
+            "max_attempts": int(os.getenv("S3_MAX_ATTEMPTS", "5")),
+            "mode": "standard",
+        },
+        tcp_keepalive=True,
+    )
+
+
+def _new_client(config: Config):
     endpoint = f"http://{os.getenv('MINIO_HOST', 'minio')}:{os.getenv('MINIO_PORT', '9000')}"
-    return boto3.client(
+    return boto3.session.Session().client(
         "s3",
         endpoint_url=endpoint,
         aws_access_key_id=os.getenv("MINIO_ROOT_USER"),
         aws_secret_access_key=os.getenv("MINIO_ROOT_PASSWORD"),
         region_name=os.getenv("MINIO_REGION", "us-east-1"),
+        config=config,
+    )
+
+
+def s3_client():
+    """Process-wide boto3 client; clients are thread-safe and keep a pooled, kept-alive connection set."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = _new_client(s3_client_config())
+    return _client
+
+
+def s3_probe_client(timeout_seconds: float):
+    """
+    Separate single-connection client for health probes: short timeouts, no
+    retries, and never a connection taken from the upload pool.
+    """
+    return _new_client(
+        Config(
+            max_pool_connections=1,
+            connect_timeout=timeout_seconds,
+            read_timeout=timeout_seconds,
+            retries={"max_attempts": 1, "mode": "standard"},
+            tcp_keepalive=True,
+        )
+    )
+
+
+def put_object(
+    *,
+    bucket: str,
+    key: str,
+    data: bytes,
+    content_type: Optional[str],
+    metadata: Optional[Dict[str, str]] = None,
+) -> None:
+    s3_client().put_object(
+        Bucket=bucket,
+        Key=key,
+        Body=data,
+        ContentType=content_type,
+        Metadata=metadata or {},
+    )
+
+
+def create_multipart_upload(
+    *,
+    bucket: str,
+    key: str,
+    content_type: str,
+    metadata: Optional[Dict[str, str]] = None,
+) -> str:
+    response = s3_client().create_multipart_upload(
+        Bucket=bucket,
+        Key=key,
+        ContentType=content_type,
+        Metadata=metadata or {},
+    )
+    return response["UploadId"]
+
+
+def upload_part(*, bucket: str, key: str, upload_id: str, part_number: int, data: bytes) -> Dict[str, object]:
+    response = s3_client().upload_part(
+        Bucket=bucket,
+        Key=key,
+        UploadId=upload_id,
+        PartNumber=part_number,
+        Body=data,
+    )
+    return {"PartNumber": part_number, "ETag": response["ETag"]}
+
+
+def complete_multipart_upload(*, bucket: str, key: str, upload_id: str, parts: List[Dict[str, object]]) -> None:
+    s3_client().complete_multipart_upload(
+        Bucket=bucket,
+        Key=key,
+        UploadId=upload_id,
+        MultipartUpload={"Parts": parts},
     )
+
+
+def abort_multipart_upload(*, bucket: str, key: str, upload_id: str) -> None:
+    s3_client().abort_multipart_upload(Bucket=bucket, Key=key, UploadId=upload_id)
+
+
+def list_uploaded_parts(*, bucket: str, key: str, upload_id: str) -> List[Dict[str, object]]:
+    """Every part already stored for a multipart upload, in part-number order."""
+    parts: List[Dict[str, object]] = []
+    kwargs = {"Bucket": bucket, "Key": key, "UploadId": upload_id}
+    while True:
+        response = s3_client().list_parts(**kwargs)
+        parts.extend(
+            {"PartNumber": part["PartNumber"], "ETag": part["ETag"], "Size": part["Size"]}
+            for part in response.get("Parts", [])
+        )
+        if not response.get("IsTruncated"):
+            return parts
+        kwargs["PartNumberMarker"] = response["NextPartNumberMarker"]
+
+
+def object_exists(*, bucket: str, key: str) -> bool:
+    try:
+        s3_client().head_object(Bucket=bucket, Key=key)
+    except ClientError as exc:
+        if exc.response.get("Error", {}).get("Code") in {"404", "NoSuchKey", "NotFound"}:
+            return False
+        raise
+    return True
+
+
+def iter_object_chunks(*, bucket: str, key: str, chunk_size: int) -> Iterator[bytes]:
+    body = s3_client().get_object(Bucket=bucket, Key=key)["Body"]
+    try:
+        yield from body.iter_chunks(chunk_size)
+    finally:
+        body.close()
+
+
+def delete_object(*, bucket: str, key: str) -> None:
+    s3_client().delete_object(Bucket=bucket, Key=key)
+
+
+def delete_objects(*, bucket: str, keys: List[str]) -> None:
+    """Batch delete, 1000 keys per request; keys that do not exist are ignored."""
+    for start in range(0, len(keys), 1000):
+        s3_client().delete_objects(
+            Bucket=bucket,
+            Delete={"Objects": [{"Key": key} for key in keys[start : start + 1000]], "Quiet": True},
+        )
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import logging
+from typing import Iterable, Iterator, Optional
+from uuid import UUID
+
+from prometheus_client import REGISTRY, CollectorRegistry, generate_latest
+from prometheus_client.core import GaugeMetricFamily
+from prometheus_client.registry import Collector
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.core.metrics import StageMetric
+from app.services.meta import recent_stage_metrics, record_stage_metrics
+
+logger = logging.getLogger(__name__)
+
+LABELS = ["component", "stage", "subject"]
+
+
+class PersistedStageCollector(Collector):
+    """
+    Exposes the last persisted observation of every stage, including the ones
+    recorded by the bronze loader and the DAG, which run outside this process.
+    """
+
+    def collect(self) -> Iterator[GaugeMetricFamily]:
+        up = GaugeMetricFamily(
+            "letterboxd_pipeline_metrics_up",
+            "Whether persisted stage metrics could be read from the metadata database.",
+        )
+        try:
+            metrics = recent_stage_metrics()
+        except SQLAlchemyError:
+            logger.warning("Could not read persisted stage metrics", exc_info=True)
+            up.add_metric([], 0)
+            yield up
+            return
+        up.add_metric([], 1)
+        yield up
+
+        duration = GaugeMetricFamily(
+            "letterboxd_pipeline_stage_last_duration_seconds",
+            "Duration of the last recorded run of a pipeline stage.",
+            labels=LABELS,
+        )
+        rows = GaugeMetricFamily(
+            "letterboxd_pipeline_stage_last_rows",
+            "Rows processed by the last recorded run of a pipeline stage.",
+            labels=LABELS,
+        )
+        size = GaugeMetricFamily(
+            "letterboxd_pipeline_stage_last_bytes",
+            "Bytes processed by the last recorded run of a pipeline stage.",
+            labels=LABELS,
+        )
+        recorded = GaugeMetricFamily(
+            "letterboxd_pipeline_stage_last_recorded_timestamp_seconds",
+            "When the last run of a pipeline stage was recorded.",
+            labels=LABELS,
+        )
+        for metric in metrics:
+            labels = [metric["component"], metric["stage"], metric["subject"] or ""]
+            duration.add_metric(labels, metric["duration_ms"] / 1000)
+            recorded.add_metric(labels, metric["recorded_at"].timestamp())
+            if metric["rows_processed"] is not None:
+                rows.add_metric(labels, metric["rows_processed"])
+            if metric["bytes_processed"] is not None:
+                size.add_metric(labels, metric["bytes_processed"])
+
+        yield duration
+        yield rows
+        yield size
+        yield recorded
+
+
+persisted_registry = CollectorRegistry(auto_describe=False)
+persisted_registry.register(PersistedStageCollector())
+
+
+def render_metrics() -> bytes:
+    """In-process metrics followed by the persisted pipeline metrics, in the text exposition format."""
+    return generate_latest(REGISTRY) + generate_latest(persisted_registry)
+
+
+def persist_stage_metrics(metrics: Iterable[StageMetric], *, ingestion_id: Optional[UUID] = None) -> None:
+    """Best effort: losing a timing row must never fail an ingest."""
+    rows = [metric.as_row(ingestion_id=ingestion_id) for metric in metrics]
+    try:
+        record_stage_metrics(rows)
+    except SQLAlchemyError:
+        logger.warning("Could not persist %s stage metrics", len(rows), exc_info=True)
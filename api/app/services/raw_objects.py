@@ -0,0 +1,179 @@
+import hashlib
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import BinaryIO, Iterator, Optional, Tuple
+from uuid import UUID
+
+from app.core.config import get_settings
+from app.core.metrics import StageMetric, StageTimer
+from app.services.datasets import infer_dataset
+from app.services.meta import find_duplicate_upload, find_uploaded_content
+from app.services.minio_client import (
+    abort_multipart_upload,
+    complete_multipart_upload,
+    create_multipart_upload,
+    put_object,
+    upload_part,
+)
+
+
+class EmptyUploadError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class RawObject:
+    original_filename: str
+    object_key: str
+    size_bytes: int
+    sha256: str
+    content_type: Optional[str]
+    dataset: Optional[str]
+    # Set when the dataset's newest upload has identical content; nothing was written to MinIO.
+    duplicate_of: Optional[UUID] = None
+    # Set when an older upload of the dataset holds this content; its object is reused.
+    reused_from: Optional[UUID] = None
+    stage_metrics: Tuple[StageMetric, ...] = field(default=(), compare=False, repr=False)
+
+
+def hash_stream(fileobj: BinaryIO, chunk_size: int) -> Tuple[int, str]:
+    """Read the stream once in fixed-size chunks for its size and SHA-256, then rewind it."""
+    digest = hashlib.sha256()
+    size_bytes = 0
+    while chunk := fileobj.read(chunk_size):
+        digest.update(chunk)
+        size_bytes += len(chunk)
+    fileobj.seek(0)
+    return size_bytes, digest.hexdigest()
+
+
+def build_object_key(filename: str, sha256: str) -> str:
+    ts = datetime.now(timezone.utc).strftime("%Y/%m/%d/%H%M%S")
+    safe_name = filename.replace(" ", "_")
+    return f"letterboxd/{ts}_{sha256[:12]}_{safe_name}"
+
+
+def _iter_parts(fileobj: BinaryIO, chunk_size: int, part_size: int) -> Iterator[bytes]:
+    buffer = bytearray()
+    while chunk := fileobj.read(chunk_size):
+        buffer.extend(chunk)
+        while len(buffer) >= part_size:
+            yield bytes(buffer[:part_size])
+            del buffer[:part_size]
+    if buffer:
+        yield bytes(buffer)
+
+
+def upload_stream(
+    fileobj: BinaryIO,
+    *,
+    bucket: str,
+    object_key: str,
+    content_type: str,
+    size_bytes: int,
+    sha256: str,
+) -> None:
+    """Send the stream to MinIO; peak memory is bounded by the multipart part size."""
+    settings = get_settings()
+    # The bronze loader reads this back to skip content it has already loaded.
+    metadata = {"sha256": sha256}
+
+    # Small files fit in a single part, so skip the multipart round trips.
+    if size_bytes <= settings.multipart_part_size_bytes:
+        put_object(
+            bucket=bucket,
+            key=object_key,
+            data=fileobj.read(),
+            content_type=content_type,
+            metadata=metadata,
+        )
+        return
+
+    upload_id = create_multipart_upload(
+        bucket=bucket,
+        key=object_key,
+        content_type=content_type,
+        metadata=metadata,
+    )
+    try:
+        parts = [
+            upload_part(
+                bucket=bucket,
+                key=object_key,
+                upload_id=upload_id,
+                part_number=part_number,
+                data=data,
+            )
+            for part_number, data in enumerate(
+                _iter_parts(
+                    fileobj,
+                    chunk_size=settings.upload_chunk_size_bytes,
+                    part_size=settings.multipart_part_size_bytes,
+                ),
+                start=1,
+            )
+        ]
+        complete_multipart_upload(bucket=bucket, key=object_key, upload_id=upload_id, parts=parts)
+    except Exception:
+        abort_multipart_upload(bucket=bucket, key=object_key, upload_id=upload_id)
+        raise
+
+
+def store_raw_object(
+    fileobj: BinaryIO,
+    *,
+    bucket: str,
+    filename: str,
+    content_type: Optional[str],
+) -> RawObject:
+    """
+    Hash and upload one CSV, unless identical content is already in the bucket:
+    it is a duplicate of the dataset's newest upload, or reuses the object of
+    an older one. Blocking; callers on the event loop go through run_blocking.
+    """
+    dataset = infer_dataset(filename)
+    timer = StageTimer(subject=dataset)
+
+    with timer.stage("hash") as metric:
+        size_bytes, sha256 = hash_stream(fileobj, chunk_size=get_settings().upload_chunk_size_bytes)
+        metric.bytes = size_bytes
+    if size_bytes == 0:
+        raise EmptyUploadError(f"{filename} is empty")
+
+    with timer.stage("dedupe_lookup"):
+        duplicate = find_duplicate_upload(bucket=bucket, dataset=dataset, sha256=sha256)
+        stored = None if duplicate is not None else find_uploaded_content(bucket=bucket, dataset=dataset, sha256=sha256)
+    if duplicate is not None or stored is not None:
+        ingestion_id, object_key = duplicate or stored
+        return RawObject(
+            original_filename=filename,
+            object_key=object_key,
+            size_bytes=size_bytes,
+            sha256=sha256,
+            content_type=content_type,
+            dataset=dataset,
+            duplicate_of=ingestion_id if duplicate is not None else None,
+            reused_from=ingestion_id if stored is not None else None,
+            stage_metrics=tuple(timer.metrics),
+        )
+
+    object_key = build_object_key(filename, sha256)
+    with timer.stage("s3_upload", object_key=object_key) as metric:
+        upload_stream(
+            fileobj,
+            bucket=bucket,
+            object_key=object_key,
+            content_type=content_type or "text/csv",
+            size_bytes=size_bytes,
+            sha256=sha256,
+        )
+        metric.bytes = size_bytes
+    return RawObject(
+        original_filename=filename,
+        object_key=object_key,
+        size_bytes=size_bytes,
+        sha256=sha256,
+        content_type=content_type,
+        dataset=dataset,
+        stage_metrics=tuple(timer.metrics),
+    )
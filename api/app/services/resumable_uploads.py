@@ -0,0 +1,405 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import math
+import re
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+from uuid import UUID, uuid4
+
+from botocore.exceptions import ClientError
+
+from app.core.config import get_settings
+from app.core.executor import run_blocking
+from app.core.metrics import StageMetric, StageTimer
+from app.services.datasets import infer_dataset
+from app.services.meta import (
+    create_upload_session,
+    find_duplicate_upload,
+    find_resumable_upload_session,
+    find_uploaded_content,
+    finish_upload_session,
+    load_upload_session,
+    stale_upload_sessions,
+    update_upload_session_status,
+    upsert_ingestion_run,
+)
+from app.services.minio_client import (
+    abort_multipart_upload,
+    complete_multipart_upload,
+    create_multipart_upload,
+    delete_object,
+    iter_object_chunks,
+    list_uploaded_parts,
+    object_exists,
+    upload_part,
+)
+from app.services.raw_objects import build_object_key
+
+SHA256_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+# Sessions aborted per sweep query; the loop repeats until none are left.
+SWEEP_BATCH_SIZE = 100
+
+logger = logging.getLogger(__name__)
+
+
+class UploadSessionNotFound(LookupError):
+    pass
+
+
+class UploadSessionConflict(ValueError):
+    """The session cannot take this request in its current state (closed, or parts missing)."""
+
+
+class InvalidPartError(ValueError):
+    pass
+
+
+class ChecksumMismatchError(ValueError):
+    pass
+
+
+def part_count(upload_session: Mapping[str, Any]) -> int:
+    return math.ceil(upload_session["size_bytes"] / upload_session["part_size_bytes"])
+
+
+def expected_part_size(upload_session: Mapping[str, Any], part_number: int) -> int:
+    part_size = upload_session["part_size_bytes"]
+    if part_number < part_count(upload_session):
+        return part_size
+    return upload_session["size_bytes"] - part_size * (part_number - 1)
+
+
+def _session_payload(upload_session: Mapping[str, Any], received: List[Dict[str, object]]) -> Dict[str, Any]:
+    return {
+        "status": upload_session["status"],
+        "upload_id": str(upload_session["upload_id"]),
+        "object_key": upload_session["object_key"],
+        "size_bytes": upload_session["size_bytes"],
+        "sha256": upload_session["sha256"],
+        "part_size_bytes": upload_session["part_size_bytes"],
+        "part_count": part_count(upload_session),
+        "received_parts": [part["PartNumber"] for part in received],
+        "received_bytes": sum(part["Size"] for part in received),
+    }
+
+
+def _duplicate_payload(
+    duplicate: Tuple[UUID, str],
+    *,
+    bucket: str,
+    size_bytes: int,
+    sha256: str,
+) -> Dict[str, Any]:
+    ingestion_id, object_key = duplicate
+    return {
+        "status": "duplicate",
+        "ingestion_id": str(ingestion_id),
+        "bucket": bucket,
+        "object_key": object_key,
+        "size_bytes": size_bytes,
+        "sha256": sha256,
+    }
+
+
+def _is_missing_upload(exc: ClientError) -> bool:
+    return exc.response.get("Error", {}).get("Code") in {"NoSuchUpload", "404"}
+
+
+def _load(upload_id: UUID) -> Dict[str, Any]:
+    upload_session = load_upload_session(upload_id)
+    if upload_session is None:
+        raise UploadSessionNotFound(f"Unknown upload session {upload_id}")
+    return upload_session
+
+
+def _load_open(upload_id: UUID) -> Dict[str, Any]:
+    upload_session = _load(upload_id)
+    if upload_session["status"] != "open":
+        raise UploadSessionConflict(f"Upload session {upload_id} is {upload_session['status']}")
+    return upload_session
+
+
+def _received_parts(upload_session: Mapping[str, Any]) -> List[Dict[str, object]]:
+    return list_uploaded_parts(
+        bucket=upload_session["bucket"],
+        key=upload_session["object_key"],
+        upload_id=upload_session["s3_upload_id"],
+    )
+
+
+def start_upload_session(
+    *,
+    bucket: str,
+    filename: str,
+    size_bytes: int,
+    sha256: str,
+    content_type: Optional[str],
+    source: str,
+) -> Dict[str, Any]:
+    """
+    Open a session backed by one S3 multipart upload. Content matching the
+    dataset's newest upload is reported as a duplicate, content an older upload
+    holds is recorded at once as a new run on that object, and an open session
+    for the same file is resumed rather than started again.
+    """
+    sha256 = sha256.lower()
+    if not SHA256_PATTERN.match(sha256):
+        raise ValueError("sha256 must be 64 hex characters")
+    if size_bytes <= 0:
+        raise ValueError(f"{filename} is empty")
+
+    dataset = infer_dataset(filename)
+    duplicate = find_duplicate_upload(bucket=bucket, dataset=dataset, sha256=sha256)
+    if duplicate is not None:
+        return _duplicate_payload(duplicate, bucket=bucket, size_bytes=size_bytes, sha256=sha256)
+
+    content_type = content_type or "text/csv"
+    stored = find_uploaded_content(bucket=bucket, dataset=dataset, sha256=sha256)
+    if stored is not None:
+        ingestion_id, object_key = uuid4(), stored[1]
+        returned_id = upsert_ingestion_run(
+            ingestion_id=ingestion_id,
+            source=source,
+            dataset=dataset,
+            original_filename=filename,
+            bucket=bucket,
+            object_key=object_key,
+            size_bytes=size_bytes,
+            sha256=sha256,
+            content_type=content_type,
+        )
+        if returned_id != ingestion_id:
+            # A concurrent upload recorded this content first.
+            duplicate = find_uploaded_content(bucket=bucket, dataset=dataset, sha256=sha256) or (returned_id, object_key)
+            return _duplicate_payload(duplicate, bucket=bucket, size_bytes=size_bytes, sha256=sha256)
+        return {
+            "status": "ok",
+            "ingestion_id": str(ingestion_id),
+            "bucket": bucket,
+            "object_key": object_key,
+            "size_bytes": size_bytes,
+            "sha256": sha256,
+        }
+
+    existing = find_resumable_upload_session(
+        bucket=bucket,
+        sha256=sha256,
+        size_bytes=size_bytes,
+        original_filename=filename,
+    )
+    if existing is not None:
+        try:
+            return _session_payload(existing, _received_parts(existing))
+        except ClientError as exc:
+            if not _is_missing_upload(exc):
+                raise
+            # The multipart upload was aborted (by the expiry sweep, or in MinIO); start over.
+            update_upload_session_status(existing["upload_id"], "aborted")
+
+    object_key = build_object_key(filename, sha256)
+    s3_upload_id = create_multipart_upload(
+        bucket=bucket,
+        key=object_key,
+        content_type=content_type,
+        # The bronze loader reads this back to skip content it has already loaded.
+        metadata={"sha256": sha256},
+    )
+    upload_session = create_upload_session(
+        {
+            "upload_id": uuid4(),
+            "ingestion_id": uuid4(),
+            "s3_upload_id": s3_upload_id,
+            "bucket": bucket,
+            "object_key": object_key,
+            "original_filename": filename,
+            "content_type": content_type,
+            "dataset": dataset,
+            "size_bytes": size_bytes,
+            "sha256": sha256,
+            "part_size_bytes": get_settings().multipart_part_size_bytes,
+            "status": "open",
+        }
+    )
+    return _session_payload(upload_session, [])
+
+
+def upload_session_state(upload_id: UUID) -> Dict[str, Any]:
+    """The session and the parts MinIO already holds for it."""
+    upload_session = _load(upload_id)
+    received: List[Dict[str, object]] = []
+    if upload_session["status"] == "open":
+        try:
+            received = _received_parts(upload_session)
+        except ClientError as exc:
+            if not _is_missing_upload(exc):
+                raise
+    return _session_payload(upload_session, received)
+
+
+def store_session_part(upload_id: UUID, part_number: int, data: bytes) -> Dict[str, Any]:
+    """Upload one part; sending a part again simply replaces it."""
+    upload_session = _load_open(upload_id)
+    count = part_count(upload_session)
+    if not 1 <= part_number <= count:
+        raise InvalidPartError(f"Part number must be between 1 and {count}")
+    expected = expected_part_size(upload_session, part_number)
+    if len(data) != expected:
+        raise InvalidPartError(f"Part {part_number} must be {expected} bytes, got {len(data)}")
+
+    part = upload_part(
+        bucket=upload_session["bucket"],
+        key=upload_session["object_key"],
+        upload_id=upload_session["s3_upload_id"],
+        part_number=part_number,
+        data=data,
+    )
+    return {"upload_id": str(upload_id), "part_number": part_number, "etag": part["ETag"], "size_bytes": len(data)}
+
+
+def _sha256_of_object(bucket: str, key: str) -> str:
+    digest = hashlib.sha256()
+    for chunk in iter_object_chunks(bucket=bucket, key=key, chunk_size=get_settings().upload_chunk_size_bytes):
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+def complete_upload_session(upload_id: UUID, *, source: str) -> Tuple[Dict[str, Any], Tuple[StageMetric, ...]]:
+    """
+    Assemble the parts, check the object against the SHA-256 the client
+    declared, then record the ingestion run. If another upload recorded the
+    same content meanwhile, this object is deleted and the result points at
+    that run. Safe to retry: a closed session returns its result again.
+    """
+    upload_session = _load(upload_id)
+    bucket, object_key = upload_session["bucket"], upload_session["object_key"]
+    if upload_session["status"] == "duplicate":
+        return _recorded_duplicate(upload_session), ()
+    result = {
+        "status": "ok",
+        "upload_id": str(upload_id),
+        "ingestion_id": str(upload_session["ingestion_id"]),
+        "bucket": upload_session["bucket"],
+        "object_key": upload_session["object_key"],
+        "size_bytes": upload_session["size_bytes"],
+        "sha256": upload_session["sha256"],
+    }
+    if upload_session["status"] == "completed":
+        return result, ()
+    if upload_session["status"] != "open":
+        raise UploadSessionConflict(f"Upload session {upload_id} is {upload_session['status']}")
+
+    timer = StageTimer(subject=upload_session["dataset"])
+
+    with timer.stage("s3_complete", object_key=object_key) as metric:
+        try:
+            received = _received_parts(upload_session)
+        except ClientError as exc:
+            # An earlier attempt assembled the object but failed before recording it.
+            if not (_is_missing_upload(exc) and object_exists(bucket=bucket, key=object_key)):
+                raise
+            received = None
+
+        if received is not None:
+            sizes = {part["PartNumber"]: part["Size"] for part in received}
+            missing = [
+                part_number
+                for part_number in range(1, part_count(upload_session) + 1)
+                if sizes.get(part_number) != expected_part_size(upload_session, part_number)
+            ]
+            if missing:
+                raise UploadSessionConflict(f"Parts missing or incomplete: {missing}")
+            complete_multipart_upload(
+                bucket=bucket,
+                key=object_key,
+                upload_id=upload_session["s3_upload_id"],
+                parts=[{"PartNumber": part["PartNumber"], "ETag": part["ETag"]} for part in received],
+            )
+        metric.bytes = upload_session["size_bytes"]
+
+    with timer.stage("verify_sha256", object_key=object_key) as metric:
+        actual = _sha256_of_object(bucket, object_key)
+        metric.bytes = upload_session["size_bytes"]
+    if actual != upload_session["sha256"]:
+        delete_object(bucket=bucket, key=object_key)
+        update_upload_session_status(upload_id, "failed")
+        raise ChecksumMismatchError(
+            f"Assembled object has sha256 {actual}, expected {upload_session['sha256']}; upload it again"
+        )
+
+    with timer.stage("metadata_write", object_key=object_key):
+        ingestion_id = finish_upload_session(upload_session, source=source)
+    if ingestion_id != upload_session["ingestion_id"]:
+        return _recorded_duplicate(upload_session), tuple(timer.metrics)
+    return result, tuple(timer.metrics)
+
+
+def _recorded_duplicate(upload_session: Mapping[str, Any]) -> Dict[str, Any]:
+    """Result of a session closed as a duplicate; its own object is deleted unless the recorded run shares the key."""
+    bucket, object_key = upload_session["bucket"], upload_session["object_key"]
+    duplicate = find_uploaded_content(bucket=bucket, dataset=upload_session["dataset"], sha256=upload_session["sha256"])
+    if duplicate is None:
+        raise UploadSessionConflict(f"Upload session {upload_session['upload_id']} duplicated a run that no longer exists")
+    if duplicate[1] != object_key:
+        delete_object(bucket=bucket, key=object_key)
+    payload = _duplicate_payload(
+        duplicate,
+        bucket=bucket,
+        size_bytes=upload_session["size_bytes"],
+        sha256=upload_session["sha256"],
+    )
+    return {**payload, "upload_id": str(upload_session["upload_id"])}
+
+
+def abort_upload_session(upload_id: UUID) -> None:
+    upload_session = _load_open(upload_id)
+    try:
+        abort_multipart_upload(
+            bucket=upload_session["bucket"],
+            key=upload_session["object_key"],
+            upload_id=upload_session["s3_upload_id"],
+        )
+    except ClientError as exc:
+        if not _is_missing_upload(exc):
+            raise
+    update_upload_session_status(upload_id, "aborted")
+
+
+def expire_stale_upload_sessions() -> int:
+    """
+    Abort the multipart uploads of sessions still open after
+    UPLOAD_SESSION_EXPIRY_HOURS, so abandoned parts stop using storage, and
+    mark them expired. Returns how many sessions were expired.
+    """
+    cutoff = datetime.now(timezone.utc) - timedelta(hours=get_settings().upload_session_expiry_hours)
+    expired = 0
+    while True:
+        stale = stale_upload_sessions(created_before=cutoff, limit=SWEEP_BATCH_SIZE)
+        for upload_session in stale:
+            try:
+                abort_multipart_upload(
+                    bucket=upload_session["bucket"],
+                    key=upload_session["object_key"],
+                    upload_id=upload_session["s3_upload_id"],
+                )
+            except ClientError as exc:
+                if not _is_missing_upload(exc):
+                    raise
+            update_upload_session_status(upload_session["upload_id"], "expired")
+            expired += 1
+        if len(stale) < SWEEP_BATCH_SIZE:
+            return expired
+
+
+async def sweep_stale_upload_sessions(interval_seconds: float) -> None:
+    """Background loop started by the app lifespan; a failed sweep is retried on the next interval."""
+    while True:
+        try:
+            expired = await run_blocking(expire_stale_upload_sessions)
+            if expired:
+                logger.info("Expired %s abandoned upload sessions", expired)
+        except Exception:
+            logger.warning("Upload session sweep failed", exc_info=True)
+        await asyncio.sleep(interval_seconds)
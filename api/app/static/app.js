@@ -12,6 +12,110 @@ const fileMessage = document.getElementById("fileMessage");
 
 let fallbackFile = null;
 
+// Resumable uploads: parts sent at once, and attempts per part before giving up.
+const PART_CONCURRENCY = 4;
+const PART_ATTEMPTS = 3;
+const COMPLETE_ROUNDS = 3;
+// Bytes read into memory at a time while checksumming a file.
+const HASH_CHUNK_BYTES = 4 * 1024 * 1024;
+
+const SHA256_K = Uint32Array.of(
+  0x428a2f98, 0x71374491, 0xb5c0fbcf, 0xe9b5dba5, 0x3956c25b, 0x59f111f1, 0x923f82a4, 0xab1c5ed5,
+  0xd807aa98, 0x12835b01, 0x243185be, 0x550c7dc3, 0x72be5d74, 0x80deb1fe, 0x9bdc06a7, 0xc19bf174,
+  0xe49b69c1, 0xefbe4786, 0x0fc19dc6, 0x240ca1cc, 0x2de92c6f, 0x4a7484aa, 0x5cb0a9dc, 0x76f988da,
+  0x983e5152, 0xa831c66d, 0xb00327c8, 0xbf597fc7, 0xc6e00bf3, 0xd5a79147, 0x06ca6351, 0x14292967,
+  0x27b70a85, 0x2e1b2138, 0x4d2c6dfc, 0x53380d13, 0x650a7354, 0x766a0abb, 0x81c2c92e, 0x92722c85,
+  0xa2bfe8a1, 0xa81a664b, 0xc24b8b70, 0xc76c51a3, 0xd192e819, 0xd6990624, 0xf40e3585, 0x106aa070,
+  0x19a4c116, 0x1e376c08, 0x2748774c, 0x34b0bcb5, 0x391c0cb3, 0x4ed8aa4a, 0x5b9cca4f, 0x682e6ff3,
+  0x748f82ee, 0x78a5636f, 0x84c87814, 0x8cc70208, 0x90befffa, 0xa4506ceb, 0xbef9a3f7, 0xc67178f2,
+);
+
+// Incremental SHA-256: Web Crypto only digests a whole buffer, which would
+// mean holding the entire file in memory.
+class Sha256 {
+  constructor() {
+    this.state = Uint32Array.of(
+      0x6a09e667, 0xbb67ae85, 0x3c6ef372, 0xa54ff53a, 0x510e527f, 0x9b05688c, 0x1f83d9ab, 0x5be0cd19,
+    );
+    this.words = new Uint32Array(64);
+    this.block = new Uint8Array(64);
+    this.blockLength = 0;
+    this.byteLength = 0;
+  }
+
+  update(bytes) {
+    this.byteLength += bytes.length;
+    let offset = 0;
+    if (this.blockLength > 0) {
+      offset = Math.min(64 - this.blockLength, bytes.length);
+      this.block.set(bytes.subarray(0, offset), this.blockLength);
+      this.blockLength += offset;
+      if (this.blockLength < 64) {
+        return;
+      }
+      this.compress(this.block, 0);
+      this.blockLength = 0;
+    }
+    for (; offset + 64 <= bytes.length; offset += 64) {
+      this.compress(bytes, offset);
+    }
+    this.block.set(bytes.subarray(offset));
+    this.blockLength = bytes.length - offset;
+  }
+
+  hexDigest() {
+    const bitLength = this.byteLength * 8;
+    const padding = new Uint8Array((this.blockLength < 56 ? 64 : 128) - this.blockLength);
+    const view = new DataView(padding.buffer);
+    padding[0] = 0x80;
+    view.setUint32(padding.length - 8, Math.floor(bitLength / 2 ** 32));
+    view.setUint32(padding.length - 4, bitLength >>> 0);
+    this.update(padding);
+    return Array.from(this.state, (word) => word.toString(16).padStart(8, "0")).join("");
+  }
+
+  compress(bytes, offset) {
+    const w = this.words;
+    for (let i = 0; i < 16; i += 1) {
+      const at = offset + i * 4;
+      w[i] = (bytes[at] << 24) | (bytes[at + 1] << 16) | (bytes[at + 2] << 8) | bytes[at + 3];
+    }
+    for (let i = 16; i < 64; i += 1) {
+      const x = w[i - 15];
+      const y = w[i - 2];
+      const s0 = ((x >>> 7) | (x << 25)) ^ ((x >>> 18) | (x << 14)) ^ (x >>> 3);
+      const s1 = ((y >>> 17) | (y << 15)) ^ ((y >>> 19) | (y << 13)) ^ (y >>> 10);
+      w[i] = w[i - 16] + s0 + w[i - 7] + s1;
+    }
+
+    let [a, b, c, d, e, f, g, h] = this.state;
+    for (let i = 0; i < 64; i += 1) {
+      const S1 = ((e >>> 6) | (e << 26)) ^ ((e >>> 11) | (e << 21)) ^ ((e >>> 25) | (e << 7));
+      const t1 = (h + S1 + ((e & f) ^ (~e & g)) + SHA256_K[i] + w[i]) | 0;
+      const S0 = ((a >>> 2) | (a << 30)) ^ ((a >>> 13) | (a << 19)) ^ ((a >>> 22) | (a << 10));
+      const t2 = (S0 + ((a & b) ^ (a & c) ^ (b & c))) | 0;
+      h = g;
+      g = f;
+      f = e;
+      e = (d + t1) | 0;
+      d = c;
+      c = b;
+      b = a;
+      a = (t1 + t2) | 0;
+    }
+
+    const state = this.state;
+    state[0] += a;
+    state[1] += b;
+    state[2] += c;
+    state[3] += d;
+    state[4] += e;
+    state[5] += f;
+    state[6] += g;
+    state[7] += h;
+  }
+}
+
 function formatFileSize(sizeBytes) {
   if (!Number.isFinite(sizeBytes) || sizeBytes < 1024) {
     return `${sizeBytes || 0} B`;
@@ -118,6 +222,139 @@ function syncSelectedFile(fileList) {
   showFieldMessage(selectedFile ? validateFile(selectedFile) : "");
 }
 
+function supportsResumableUpload() {
+  return Boolean(Blob.prototype.slice && Blob.prototype.arrayBuffer);
+}
+
+function sleep(ms) {
+  return new Promise((resolve) => setTimeout(resolve, ms));
+}
+
+async function readJson(response) {
+  return response.json().catch(() => ({
+    detail: "The API returned an unexpected response.",
+  }));
+}
+
+async function requestJson(url, options = {}) {
+  const response = await fetch(url, options);
+  return { response, data: await readJson(response) };
+}
+
+async function sha256Hex(file) {
+  const hash = new Sha256();
+  for (let start = 0; start < file.size; start += HASH_CHUNK_BYTES) {
+    const chunk = file.slice(start, Math.min(start + HASH_CHUNK_BYTES, file.size));
+    hash.update(new Uint8Array(await chunk.arrayBuffer()));
+    const percent = Math.floor((Math.min(start + HASH_CHUNK_BYTES, file.size) / file.size) * 100);
+    showStatus(`Checksumming ${file.name}: ${percent}%`, "loading");
+  }
+  return hash.hexDigest();
+}
+
+async function uploadWholeFile(file) {
+  const formData = new FormData();
+  formData.append("file", file);
+  return requestJson("/ingest/letterboxd/upload", {
+    method: "POST",
+    body: formData,
+  });
+}
+
+async function putPart(session, file, partNumber) {
+  const start = (partNumber - 1) * session.part_size_bytes;
+  const blob = file.slice(start, Math.min(start + session.part_size_bytes, file.size));
+
+  for (let attempt = 1; ; attempt += 1) {
+    try {
+      const response = await fetch(`/ingest/letterboxd/uploads/${session.upload_id}/parts/${partNumber}`, {
+        method: "PUT",
+        headers: { "Content-Type": "application/octet-stream" },
+        body: blob,
+      });
+      if (response.ok) {
+        return blob.size;
+      }
+      // Client errors will not get better by retrying.
+      if (response.status < 500 || attempt >= PART_ATTEMPTS) {
+        const data = await readJson(response);
+        throw new Error(data.detail || `Part ${partNumber} failed with status ${response.status}.`);
+      }
+    } catch (error) {
+      if (attempt >= PART_ATTEMPTS || !(error instanceof TypeError)) {
+        throw error;
+      }
+    }
+    await sleep(1000 * 2 ** (attempt - 1));
+  }
+}
+
+async function sendMissingParts(session, file) {
+  const received = new Set(session.received_parts);
+  const pending = [];
+  for (let partNumber = 1; partNumber <= session.part_count; partNumber += 1) {
+    if (!received.has(partNumber)) {
+      pending.push(partNumber);
+    }
+  }
+
+  let sentBytes = session.received_bytes;
+  const reportProgress = () => {
+    const percent = Math.floor((sentBytes / file.size) * 100);
+    showStatus(`Uploading ${file.name}: ${percent}% (${formatFileSize(sentBytes)} of ${formatFileSize(file.size)})`, "loading");
+  };
+  reportProgress();
+
+  const worker = async () => {
+    while (pending.length > 0) {
+      sentBytes += await putPart(session, file, pending.shift());
+      reportProgress();
+    }
+  };
+  await Promise.all(Array.from({ length: Math.min(PART_CONCURRENCY, pending.length) }, worker));
+}
+
+async function uploadResumable(file) {
+  showStatus(`Checksumming ${file.name}...`, "loading");
+  const sha256 = await sha256Hex(file);
+
+  // Resumes the open session for this file if an earlier attempt was interrupted.
+  const started = await requestJson("/ingest/letterboxd/uploads", {
+    method: "POST",
+    headers: { "Content-Type": "application/json" },
+    body: JSON.stringify({
+      filename: file.name,
+      size_bytes: file.size,
+      sha256,
+      content_type: file.type || "text/csv",
+    }),
+  });
+  // Content the server already holds is recorded without sending any parts.
+  if (!started.response.ok || started.data.status !== "open") {
+    return started;
+  }
+
+  let session = started.data;
+  for (let round = 1; ; round += 1) {
+    await sendMissingParts(session, file);
+
+    showStatus("Assembling the upload...", "loading");
+    const completed = await requestJson(`/ingest/letterboxd/uploads/${session.upload_id}/complete`, {
+      method: "POST",
+    });
+    // 409 means some parts never arrived; ask which, and send only those.
+    if (completed.response.status !== 409 || round >= COMPLETE_ROUNDS) {
+      return completed;
+    }
+
+    const state = await requestJson(`/ingest/letterboxd/uploads/${session.upload_id}`);
+    if (!state.response.ok || state.data.status !== "open") {
+      return completed;
+    }
+    session = state.data;
+  }
+}
+
 uploadForm.addEventListener("submit", async (event) => {
   event.preventDefault();
 
@@ -131,23 +368,15 @@ uploadForm.addEventListener("submit", async (event) => {
     return;
   }
 
-  const formData = new FormData();
-  formData.append("file", file);
-
   showFieldMessage("");
   clearResult();
   setUploadingState(true);
   showStatus("Uploading file to the ingestion pipeline...", "loading");
 
   try {
-    const response = await fetch("/ingest/letterboxd/upload", {
-      method: "POST",
-      body: formData,
-    });
-
-    const data = await response.json().catch(() => ({
-      detail: "The API returned an unexpected response.",
-    }));
+    const { response, data } = supportsResumableUpload()
+      ? await uploadResumable(file)
+      : await uploadWholeFile(file);
 
     if (!response.ok) {
       showStatus(data.detail || "Upload failed.", "error");
@@ -155,13 +384,21 @@ uploadForm.addEventListener("submit", async (event) => {
       return;
     }
 
-    showStatus("Upload completed successfully.", "success");
+    showStatus(
+      data.status === "duplicate" ? "This file was already uploaded." : "Upload completed successfully.",
+      "success",
+    );
     showResult(data, "success");
     uploadForm.reset();
     fallbackFile = null;
     updateFileSummary(null);
   } catch (error) {
-    showStatus("Could not connect to the API.", "error");
+    showStatus(
+      supportsResumableUpload()
+        ? "Upload interrupted. Upload the same file again to resume where it stopped."
+        : "Could not connect to the API.",
+      "error",
+    );
     showResult({ error: error.message }, "error");
   } finally {
     setUploadingState(false);
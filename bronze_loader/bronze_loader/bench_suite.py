@@ -0,0 +1,603 @@
+from __future__ import annotations
+
+import argparse
+import csv
+import http.client
+import io
+import json
+import logging
+import os
+import random
+import resource
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Callable, Iterable, Optional
+from urllib.parse import urlsplit
+from uuid import uuid4
+
+from sqlalchemy import bindparam, text
+
+from bronze_loader.loader import (
+    RAW_BUCKET,
+    WRITE_METHODS,
+    load_latest_to_bronze,
+    load_one_csv_to_bronze,
+    metadata_engine,
+    parquet_key_for,
+    s3_client,
+    stream_csv_to_bronze,
+    supported_datasets,
+)
+from bronze_loader.synthetic import iter_synthetic_rows, write_synthetic_export
+
+logger = logging.getLogger("bronze_loader.bench_suite")
+
+SUITE = "letterboxd-bench"
+SCHEMA_VERSION = 1
+SCENARIOS = ("upload", "bronze", "dbt")
+BRONZE_METHODS = (*sorted(WRITE_METHODS), "stream")
+DEFAULT_API_URL = os.getenv("LETTERBOXD_API_BASE_URL", "http://api:8000")
+DEFAULT_DBT_PROJECT_DIR = os.getenv("BENCH_DBT_PROJECT_DIR", "/opt/airflow/project/dbt")
+BENCH_PREFIX = "benchmarks/"
+
+# Rows the upload scenario leaves in the metadata database, children first.
+DELETE_RUN_ROWS_SQL = [
+    text(f"DELETE FROM public.{table} WHERE ingestion_id IN :ingestion_ids").bindparams(
+        bindparam("ingestion_ids", expanding=True)
+    )
+    for table in ("pipeline_stage_metrics", "bronze_load_jobs", "ingestion_runs")
+]
+
+
+def bench_filename(dataset: str) -> str:
+    # "<dataset>.bench.csv" maps to no dataset, so neither the ingestion_runs
+    # catalog nor the bucket walk ever treats a synthetic upload as the latest export.
+    return f"{dataset}.bench.csv"
+
+
+def peak_rss_bytes() -> int:
+    # ru_maxrss is in KiB on Linux.
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Linear-interpolated percentile, q in [0, 100]."""
+    ordered = sorted(values)
+    if len(ordered) == 1:
+        return ordered[0]
+    position = (len(ordered) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def latency_summary(latencies: list[float]) -> dict:
+    return {
+        "min": round(min(latencies), 4),
+        "p50": round(percentile(latencies, 50), 4),
+        "p90": round(percentile(latencies, 90), 4),
+        "p99": round(percentile(latencies, 99), 4),
+        "max": round(max(latencies), 4),
+        "mean": round(statistics.fmean(latencies), 4),
+    }
+
+
+def stage_summary(stage_runs: list[dict[str, float]]) -> dict[str, float]:
+    """Median seconds per stage across repeats."""
+    names = sorted({name for run in stage_runs for name in run})
+    return {
+        name: round(statistics.median(run[name] for run in stage_runs if name in run), 4)
+        for name in names
+    }
+
+
+def scenario_result(
+    *,
+    scenario: str,
+    dataset: str,
+    rows: int,
+    size_bytes: int,
+    latencies: list[float],
+    stage_runs: list[dict[str, float]],
+    **extra,
+) -> dict:
+    p50 = percentile(latencies, 50)
+    return {
+        "scenario": scenario,
+        "dataset": dataset,
+        "rows": rows,
+        "bytes": size_bytes,
+        "repeat": len(latencies),
+        "latency_seconds": latency_summary(latencies),
+        "rows_per_second": round(rows / p50, 1) if p50 else None,
+        "mb_per_second": round(size_bytes / p50 / 1_000_000, 2) if p50 and size_bytes else None,
+        "stages_p50_seconds": stage_summary(stage_runs),
+        "peak_rss_bytes": peak_rss_bytes(),
+        **extra,
+    }
+
+
+# Upload scenario -------------------------------------------------------------
+
+
+def _multipart_parts(filename: str, boundary: str) -> tuple[bytes, bytes]:
+    head = (
+        f"--{boundary}\r\n"
+        f'Content-Disposition: form-data; name="file"; filename="{filename}"\r\n'
+        "Content-Type: text/csv\r\n\r\n"
+    ).encode()
+    tail = f"\r\n--{boundary}--\r\n".encode()
+    return head, tail
+
+
+def _iter_file(path: Path, chunk_size: int = 1024 * 1024) -> Iterable[bytes]:
+    with path.open("rb") as handle:
+        while chunk := handle.read(chunk_size):
+            yield chunk
+
+
+def salt_row(dataset: str) -> bytes:
+    """One extra synthetic row with a random seed, so every repeat uploads new content."""
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(next(iter_synthetic_rows(dataset, 1, seed=random.getrandbits(64))))
+    return buffer.getvalue().encode()
+
+
+def post_export(api_url: str, path: Path, filename: str, salt: bytes) -> tuple[float, dict]:
+    """
+    Stream path (plus one salt row, so dedupe never short-circuits a repeat)
+    as a multipart upload without buffering it in memory.
+    """
+    url = urlsplit(api_url)
+    boundary = uuid4().hex
+    head, tail = _multipart_parts(filename, boundary)
+    length = len(head) + path.stat().st_size + len(salt) + len(tail)
+
+    connection_class = http.client.HTTPSConnection if url.scheme == "https" else http.client.HTTPConnection
+    connection = connection_class(url.hostname, url.port, timeout=600)
+    try:
+        started = time.perf_counter()
+        connection.putrequest("POST", f"{url.path.rstrip('/')}/ingest/letterboxd/upload")
+        connection.putheader("Content-Type", f"multipart/form-data; boundary={boundary}")
+        connection.putheader("Content-Length", str(length))
+        connection.endheaders()
+        connection.send(head)
+        for chunk in _iter_file(path):
+            connection.send(chunk)
+        connection.send(salt)
+        connection.send(tail)
+        response = connection.getresponse()
+        body = response.read()
+        elapsed = time.perf_counter() - started
+    finally:
+        connection.close()
+
+    if response.status != 200:
+        raise RuntimeError(f"Upload of {filename} failed with status={response.status} body={body[:500]!r}")
+    return elapsed, json.loads(body)
+
+
+def api_resident_memory_bytes(api_url: str) -> Optional[float]:
+    """process_resident_memory_bytes from the API's /metrics, if it is reachable."""
+    url = urlsplit(api_url)
+    connection = http.client.HTTPConnection(url.hostname, url.port, timeout=10)
+    try:
+        connection.request("GET", f"{url.path.rstrip('/')}/metrics")
+        body = connection.getresponse().read().decode()
+    except OSError:
+        return None
+    finally:
+        connection.close()
+    for line in body.splitlines():
+        if line.startswith("process_resident_memory_bytes "):
+            return float(line.split()[1])
+    return None
+
+
+def bench_upload(api_url: str, path: str, dataset: str, rows: int, repeat: int) -> dict:
+    export = Path(path)
+    latencies: list[float] = []
+    object_keys: list[str] = []
+    ingestion_ids: list[str] = []
+    try:
+        for _ in range(repeat):
+            salt = salt_row(dataset)
+            elapsed, payload = post_export(api_url, export, bench_filename(dataset), salt)
+            latencies.append(elapsed)
+            # A duplicate points at someone else's object; only what this run created is ours to delete.
+            if payload["status"] == "ok":
+                object_keys.append(payload["object_key"])
+                ingestion_ids.append(payload["ingestion_id"])
+    except BaseException:
+        delete_benchmark_artifacts(object_keys, ingestion_ids)
+        raise
+
+    return scenario_result(
+        scenario="upload",
+        dataset=dataset,
+        rows=rows,
+        size_bytes=export.stat().st_size,
+        latencies=latencies,
+        stage_runs=[],
+        object_keys=object_keys,
+        ingestion_ids=ingestion_ids,
+        api_rss_bytes=api_resident_memory_bytes(api_url),
+    )
+
+
+def put_export(path: Path, dataset: str) -> str:
+    """Place the export in MinIO directly when the upload scenario is not run."""
+    object_key = f"{BENCH_PREFIX}{uuid4().hex}_{bench_filename(dataset)}"
+    s3_client().upload_file(str(path), RAW_BUCKET, object_key, ExtraArgs={"ContentType": "text/csv"})
+    return object_key
+
+
+def delete_benchmark_artifacts(object_keys: Iterable[str], ingestion_ids: Iterable[str]) -> dict:
+    """
+    Remove what the suite put in the shared bucket and metadata database: the
+    synthetic objects, their Parquet copies and the upload scenario's
+    ingestion_runs rows (with their stage metrics).
+    """
+    object_keys = sorted(set(object_keys))
+    ingestion_ids = sorted(set(ingestion_ids))
+    keys = [*object_keys, *(parquet_key_for(object_key) for object_key in object_keys)]
+    client = s3_client()
+    for start in range(0, len(keys), 1000):
+        # Quiet: keys that were never written (e.g. no Parquet copy) are not errors.
+        client.delete_objects(
+            Bucket=RAW_BUCKET,
+            Delete={"Objects": [{"Key": key} for key in keys[start : start + 1000]], "Quiet": True},
+        )
+
+    if ingestion_ids:
+        engine = metadata_engine()
+        try:
+            with engine.begin() as connection:
+                for statement in DELETE_RUN_ROWS_SQL:
+                    connection.execute(statement, {"ingestion_ids": ingestion_ids})
+        finally:
+            engine.dispose()
+
+    return {
+        "scenario": "cleanup",
+        "objects_deleted": len(object_keys),
+        "ingestion_runs_deleted": len(ingestion_ids),
+    }
+
+
+# Bronze scenario -------------------------------------------------------------
+
+
+def bench_bronze(object_key: str, dataset: str, rows: int, size_bytes: int, repeat: int, method: str, warm: bool) -> dict:
+    latencies: list[float] = []
+    stage_runs: list[dict[str, float]] = []
+    for _ in range(repeat):
+        if not warm:
+            # Cold runs parse the CSV every time instead of reading the Parquet copy.
+            s3_client().delete_object(Bucket=RAW_BUCKET, Key=parquet_key_for(object_key))
+
+        started = time.perf_counter()
+        if method == "stream":
+            result = stream_csv_to_bronze(object_key=object_key, target_table=dataset, force=True)
+        else:
+            result = load_one_csv_to_bronze(object_key=object_key, target_table=dataset, method=method, force=True)
+        latencies.append(time.perf_counter() - started)
+        stage_runs.append({metric.stage: metric.duration_seconds for metric in result.stage_metrics})
+
+    return scenario_result(
+        scenario="bronze",
+        dataset=dataset,
+        rows=rows,
+        size_bytes=size_bytes,
+        latencies=latencies,
+        stage_runs=stage_runs,
+        method=method,
+        warm=warm,
+    )
+
+
+# dbt scenario ----------------------------------------------------------------
+
+
+def dbt_run(project_dir: str, target_path: str, select: list[str], full_refresh: bool = True):
+    from dbt.cli.main import dbtRunner
+
+    args = [
+        "run",
+        "--project-dir",
+        project_dir,
+        "--profiles-dir",
+        os.getenv("DBT_PROFILES_DIR", f"{project_dir}/profiles"),
+        "--target-path",
+        target_path,
+        "--select",
+        *select,
+    ]
+    if os.getenv("DBT_TARGET"):
+        args += ["--target", os.environ["DBT_TARGET"]]
+    if full_refresh:
+        args.append("--full-refresh")
+
+    result = dbtRunner().invoke(args)
+    if result.exception is not None:
+        raise result.exception
+    if not result.success:
+        raise RuntimeError(f"dbt run failed for selection {select}")
+    return result
+
+
+def bench_dbt(project_dir: str, target_path: str, dataset: str, rows: int, repeat: int) -> dict:
+    """Full refresh of silver_<dataset> and the gold models that depend on it."""
+    latencies: list[float] = []
+    stage_runs: list[dict[str, float]] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = dbt_run(project_dir, target_path, [f"silver_{dataset}+"])
+        latencies.append(time.perf_counter() - started)
+        stage_runs.append({node.node.name: node.execution_time for node in result.result or []})
+
+    return scenario_result(
+        scenario="dbt",
+        dataset=dataset,
+        rows=rows,
+        size_bytes=0,
+        latencies=latencies,
+        stage_runs=stage_runs,
+    )
+
+
+def restore_dbt(project_dir: str, target_path: str, datasets: list[str]) -> dict:
+    dbt_run(project_dir, target_path, [f"silver_{dataset}+" for dataset in datasets])
+    return {"scenario": "restore", "step": "dbt", "datasets": datasets, "peak_rss_bytes": peak_rss_bytes()}
+
+
+# Driver ----------------------------------------------------------------------
+
+
+def in_child(func: Callable[..., dict], *args) -> dict:
+    """Run func in a freshly spawned interpreter so peak_rss_bytes covers only that scenario."""
+    with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as executor:
+        return executor.submit(func, *args).result()
+
+
+def current_commit() -> Optional[str]:
+    if os.getenv("BENCH_COMMIT"):
+        return os.environ["BENCH_COMMIT"]
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def emit(record: dict, run_info: dict, output) -> None:
+    line = json.dumps({**run_info, **record}, sort_keys=True)
+    print(line)
+    if output is not None:
+        output.write(line + "\n")
+        output.flush()
+
+
+def restore_bronze(datasets: list[str]) -> dict:
+    restored, missing = [], []
+    for dataset in datasets:
+        try:
+            load_latest_to_bronze(dataset)
+        except FileNotFoundError:
+            missing.append(dataset)
+            continue
+        restored.append(dataset)
+    if missing:
+        logger.warning("No real export found for %s; their bronze tables keep synthetic rows", missing)
+    return {"scenario": "restore", "step": "bronze", "datasets": restored, "missing": missing}
+
+
+def run_suite(args: argparse.Namespace) -> int:
+    scenarios = args.scenario or list(SCENARIOS)
+    datasets = args.dataset or supported_datasets()
+    run_info = {
+        "suite": SUITE,
+        "schema_version": SCHEMA_VERSION,
+        "run_id": uuid4().hex,
+        "commit": current_commit(),
+        "started_at": datetime.now(timezone.utc).isoformat(),
+    }
+    own_work_dir = args.work_dir is None
+    work_dir = Path(args.work_dir or tempfile.mkdtemp(prefix="letterboxd-bench-"))
+    dbt_target_path = str(work_dir / "dbt-target")
+    output = None
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        output = open(args.output, "a", encoding="utf-8")
+
+    touched_bronze: set[str] = set()
+    created_keys: list[str] = []
+    created_ingestion_ids: list[str] = []
+    try:
+        for rows in args.rows:
+            for dataset in datasets:
+                export = work_dir / f"{dataset}_{rows}.csv"
+                size_bytes = write_synthetic_export(export, dataset, rows, seed=args.seed)
+                logger.info("Generated %s rows (%s bytes) for %s at %s", rows, size_bytes, dataset, export)
+
+                object_key = None
+                if "upload" in scenarios:
+                    result = in_child(bench_upload, args.api_url, str(export), dataset, rows, args.repeat)
+                    created_keys.extend(result.pop("object_keys"))
+                    created_ingestion_ids.extend(result.pop("ingestion_ids"))
+                    object_key = created_keys[-1] if created_keys else None
+                    emit(result, run_info, output)
+
+                if "bronze" in scenarios or "dbt" in scenarios:
+                    if object_key is None:
+                        object_key = put_export(export, dataset)
+                        created_keys.append(object_key)
+                    touched_bronze.add(dataset)
+                if "bronze" in scenarios:
+                    emit(
+                        in_child(
+                            bench_bronze,
+                            object_key,
+                            dataset,
+                            rows,
+                            size_bytes,
+                            args.repeat,
+                            args.method,
+                            args.warm,
+                        ),
+                        run_info,
+                        output,
+                    )
+                elif "dbt" in scenarios:
+                    load_one_csv_to_bronze(object_key=object_key, target_table=dataset, force=True)
+
+                if "dbt" in scenarios:
+                    emit(
+                        in_child(bench_dbt, args.project_dir, dbt_target_path, dataset, rows, args.repeat),
+                        run_info,
+                        output,
+                    )
+
+                if not args.keep_files:
+                    export.unlink(missing_ok=True)
+    finally:
+        if touched_bronze and args.restore:
+            emit(restore_bronze(sorted(touched_bronze)), run_info, output)
+            if "dbt" in scenarios:
+                emit(
+                    in_child(restore_dbt, args.project_dir, dbt_target_path, sorted(touched_bronze)),
+                    run_info,
+                    output,
+                )
+        if created_keys or created_ingestion_ids:
+            emit(delete_benchmark_artifacts(created_keys, created_ingestion_ids), run_info, output)
+        if own_work_dir and not args.keep_files:
+            shutil.rmtree(work_dir, ignore_errors=True)
+        if output is not None:
+            output.close()
+    return 0
+
+
+# Compare ---------------------------------------------------------------------
+
+
+def read_results(path: str) -> dict[tuple, dict]:
+    results = {}
+    with open(path, encoding="utf-8") as handle:
+        for line in handle:
+            record = json.loads(line)
+            if record.get("scenario") not in SCENARIOS:
+                continue
+            key = (record["scenario"], record["dataset"], record["rows"], record.get("method"))
+            # The newest run in the file wins.
+            results[key] = record
+    return results
+
+
+def compare(baseline_path: str, candidate_path: str) -> int:
+    baseline = read_results(baseline_path)
+    candidate = read_results(candidate_path)
+    for key in sorted(baseline.keys() & candidate.keys(), key=str):
+        before, after = baseline[key], candidate[key]
+        scenario, dataset, rows, method = key
+        print(
+            json.dumps(
+                {
+                    "scenario": scenario,
+                    "dataset": dataset,
+                    "rows": rows,
+                    "method": method,
+                    "baseline_commit": before.get("commit"),
+                    "candidate_commit": after.get("commit"),
+                    "rows_per_second_ratio": _ratio(after["rows_per_second"], before["rows_per_second"]),
+                    "p50_latency_ratio": _ratio(after["latency_seconds"]["p50"], before["latency_seconds"]["p50"]),
+                    "p99_latency_ratio": _ratio(after["latency_seconds"]["p99"], before["latency_seconds"]["p99"]),
+                    "peak_rss_ratio": _ratio(after["peak_rss_bytes"], before["peak_rss_bytes"]),
+                },
+                sort_keys=True,
+            )
+        )
+    return 0
+
+
+def _ratio(after, before) -> Optional[float]:
+    if not before or after is None:
+        return None
+    return round(after / before, 3)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Benchmark upload, bronze load and dbt build throughput on synthetic exports. "
+            "Each scenario runs in a fresh process so peak RSS is its own."
+        ),
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run = subparsers.add_parser("run", help="Run the suite and print one JSON line per scenario.")
+    run.add_argument("--dataset", action="append", choices=supported_datasets(), help="Repeatable (default: all).")
+    run.add_argument(
+        "--rows",
+        action="append",
+        type=int,
+        help="Rows per synthetic export; repeat for several sizes (default: 10000).",
+    )
+    run.add_argument("--scenario", action="append", choices=SCENARIOS, help="Repeatable (default: all).")
+    run.add_argument("--repeat", type=int, default=3)
+    run.add_argument("--seed", type=int, default=0)
+    run.add_argument("--method", choices=BRONZE_METHODS, default="copy")
+    run.add_argument("--warm", action="store_true", help="Let repeats reuse the Parquet copy of the export.")
+    run.add_argument("--api-url", default=DEFAULT_API_URL)
+    run.add_argument("--project-dir", default=DEFAULT_DBT_PROJECT_DIR, help="dbt project directory.")
+    run.add_argument("--work-dir", help="Where synthetic CSVs are written (default: a temp dir).")
+    run.add_argument("--output", help="Also append the JSON lines to this file.")
+    run.add_argument("--keep-files", action="store_true", help="Keep the local synthetic CSVs.")
+    run.add_argument(
+        "--no-restore",
+        dest="restore",
+        action="store_false",
+        help="Leave synthetic rows in bronze/silver/gold instead of reloading the latest real export.",
+    )
+    run.add_argument(
+        "--allow-overwrite",
+        action="store_true",
+        required=True,
+        help="Acknowledge that the bronze/silver/gold tables of the benchmarked datasets are replaced.",
+    )
+
+    diff = subparsers.add_parser("compare", help="Ratios of candidate over baseline results.")
+    diff.add_argument("baseline")
+    diff.add_argument("candidate")
+    return parser
+
+
+def main() -> int:
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(levelname)s %(name)s %(message)s",
+        stream=sys.stderr,
+    )
+
+    args = build_parser().parse_args()
+    if args.command == "compare":
+        return compare(args.baseline, args.candidate)
+
+    args.rows = args.rows or [10_000]
+    return run_suite(args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import time
+
+import pandas as pd
+
+from bronze_loader.loader import (
+    RENAME_MAPS,
+    WRITE_METHODS,
+    bronze_table_for,
+    normalize_frame,
+    supported_datasets,
+    warehouse_engine,
+)
+from bronze_loader.synthetic import iter_synthetic_rows
+
+logger = logging.getLogger("bronze_loader.benchmark")
+
+
+def synthetic_frame(dataset: str, rows: int, seed: int = 0) -> pd.DataFrame:
+    """Build an already-renamed, typed bronze frame with Letterboxd-shaped values."""
+    columns = list(RENAME_MAPS[dataset].values())
+    dataframe = pd.DataFrame(list(iter_synthetic_rows(dataset, rows, seed=seed)), columns=columns)
+    return normalize_frame(dataframe, dataset)
+
+
+def bench_write_method(method: str, dataset: str, dataframe: pd.DataFrame, repeat: int) -> dict:
+    table = bronze_table_for(dataset, list(dataframe.columns), table_name=f"_bench_{dataset}_{method}")
+    metadata = table.metadata
+
+    engine = warehouse_engine()
+    timings: list[float] = []
+    try:
+        for _ in range(repeat):
+            metadata.drop_all(engine, tables=[table], checkfirst=True)
+            metadata.create_all(engine, tables=[table])
+            started = time.perf_counter()
+            with engine.begin() as connection:
+                WRITE_METHODS[method](connection, table, dataframe)
+            timings.append(time.perf_counter() - started)
+        metadata.drop_all(engine, tables=[table], checkfirst=True)
+    finally:
+        engine.dispose()
+
+    best = min(timings)
+    return {
+        "dataset": dataset,
+        "method": method,
+        "rows": len(dataframe),
+        "best_seconds": round(best, 4),
+        "rows_per_second": round(len(dataframe) / best, 1) if best else None,
+    }
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Compare bronze write throughput for COPY versus executemany INSERT.",
+    )
+    parser.add_argument("--dataset", default="diary", choices=supported_datasets())
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--method",
+        action="append",
+        choices=sorted(WRITE_METHODS),
+        help="Write method to benchmark; repeat to compare several (default: all).",
+    )
+    return parser
+
+
+def main() -> int:
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(levelname)s %(name)s %(message)s",
+    )
+
+    args = build_parser().parse_args()
+    dataframe = synthetic_frame(args.dataset, args.rows)
+    for method in args.method or sorted(WRITE_METHODS):
+        result = bench_write_method(method, args.dataset, dataframe, repeat=args.repeat)
+        print(json.dumps(result))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from typing import Iterable
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.engine import Connection
+
+# Served by idx_ingestion_runs_dataset_created_at in the metadata database.
+LATEST_KEYS_SQL = text(
+    """
+    SELECT DISTINCT ON (dataset) dataset, object_key
+    FROM public.ingestion_runs
+    WHERE dataset IN :datasets
+      AND bucket = :bucket
+      AND object_key LIKE :key_pattern
+      AND status = 'uploaded'
+    ORDER BY dataset, created_at DESC
+    """
+).bindparams(bindparam("datasets", expanding=True))
+
+
+def latest_keys_from_catalog(
+    connection: Connection,
+    datasets: Iterable[str],
+    prefix: str,
+    bucket: str,
+) -> dict[str, str]:
+    """Newest uploaded object per dataset according to public.ingestion_runs."""
+    wanted = sorted({dataset.lower() for dataset in datasets})
+    if not wanted:
+        return {}
+
+    escaped_prefix = prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    rows = connection.execute(
+        LATEST_KEYS_SQL,
+        {"datasets": wanted, "bucket": bucket, "key_pattern": f"{escaped_prefix}%"},
+    )
+    return {dataset: object_key for dataset, object_key in rows}
@@ -3,24 +3,58 @@ from __future__ import annotations
 import argparse
 import logging
 
-from bronze_loader.loader import load_latest_to_bronze, supported_datasets
+from bronze_loader.loader import (
+    DEFAULT_BATCH_ROWS,
+    DEFAULT_LOAD_WORKERS,
+    load_all_latest_to_bronze,
+    load_latest_to_bronze,
+    supported_datasets,
+)
 
 
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Load the latest raw Letterboxd CSV from MinIO into a bronze warehouse table.",
     )
-    parser.add_argument(
+    targets = parser.add_mutually_exclusive_group(required=True)
+    targets.add_argument(
         "--dataset",
-        required=True,
+        action="append",
         choices=supported_datasets(),
-        help="Dataset/table name to load into bronze.",
+        help="Dataset/table name to load into bronze. Repeat to load several in one run.",
+    )
+    targets.add_argument(
+        "--all",
+        action="store_true",
+        help="Load every supported dataset in one run.",
     )
     parser.add_argument(
         "--prefix",
         default="letterboxd/",
         help="MinIO object key prefix to search under.",
     )
+    parser.add_argument(
+        "--streaming",
+        action="store_true",
+        help="Stream the object through the csv module in bounded batches instead of pandas.",
+    )
+    parser.add_argument(
+        "--batch-rows",
+        type=int,
+        default=DEFAULT_BATCH_ROWS,
+        help="Rows per COPY batch in streaming mode.",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Reload even if the load ledger shows bronze already holds this content.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_LOAD_WORKERS,
+        help="Datasets loaded in parallel when more than one is requested.",
+    )
     return parser
 
 
@@ -29,14 +63,42 @@ def main() -> int:
         level=logging.INFO,
         format="%(asctime)s %(levelname)s %(name)s %(message)s",
     )
+    logger = logging.getLogger("bronze_loader.cli")
 
     args = build_parser().parse_args()
-    object_key = load_latest_to_bronze(target_table=args.dataset, prefix=args.prefix)
-    logging.getLogger("bronze_loader.cli").info(
-        "Bronze load complete for dataset=%s object_key=%s",
-        args.dataset,
-        object_key,
+    datasets = supported_datasets() if args.all else args.dataset
+
+    if len(datasets) == 1:
+        object_key = load_latest_to_bronze(
+            target_table=datasets[0],
+            prefix=args.prefix,
+            streaming=args.streaming,
+            batch_rows=args.batch_rows,
+            force=args.force,
+        )
+        logger.info(
+            "Bronze load complete for dataset=%s object_key=%s",
+            datasets[0],
+            object_key,
+        )
+        return 0
+
+    results = load_all_latest_to_bronze(
+        datasets,
+        prefix=args.prefix,
+        streaming=args.streaming,
+        batch_rows=args.batch_rows,
+        force=args.force,
+        workers=args.workers,
     )
+    for dataset, result in results.items():
+        logger.info(
+            "Bronze load %s for dataset=%s object_key=%s rows=%s",
+            "skipped" if result.skipped else "complete",
+            dataset,
+            result.object_key,
+            result.rows_loaded,
+        )
     return 0
 
 
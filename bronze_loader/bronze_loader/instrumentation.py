@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import logging
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Optional
+
+from sqlalchemy import BigInteger, Column, DateTime, Float, MetaData, Table, func
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.sql.sqltypes import Text
+
+logger = logging.getLogger("bronze_loader.instrumentation")
+
+# Mirrors public.pipeline_stage_metrics in the metadata database (infra/bootstrap/metadata.sql).
+stage_metrics_metadata = MetaData(schema="public")
+
+pipeline_stage_metrics = Table(
+    "pipeline_stage_metrics",
+    stage_metrics_metadata,
+    Column("metric_id", BigInteger, primary_key=True, autoincrement=True),
+    Column("component", Text, nullable=False),
+    Column("stage", Text, nullable=False),
+    Column("subject", Text),
+    Column("run_id", Text),
+    Column("ingestion_id", PG_UUID(as_uuid=True)),
+    Column("object_key", Text),
+    Column("duration_ms", Float, nullable=False),
+    Column("rows_processed", BigInteger),
+    Column("bytes_processed", BigInteger),
+    Column("recorded_at", DateTime(timezone=True), nullable=False, server_default=func.now()),
+)
+
+
+@dataclass
+class StageMetric:
+    component: str
+    stage: str
+    duration_seconds: float
+    subject: Optional[str] = None
+    object_key: Optional[str] = None
+    run_id: Optional[str] = None
+    rows: Optional[int] = None
+    bytes: Optional[int] = None
+
+    def as_row(self) -> dict:
+        return {
+            "component": self.component,
+            "stage": self.stage,
+            "subject": self.subject,
+            "run_id": self.run_id,
+            "object_key": self.object_key,
+            "duration_ms": self.duration_seconds * 1000,
+            "rows_processed": self.rows,
+            "bytes_processed": self.bytes,
+        }
+
+
+class StageTimer:
+    """Collects the duration and volume of each stage of one load."""
+
+    def __init__(
+        self,
+        component: str,
+        *,
+        subject: Optional[str] = None,
+        object_key: Optional[str] = None,
+        run_id: Optional[str] = None,
+    ) -> None:
+        self.component = component
+        self.subject = subject
+        self.object_key = object_key
+        self.run_id = run_id
+        self.metrics: list[StageMetric] = []
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[StageMetric]:
+        """Yields the metric so the caller can fill in rows/bytes; failed stages are not recorded."""
+        metric = StageMetric(
+            component=self.component,
+            stage=name,
+            duration_seconds=0.0,
+            subject=self.subject,
+            object_key=self.object_key,
+            run_id=self.run_id,
+        )
+        started = time.perf_counter()
+        yield metric
+        metric.duration_seconds = time.perf_counter() - started
+        self.metrics.append(metric)
+
+    def record(
+        self,
+        name: str,
+        duration_seconds: float,
+        *,
+        subject: Optional[str] = None,
+        rows: Optional[int] = None,
+        bytes: Optional[int] = None,
+    ) -> None:
+        """Add a stage that was timed elsewhere (for example by dbt)."""
+        self.metrics.append(
+            StageMetric(
+                component=self.component,
+                stage=name,
+                duration_seconds=duration_seconds,
+                subject=subject or self.subject,
+                object_key=self.object_key,
+                run_id=self.run_id,
+                rows=rows,
+                bytes=bytes,
+            )
+        )
+
+    def summary(self) -> str:
+        return ", ".join(f"{metric.stage}={metric.duration_seconds:.3f}s" for metric in self.metrics)
+
+
+def persist_stage_metrics(engine: Engine, metrics: Iterable[StageMetric]) -> None:
+    """Best effort: losing a timing row must never fail a load."""
+    rows = [metric.as_row() for metric in metrics]
+    if not rows:
+        return
+    try:
+        with engine.begin() as connection:
+            connection.execute(pipeline_stage_metrics.insert(), rows)
+    except SQLAlchemyError:
+        logger.warning("Could not persist %s stage metrics", len(rows), exc_info=True)
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.engine import Engine, Row
+
+# public.bronze_load_jobs lives in the metadata database (infra/bootstrap/metadata.sql);
+# the API enqueues a job in the same transaction as its ingestion_runs row.
+DEFAULT_STALE_SECONDS = 30 * 60
+DEFAULT_MAX_ATTEMPTS = 3
+
+CLAIM_JOBS_SQL = text(
+    """
+    WITH candidates AS (
+        SELECT job_id
+        FROM public.bronze_load_jobs
+        WHERE status = 'queued'
+           OR (status = 'running' AND started_at < NOW() - make_interval(secs => :stale_seconds))
+        ORDER BY enqueued_at
+        LIMIT :limit
+        FOR UPDATE SKIP LOCKED
+    )
+    UPDATE public.bronze_load_jobs AS jobs
+    SET status = 'running', started_at = NOW(), attempts = jobs.attempts + 1
+    FROM candidates
+    WHERE jobs.job_id = candidates.job_id
+    RETURNING jobs.job_id, jobs.ingestion_id, jobs.dataset, jobs.bucket, jobs.object_key,
+              jobs.enqueued_at, jobs.attempts
+    """
+)
+
+# Claimed jobs whose dataset has a newer job that is waiting, loading or already
+# loaded: running them would put an older export back over a newer bronze table.
+SUPERSEDED_JOBS_SQL = text(
+    """
+    SELECT job.job_id
+    FROM public.bronze_load_jobs AS job
+    WHERE job.job_id IN :job_ids
+      AND EXISTS (
+          SELECT 1
+          FROM public.bronze_load_jobs AS newer
+          WHERE newer.dataset = job.dataset
+            AND newer.status IN ('queued', 'running', 'done')
+            AND (newer.enqueued_at, newer.job_id) > (job.enqueued_at, job.job_id)
+      )
+    """
+).bindparams(bindparam("job_ids", expanding=True))
+
+FINISH_JOBS_SQL = text(
+    """
+    UPDATE public.bronze_load_jobs
+    SET status = :status, finished_at = NOW(), last_error = :last_error
+    WHERE job_id IN :job_ids
+    """
+).bindparams(bindparam("job_ids", expanding=True))
+
+RETRY_OR_FAIL_JOBS_SQL = text(
+    """
+    UPDATE public.bronze_load_jobs
+    SET status = CASE WHEN attempts >= :max_attempts THEN 'failed' ELSE 'queued' END,
+        finished_at = NOW(),
+        last_error = :last_error
+    WHERE job_id IN :job_ids
+    """
+).bindparams(bindparam("job_ids", expanding=True))
+
+
+@dataclass(frozen=True)
+class LoadJob:
+    job_id: str
+    ingestion_id: str
+    dataset: str
+    bucket: str
+    object_key: str
+    attempts: int
+
+    def as_dict(self) -> dict:
+        return {
+            "job_id": self.job_id,
+            "ingestion_id": self.ingestion_id,
+            "dataset": self.dataset,
+            "bucket": self.bucket,
+            "object_key": self.object_key,
+            "attempts": self.attempts,
+        }
+
+
+def claim_load_jobs(
+    engine: Engine,
+    limit: int = 100,
+    stale_seconds: int = DEFAULT_STALE_SECONDS,
+) -> list[LoadJob]:
+    """
+    Claim queued jobs (and running ones abandoned for stale_seconds) without
+    blocking other consumers. Bronze holds one export per dataset, so a claimed
+    job is marked superseded instead of returned when its dataset has a newer
+    job queued, running or done, whether claimed alongside it or not.
+    """
+    with engine.begin() as connection:
+        rows = connection.execute(CLAIM_JOBS_SQL, {"limit": limit, "stale_seconds": stale_seconds}).all()
+
+        if not rows:
+            return []
+
+        superseded = set(
+            connection.execute(SUPERSEDED_JOBS_SQL, {"job_ids": [row.job_id for row in rows]}).scalars()
+        )
+        if superseded:
+            connection.execute(
+                FINISH_JOBS_SQL,
+                {"status": "superseded", "last_error": None, "job_ids": list(superseded)},
+            )
+        newest: list[Row] = [row for row in rows if row.job_id not in superseded]
+
+    return [
+        LoadJob(
+            job_id=str(row.job_id),
+            ingestion_id=str(row.ingestion_id),
+            dataset=row.dataset,
+            bucket=row.bucket,
+            object_key=row.object_key,
+            attempts=row.attempts,
+        )
+        for row in sorted(newest, key=lambda row: row.dataset)
+    ]
+
+
+def complete_load_jobs(engine: Engine, job_ids: Iterable[str]) -> None:
+    job_ids = list(job_ids)
+    if not job_ids:
+        return
+    with engine.begin() as connection:
+        connection.execute(FINISH_JOBS_SQL, {"status": "done", "last_error": None, "job_ids": job_ids})
+
+
+def fail_load_jobs(
+    engine: Engine,
+    job_ids: Iterable[str],
+    error: str,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+) -> None:
+    """Requeue the jobs, or mark them failed once they have used max_attempts."""
+    job_ids = list(job_ids)
+    if not job_ids:
+        return
+    with engine.begin() as connection:
+        connection.execute(
+            RETRY_OR_FAIL_JOBS_SQL,
+            {"max_attempts": max_attempts, "last_error": error, "job_ids": job_ids},
+        )
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import BigInteger, Column, DateTime, Index, MetaData, Table, func, select
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.sql.sqltypes import Text
+
+ledger_metadata = MetaData(schema="bronze")
+
+load_ledger = Table(
+    "load_ledger",
+    ledger_metadata,
+    Column("load_id", PG_UUID(as_uuid=True), primary_key=True),
+    Column("dataset", Text, nullable=False),
+    Column("object_key", Text, nullable=False),
+    Column("content_hash", Text, nullable=False),
+    Column("rows_loaded", BigInteger, nullable=False),
+    Column("loaded_at", DateTime(timezone=True), nullable=False, server_default=func.now()),
+    Index("idx_load_ledger_dataset_loaded_at", "dataset", "loaded_at"),
+)
+
+
+def ensure_load_ledger(engine: Engine) -> None:
+    ledger_metadata.create_all(engine, tables=[load_ledger], checkfirst=True)
+
+
+def current_content_hash(connection: Connection, dataset: str) -> Optional[str]:
+    """Content hash of the export that bronze.<dataset> currently holds."""
+    stmt = (
+        select(load_ledger.c.content_hash)
+        .where(load_ledger.c.dataset == dataset)
+        .order_by(load_ledger.c.loaded_at.desc())
+        .limit(1)
+    )
+    return connection.execute(stmt).scalar_one_or_none()
+
+
+def record_load(
+    connection: Connection,
+    *,
+    load_id: UUID,
+    dataset: str,
+    object_key: str,
+    content_hash: str,
+    rows_loaded: int,
+) -> None:
+    connection.execute(
+        load_ledger.insert().values(
+            load_id=load_id,
+            dataset=dataset,
+            object_key=object_key,
+            content_hash=content_hash,
+            rows_loaded=rows_loaded,
+        )
+    )
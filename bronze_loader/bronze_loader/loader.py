@@ -1,20 +1,50 @@
 from __future__ import annotations
 
+import codecs
+import csv
 import io
 import logging
+import math
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import PurePosixPath
-from typing import Optional
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Iterable, Iterator, Optional
+from uuid import UUID, uuid4
 
 import boto3
 import pandas as pd
-from sqlalchemy import Column, MetaData, Table, create_engine
-from sqlalchemy.engine import Engine
-from sqlalchemy.sql.sqltypes import Text
+from botocore.config import Config
+from botocore.exceptions import ClientError
+from sqlalchemy import Boolean, Column, Date, DateTime, Integer, MetaData, Numeric, Table, create_engine, func, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.sql.sqltypes import Text, TypeEngine
+
+from bronze_loader.catalog import latest_keys_from_catalog
+from bronze_loader.instrumentation import StageMetric, StageTimer, persist_stage_metrics
+from bronze_loader.ledger import current_content_hash, ensure_load_ledger, record_load
 
 logger = logging.getLogger("bronze_loader.loader")
 
 RAW_BUCKET = os.getenv("MINIO_BUCKET_RAW", "raw")
+STREAM_CHUNK_BYTES = 1024 * 1024
+DEFAULT_BATCH_ROWS = int(os.getenv("BRONZE_LOAD_BATCH_ROWS", "10000"))
+DEFAULT_LOAD_WORKERS = int(os.getenv("BRONZE_LOAD_WORKERS", "4"))
+RAW_DISCOVERY_MODE = os.getenv("LETTERBOXD_RAW_DISCOVERY", "walk").lower()
+# Day partitions the walk visits before leaving the datasets it has not found to one full listing.
+RAW_DISCOVERY_MAX_DAYS = int(os.getenv("LETTERBOXD_RAW_DISCOVERY_MAX_DAYS", "31"))
+# Parquet copies live outside the letterboxd/ prefix so raw-object discovery never lists them.
+PARQUET_PREFIX = os.getenv("BRONZE_PARQUET_PREFIX", "parquet/")
+PARQUET_COPIES_ENABLED = os.getenv("BRONZE_PARQUET_COPIES", "true").lower() in {"1", "true", "yes"}
+STAGING_SUFFIX = "__staging"
+COMPONENT = "bronze_loader"
+# Filled by column defaults on every bronze row, so silver rows can be traced to the load that wrote them.
+LOAD_ID_COLUMN = "_load_id"
+LOADED_AT_COLUMN = "_loaded_at"
+LOAD_COLUMNS = (LOAD_ID_COLUMN, LOADED_AT_COLUMN)
 
 RENAME_MAPS = {
     "ratings": {
@@ -71,6 +101,50 @@ RENAME_MAPS = {
     },
 }
 
+# Typed bronze columns per dataset; every other column is trimmed text with
+# empty strings stored as NULL. Values that do not parse become NULL too.
+BRONZE_SCHEMAS = {
+    "ratings": {"list_date": "date", "year": "year", "rating": "rating"},
+    "watched": {"list_date": "date", "year": "year"},
+    "watchlist": {"list_date": "date", "year": "year"},
+    "reviews": {
+        "list_date": "date",
+        "year": "year",
+        "rating": "rating",
+        "rewatch": "boolean",
+        "watched_date": "date",
+    },
+    "diary": {
+        "list_date": "date",
+        "year": "year",
+        "rating": "rating",
+        "rewatch": "boolean",
+        "watched_date": "date",
+    },
+    "profile": {"date_joined": "date"},
+}
+
+BRONZE_COLUMN_TYPES: dict[str, Callable[[], TypeEngine]] = {
+    "date": Date,
+    "year": Integer,
+    "rating": lambda: Numeric(3, 1),
+    "boolean": Boolean,
+}
+
+TRUE_VALUES = {"yes", "y", "true", "t", "1"}
+FALSE_VALUES = {"no", "n", "false", "f", "0"}
+
+# Btree indexes created on every fresh bronze table; they mirror the
+# row_number() partitions the silver models dedupe on.
+BRONZE_INDEXES = {
+    "ratings": [("letterboxd_uri", "list_date", "rating")],
+    "watched": [("letterboxd_uri",)],
+    "watchlist": [("letterboxd_uri",)],
+    "reviews": [("letterboxd_uri", "watched_date")],
+    "diary": [("letterboxd_uri", "watched_date", "rating")],
+    "profile": [("username",)],
+}
+
 
 def supported_datasets() -> list[str]:
     return sorted(RENAME_MAPS.keys())
@@ -98,23 +172,60 @@ def _must(name: str) -> str:
     return value
 
 
-def s3_client():
-    endpoint = f"http://{os.getenv('MINIO_HOST', 'minio')}:{os.getenv('MINIO_PORT', '9000')}"
-    return boto3.client(
-        "s3",
-        endpoint_url=endpoint,
-        aws_access_key_id=_must("MINIO_ROOT_USER"),
-        aws_secret_access_key=_must("MINIO_ROOT_PASSWORD"),
-        region_name=os.getenv("MINIO_REGION", "us-east-1"),
+_client = None
+_client_lock = threading.Lock()
+
+
+def s3_client_config() -> Config:
+    return Config(
+        max_pool_connections=int(os.getenv("S3_MAX_POOL_CONNECTIONS", "16")),
+        connect_timeout=float(os.getenv("S3_CONNECT_TIMEOUT_SECONDS", "5")),
+        read_timeout=float(os.getenv("S3_READ_TIMEOUT_SECONDS", "60")),
+        retries={
+            "max_attempts": int(os.getenv("S3_MAX_ATTEMPTS", "5")),
+            "mode": "standard",
+        },
+        tcp_keepalive=True,
     )
 
 
-def warehouse_engine() -> Engine:
+def s3_client():
+    """Process-wide boto3 client, shared across threads and reused between loads."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                endpoint = f"http://{os.getenv('MINIO_HOST', 'minio')}:{os.getenv('MINIO_PORT', '9000')}"
+                _client = boto3.session.Session().client(
+                    "s3",
+                    endpoint_url=endpoint,
+                    aws_access_key_id=_must("MINIO_ROOT_USER"),
+                    aws_secret_access_key=_must("MINIO_ROOT_PASSWORD"),
+                    region_name=os.getenv("MINIO_REGION", "us-east-1"),
+                    config=s3_client_config(),
+                )
+    return _client
+
+
+def warehouse_engine(pool_size: int = 5) -> Engine:
     user = _must("POSTGRES_WAREHOUSE_USER")
     password = _must("POSTGRES_WAREHOUSE_PASSWORD")
     host = os.getenv("POSTGRES_WAREHOUSE_HOST", "postgres-warehouse")
     port = os.getenv("POSTGRES_WAREHOUSE_PORT", "5432")
     database = _must("POSTGRES_WAREHOUSE_DB")
+    return create_engine(
+        f"postgresql+psycopg2://{user}:{password}@{host}:{port}/{database}",
+        pool_pre_ping=True,
+        pool_size=pool_size,
+    )
+
+
+def metadata_engine() -> Engine:
+    user = _must("POSTGRES_META_USER")
+    password = _must("POSTGRES_META_PASSWORD")
+    host = os.getenv("POSTGRES_META_HOST", "postgres-meta")
+    port = os.getenv("POSTGRES_META_PORT", "5432")
+    database = _must("POSTGRES_META_DB")
     return create_engine(
         f"postgresql+psycopg2://{user}:{password}@{host}:{port}/{database}",
         pool_pre_ping=True,
@@ -155,12 +266,38 @@ def find_latest_key(prefix: str, suffix: str, bucket: str = RAW_BUCKET) -> str:
     return best_key
 
 
-def find_latest_key_for_dataset(dataset: str, prefix: str, bucket: str = RAW_BUCKET) -> str:
+def find_latest_keys_in_catalog(
+    datasets: Iterable[str],
+    prefix: str,
+    bucket: str = RAW_BUCKET,
+) -> dict[str, str]:
+    """Catalog lookup against public.ingestion_runs; returns {} if the metadata DB is unavailable."""
+    try:
+        engine = metadata_engine()
+    except RuntimeError as exc:
+        logger.warning("Object catalog not configured (%s); using S3 listing.", exc)
+        return {}
+
+    try:
+        with engine.connect() as connection:
+            return latest_keys_from_catalog(connection, datasets, prefix=prefix, bucket=bucket)
+    except SQLAlchemyError as exc:
+        logger.warning("Object catalog lookup failed (%s); using S3 listing.", exc)
+        return {}
+    finally:
+        engine.dispose()
+
+
+def scan_latest_keys_for_datasets(
+    datasets: Iterable[str],
+    prefix: str,
+    bucket: str = RAW_BUCKET,
+) -> dict[str, str]:
+    """Resolve the newest object for every requested dataset in a single listing pass."""
     client = s3_client()
+    wanted = {dataset.lower() for dataset in datasets}
     token: Optional[str] = None
-    best_key: Optional[str] = None
-    best_ts = None
-    normalized_dataset = dataset.lower()
+    best: dict[str, tuple] = {}
 
     while True:
         kwargs = {"Bucket": bucket, "Prefix": prefix}
@@ -171,17 +308,128 @@ def find_latest_key_for_dataset(dataset: str, prefix: str, bucket: str = RAW_BUC
 
         for obj in response.get("Contents", []):
             key = obj["Key"]
-            if infer_dataset_from_object_name(key) == normalized_dataset:
-                last_modified = obj["LastModified"]
-                if best_ts is None or last_modified > best_ts:
-                    best_ts = last_modified
-                    best_key = key
+            dataset = infer_dataset_from_object_name(key)
+            if dataset not in wanted:
+                continue
+            last_modified = obj["LastModified"]
+            if dataset not in best or last_modified > best[dataset][0]:
+                best[dataset] = (last_modified, key)
+
+        if response.get("IsTruncated"):
+            token = response.get("NextContinuationToken")
+        else:
+            break
+
+    return {dataset: key for dataset, (_, key) in sorted(best.items())}
+
+
+def _list_level(client, bucket: str, prefix: str) -> tuple[list[str], list[str]]:
+    """One delimiter-based listing level: (child prefixes, object keys)."""
+    token: Optional[str] = None
+    prefixes: list[str] = []
+    keys: list[str] = []
+
+    while True:
+        kwargs = {"Bucket": bucket, "Prefix": prefix, "Delimiter": "/"}
+        if token:
+            kwargs["ContinuationToken"] = token
+
+        response = client.list_objects_v2(**kwargs)
+        prefixes.extend(item["Prefix"] for item in response.get("CommonPrefixes", []))
+        keys.extend(obj["Key"] for obj in response.get("Contents", []))
 
         if response.get("IsTruncated"):
             token = response.get("NextContinuationToken")
         else:
             break
 
+    return prefixes, keys
+
+
+def _date_children(prefixes: list[str], parent: str, digits: int) -> list[str]:
+    """Child prefixes that are a fixed-width number (YYYY/, MM/ or DD/), newest first."""
+    children = [
+        child
+        for child in prefixes
+        if len(child) == len(parent) + digits + 1 and child[len(parent):-1].isdigit()
+    ]
+    return sorted(children, reverse=True)
+
+
+def walk_latest_keys_for_datasets(
+    datasets: Iterable[str],
+    prefix: str,
+    bucket: str = RAW_BUCKET,
+    max_days: int = RAW_DISCOVERY_MAX_DAYS,
+) -> Optional[dict[str, str]]:
+    """
+    Walk the YYYY/MM/DD/ key hierarchy the API writes, newest day first, and
+    stop once every requested dataset has been found or max_days day
+    partitions have been listed, so a dataset that was never uploaded does not
+    cost one LIST per day. Returns None when the prefix has no date partitions
+    so the caller can fall back to a full scan.
+    """
+    client = s3_client()
+    wanted = {dataset.lower() for dataset in datasets}
+    found: dict[str, str] = {}
+    days_listed = 0
+
+    top_prefixes, _ = _list_level(client, bucket, prefix)
+    years = _date_children(top_prefixes, prefix, 4)
+    if not years:
+        return None
+
+    for year in years:
+        for month in _date_children(_list_level(client, bucket, year)[0], year, 2):
+            for day in _date_children(_list_level(client, bucket, month)[0], month, 2):
+                # Keys within a day start with HHMMSS, so reverse key order is newest first.
+                _, keys = _list_level(client, bucket, day)
+                for key in sorted(keys, reverse=True):
+                    dataset = infer_dataset_from_object_name(key)
+                    if dataset in wanted and dataset not in found:
+                        found[dataset] = key
+                days_listed += 1
+                if wanted.issubset(found) or days_listed >= max_days:
+                    return dict(sorted(found.items()))
+
+    return dict(sorted(found.items()))
+
+
+def find_latest_keys_for_datasets(
+    datasets: Iterable[str],
+    prefix: str,
+    bucket: str = RAW_BUCKET,
+    use_catalog: bool = True,
+) -> dict[str, str]:
+    """
+    Newest object per dataset, taken from the ingestion_runs catalog first.
+    Datasets the catalog does not know about are found by walking the most
+    recent date partitions newest-first; whatever the walk does not find, or
+    a prefix that is not date-partitioned, takes one full S3 listing
+    (LETTERBOXD_RAW_DISCOVERY=scan forces the full listing).
+    """
+    wanted = sorted({dataset.lower() for dataset in datasets})
+    latest = find_latest_keys_in_catalog(wanted, prefix=prefix, bucket=bucket) if use_catalog else {}
+
+    uncatalogued = [dataset for dataset in wanted if dataset not in latest]
+    if uncatalogued:
+        if use_catalog:
+            logger.info("Datasets %s not found in the object catalog; scanning s3://%s/%s", uncatalogued, bucket, prefix)
+        if RAW_DISCOVERY_MODE == "walk":
+            latest.update(walk_latest_keys_for_datasets(uncatalogued, prefix=prefix, bucket=bucket) or {})
+        unwalked = [dataset for dataset in uncatalogued if dataset not in latest]
+        if unwalked:
+            latest.update(scan_latest_keys_for_datasets(unwalked, prefix=prefix, bucket=bucket))
+
+    return dict(sorted(latest.items()))
+
+
+def find_latest_key_for_dataset(dataset: str, prefix: str, bucket: str = RAW_BUCKET) -> str:
+    normalized_dataset = dataset.lower()
+    best_key = find_latest_keys_for_datasets([normalized_dataset], prefix=prefix, bucket=bucket).get(
+        normalized_dataset
+    )
+
     if not best_key:
         raise FileNotFoundError(
             f"No object found in bucket='{bucket}' under prefix='{prefix}' for dataset '{normalized_dataset}'"
@@ -190,68 +438,720 @@ def find_latest_key_for_dataset(dataset: str, prefix: str, bucket: str = RAW_BUC
     return best_key
 
 
-def load_one_csv_to_bronze(object_key: str, target_table: str) -> None:
+@dataclass(frozen=True)
+class BronzeLoadResult:
+    dataset: str
+    object_key: str
+    content_hash: str
+    rows_loaded: int
+    skipped: bool
+    load_id: Optional[UUID] = None
+    stage_metrics: tuple[StageMetric, ...] = field(default=(), compare=False, repr=False)
+
+
+def bronze_column_type(dataset: str, column_name: str) -> TypeEngine:
+    kind = BRONZE_SCHEMAS.get(dataset, {}).get(column_name)
+    return BRONZE_COLUMN_TYPES[kind]() if kind else Text()
+
+
+def bronze_table_for(
+    dataset: str,
+    columns: list[str],
+    load_id: Optional[UUID] = None,
+    table_name: Optional[str] = None,
+) -> Table:
+    metadata = MetaData(schema="bronze")
+    load_columns = []
+    if load_id is not None:
+        load_columns = [
+            Column(LOAD_ID_COLUMN, Text, nullable=False, server_default=str(load_id)),
+            Column(LOADED_AT_COLUMN, DateTime(timezone=True), nullable=False, server_default=func.now()),
+        ]
+    return Table(
+        table_name or dataset,
+        metadata,
+        *(Column(column_name, bronze_column_type(dataset, column_name)) for column_name in columns),
+        *load_columns,
+    )
+
+
+def _clean_text(series: pd.Series) -> pd.Series:
+    cleaned = series.astype("string").str.strip()
+    return cleaned.mask(cleaned == "")
+
+
+def _parse_date(series: pd.Series) -> pd.Series:
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series
+    return pd.to_datetime(_clean_text(series), format="%Y-%m-%d", errors="coerce")
+
+
+def _parse_year(series: pd.Series) -> pd.Series:
+    numeric = pd.to_numeric(_clean_text(series), errors="coerce")
+    valid = numeric.between(1000, 9999) & (numeric == numeric.round())
+    return numeric.where(valid).astype("Int64")
+
+
+def _parse_rating(series: pd.Series) -> pd.Series:
+    numeric = pd.to_numeric(_clean_text(series), errors="coerce")
+    # numeric(3,1) holds up to 99.9; Letterboxd ratings are 0.5-5.
+    return numeric.where(numeric.between(0, 99.9)).round(1).astype("Float64")
+
+
+def _parse_boolean(series: pd.Series) -> pd.Series:
+    lowered = _clean_text(series).str.lower()
+    parsed = pd.Series(pd.NA, index=series.index, dtype="boolean")
+    parsed[lowered.isin(TRUE_VALUES).fillna(False)] = True
+    parsed[lowered.isin(FALSE_VALUES).fillna(False)] = False
+    return parsed
+
+
+COLUMN_PARSERS: dict[str, Callable[[pd.Series], pd.Series]] = {
+    "date": _parse_date,
+    "year": _parse_year,
+    "rating": _parse_rating,
+    "boolean": _parse_boolean,
+}
+
+
+def normalize_frame(dataframe: pd.DataFrame, dataset: str) -> pd.DataFrame:
+    """
+    Type a renamed frame per BRONZE_SCHEMAS with whole-column operations.
+    Idempotent, so frames read back from typed Parquet copies pass through unchanged.
+    """
+    schema = BRONZE_SCHEMAS.get(dataset, {})
+    return pd.DataFrame(
+        {
+            column: COLUMN_PARSERS[schema[column]](dataframe[column]) if column in schema else _clean_text(dataframe[column])
+            for column in dataframe.columns
+        },
+        index=dataframe.index,
+    )
+
+
+def _clean_value(value: str) -> Optional[str]:
+    return value.strip() or None
+
+
+def _parse_date_value(value: str) -> Optional[str]:
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date().isoformat()
+    except ValueError:
+        return None
+
+
+def _parse_number(value: str) -> Optional[float]:
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def _parse_year_value(value: str) -> Optional[str]:
+    number = _parse_number(value)
+    if number is None or not 1000 <= number <= 9999 or not number.is_integer():
+        return None
+    return str(int(number))
+
+
+def _parse_rating_value(value: str) -> Optional[str]:
+    number = _parse_number(value)
+    if number is None or math.isnan(number) or not 0 <= number <= 99.9:
+        return None
+    return str(round(number, 1))
+
+
+def _parse_boolean_value(value: str) -> Optional[str]:
+    lowered = value.lower()
+    if lowered in TRUE_VALUES:
+        return "true"
+    if lowered in FALSE_VALUES:
+        return "false"
+    return None
+
+
+# Row-wise twins of COLUMN_PARSERS for the streaming loader, which never builds
+# a frame. Each takes a stripped, non-empty field and returns the COPY text.
+VALUE_PARSERS: dict[str, Callable[[str], Optional[str]]] = {
+    "date": _parse_date_value,
+    "year": _parse_year_value,
+    "rating": _parse_rating_value,
+    "boolean": _parse_boolean_value,
+}
+
+
+def row_typer(dataset: str, columns: list[str]) -> Callable[[list[str]], list[Optional[str]]]:
+    """Build a function that types one raw CSV row per BRONZE_SCHEMAS, like normalize_frame."""
+    schema = BRONZE_SCHEMAS.get(dataset, {})
+    parsers = [VALUE_PARSERS[schema[column]] if column in schema else None for column in columns]
+
+    def type_row(row: list[str]) -> list[Optional[str]]:
+        typed: list[Optional[str]] = []
+        for parser, value in zip(parsers, row):
+            value = _clean_value(value)
+            typed.append(parser(value) if parser is not None and value is not None else value)
+        return typed
+
+    return type_row
+
+
+def data_columns(table: Table) -> list[Column]:
+    return [column for column in table.columns if column.name not in LOAD_COLUMNS]
+
+
+def _native(value):
+    if isinstance(value, pd.Timestamp):
+        return value.date()
+    # numpy scalars from Int64/Float64/boolean columns; psycopg2 only adapts Python types.
+    return value.item() if hasattr(value, "item") else value
+
+
+def write_with_insert(connection: Connection, table: Table, dataframe: pd.DataFrame) -> int:
+    """executemany path, kept as the benchmark baseline for COPY."""
+    frame = dataframe.astype(object).where(pd.notna(dataframe), None)
+    records = [
+        {column: _native(value) for column, value in row.items()}
+        for row in frame.to_dict(orient="records")
+    ]
+    if records:
+        connection.execute(table.insert(), records)
+    return len(records)
+
+
+def _copy_csv_buffer(connection: Connection, table: Table, buffer: io.StringIO) -> None:
+    preparer = connection.dialect.identifier_preparer
+    column_list = ", ".join(preparer.quote(column.name) for column in data_columns(table))
+    statement = f"COPY {preparer.format_table(table)} ({column_list}) FROM STDIN WITH (FORMAT csv)"
+
+    cursor = connection.connection.cursor()
+    try:
+        cursor.copy_expert(statement, buffer)
+    finally:
+        cursor.close()
+
+
+def write_with_copy(connection: Connection, table: Table, dataframe: pd.DataFrame) -> int:
+    """Stream the frame as CSV through COPY FROM STDIN; missing values become NULL."""
+    buffer = io.StringIO()
+    dataframe.to_csv(buffer, index=False, header=False, date_format="%Y-%m-%d")
+    buffer.seek(0)
+    _copy_csv_buffer(connection, table, buffer)
+    return len(dataframe)
+
+
+def write_rows_with_copy(connection: Connection, table: Table, rows: list[list[Optional[str]]]) -> int:
+    """COPY a batch of typed rows; None is written as an unquoted empty field and lands as NULL."""
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    buffer.seek(0)
+    _copy_csv_buffer(connection, table, buffer)
+    return len(rows)
+
+
+WRITE_METHODS = {
+    "copy": write_with_copy,
+    "insert": write_with_insert,
+}
+
+
+def object_content_hash(object_key: str) -> str:
+    """
+    SHA-256 recorded by the ingest API in the object's user metadata. Objects
+    uploaded before that existed fall back to their ETag.
+    """
+    response = s3_client().head_object(Bucket=RAW_BUCKET, Key=object_key)
+    sha256 = response.get("Metadata", {}).get("sha256")
+    if sha256:
+        return f"sha256:{sha256}"
+    etag = response["ETag"].strip('"')
+    return f"etag:{etag}"
+
+
+def create_bronze_indexes(connection: Connection, dataset: str) -> None:
+    preparer = connection.dialect.identifier_preparer
+    for columns in BRONZE_INDEXES.get(dataset, []):
+        index_name = f"ix_{dataset}_{'_'.join(columns)}"
+        column_list = ", ".join(preparer.quote(column) for column in columns)
+        connection.execute(
+            text(
+                f"CREATE INDEX IF NOT EXISTS {preparer.quote(index_name)} "
+                f"ON bronze.{preparer.quote(dataset)} ({column_list})"
+            )
+        )
+
+
+def replace_bronze_table(
+    engine: Engine,
+    *,
+    dataset: str,
+    columns: list[str],
+    write: Callable[[Connection, Table], int],
+    object_key: str,
+    content_hash: str,
+    timer: Optional[StageTimer] = None,
+) -> BronzeLoadResult:
+    """
+    Load into bronze.<dataset>__staging and swap it in for bronze.<dataset> in
+    the same transaction as the ledger row, so readers never see a partial load.
+    """
+    load_id = uuid4()
+    staging_table = bronze_table_for(
+        dataset,
+        columns,
+        load_id=load_id,
+        table_name=f"{dataset}{STAGING_SUFFIX}",
+    )
+    preparer = engine.dialect.identifier_preparer
+    timer = timer or StageTimer(COMPONENT, subject=dataset, object_key=object_key)
+
+    with engine.begin() as connection:
+        # Serialize concurrent loads of the same dataset.
+        connection.execute(
+            text("SELECT pg_advisory_xact_lock(hashtext(:lock_name))"),
+            {"lock_name": f"bronze.{dataset}"},
+        )
+        staging_table.drop(connection, checkfirst=True)
+        staging_table.create(connection)
+
+        with timer.stage("db_write") as metric:
+            rows_loaded = write(connection, staging_table)
+            metric.rows = rows_loaded
+
+        with timer.stage("swap"):
+            connection.execute(text(f"DROP TABLE IF EXISTS bronze.{preparer.quote(dataset)}"))
+            connection.execute(
+                text(f"ALTER TABLE {preparer.format_table(staging_table)} RENAME TO {preparer.quote(dataset)}")
+            )
+        with timer.stage("index_analyze"):
+            # Indexes are built after the swap so their names never collide with the old table's.
+            create_bronze_indexes(connection, dataset)
+            connection.execute(text(f"ANALYZE bronze.{preparer.quote(dataset)}"))
+        record_load(
+            connection,
+            load_id=load_id,
+            dataset=dataset,
+            object_key=object_key,
+            content_hash=content_hash,
+            rows_loaded=rows_loaded,
+        )
+
+    # Earlier stages (download, parse) ran before the load_id existed.
+    for metric in timer.metrics:
+        metric.run_id = str(load_id)
+    return BronzeLoadResult(
+        dataset=dataset,
+        object_key=object_key,
+        content_hash=content_hash,
+        rows_loaded=rows_loaded,
+        skipped=False,
+        load_id=load_id,
+        stage_metrics=tuple(timer.metrics),
+    )
+
+
+def _skip_if_loaded(engine: Engine, dataset: str, object_key: str, content_hash: str) -> Optional[BronzeLoadResult]:
+    ensure_load_ledger(engine)
+    with engine.connect() as connection:
+        if current_content_hash(connection, dataset) != content_hash:
+            return None
+
+    logger.info(
+        "bronze.%s already holds content %s; skipping object_key=%s",
+        dataset,
+        content_hash,
+        object_key,
+    )
+    return BronzeLoadResult(
+        dataset=dataset,
+        object_key=object_key,
+        content_hash=content_hash,
+        rows_loaded=0,
+        skipped=True,
+    )
+
+
+def parquet_key_for(object_key: str) -> str:
+    return f"{PARQUET_PREFIX}{PurePosixPath(object_key).with_suffix('.parquet')}"
+
+
+def read_parquet_copy(object_key: str) -> Optional[pd.DataFrame]:
+    try:
+        response = s3_client().get_object(Bucket=RAW_BUCKET, Key=parquet_key_for(object_key))
+    except ClientError as exc:
+        if exc.response.get("Error", {}).get("Code") in {"NoSuchKey", "404"}:
+            return None
+        raise
+    return pd.read_parquet(io.BytesIO(response["Body"].read()))
+
+
+def write_parquet_copy(object_key: str, dataframe: pd.DataFrame) -> None:
+    """Best effort: a failed copy only means the next reload parses the CSV again."""
+    parquet_key = parquet_key_for(object_key)
+    try:
+        buffer = io.BytesIO()
+        dataframe.to_parquet(buffer, index=False, compression="zstd")
+        s3_client().put_object(
+            Bucket=RAW_BUCKET,
+            Key=parquet_key,
+            Body=buffer.getvalue(),
+            ContentType="application/vnd.apache.parquet",
+        )
+    except Exception:
+        logger.warning("Could not write Parquet copy %s for object_key=%s", parquet_key, object_key, exc_info=True)
+        return
+    logger.info("Wrote Parquet copy %s for object_key=%s", parquet_key, object_key)
+
+
+def read_bronze_frame(object_key: str, dataset: str, timer: Optional[StageTimer] = None) -> pd.DataFrame:
+    """
+    Renamed, typed frame for object_key. Prefers the zstd Parquet copy written
+    by an earlier load and otherwise parses the CSV (and writes that copy).
+    """
+    timer = timer or StageTimer(COMPONENT, subject=dataset, object_key=object_key)
+    if PARQUET_COPIES_ENABLED:
+        with timer.stage("parquet_read") as metric:
+            dataframe = read_parquet_copy(object_key)
+            metric.rows = None if dataframe is None else len(dataframe)
+        if dataframe is not None:
+            logger.info("Read Parquet copy for object_key=%s", object_key)
+            # Copies written before bronze was typed hold text; for typed copies this is a no-op.
+            with timer.stage("normalize") as metric:
+                dataframe = normalize_frame(dataframe, dataset)
+                metric.rows = len(dataframe)
+            return dataframe
+
+    with timer.stage("s3_get") as metric:
+        client = s3_client()
+        response = client.get_object(Bucket=RAW_BUCKET, Key=object_key)
+        data = response["Body"].read()
+        metric.bytes = len(data)
+
+    with timer.stage("parse") as metric:
+        # Read everything as text so a year never becomes "2019.0" and only
+        # empty fields are missing (a film called "NA" stays a film).
+        dataframe = pd.read_csv(
+            io.BytesIO(data),
+            encoding="utf-8-sig",
+            dtype=str,
+            keep_default_na=False,
+            na_values=[""],
+        )
+        metric.rows = len(dataframe)
+        metric.bytes = len(data)
+
+    with timer.stage("rename") as metric:
+        rename_map = RENAME_MAPS[dataset]
+        missing = [column for column in rename_map if column not in dataframe.columns]
+        if missing:
+            raise ValueError(
+                f"CSV missing expected columns for {dataset}: {missing}. Found: {dataframe.columns.tolist()}"
+            )
+
+        dataframe = dataframe.rename(columns=rename_map)
+        metric.rows = len(dataframe)
+
+    with timer.stage("normalize") as metric:
+        dataframe = normalize_frame(dataframe, dataset)
+        metric.rows = len(dataframe)
+
+    if PARQUET_COPIES_ENABLED:
+        with timer.stage("parquet_write"):
+            write_parquet_copy(object_key, dataframe)
+    return dataframe
+
+
+def load_one_csv_to_bronze(
+    object_key: str,
+    target_table: str,
+    method: str = "copy",
+    force: bool = False,
+    engine: Optional[Engine] = None,
+) -> BronzeLoadResult:
     dataset = target_table.lower()
     if dataset not in RENAME_MAPS:
         raise ValueError(
             f"Unsupported target_table: {dataset}. Supported: {supported_datasets()}"
         )
+    if method not in WRITE_METHODS:
+        raise ValueError(f"Unsupported load method: {method}. Supported: {sorted(WRITE_METHODS)}")
 
-    client = s3_client()
-    response = client.get_object(Bucket=RAW_BUCKET, Key=object_key)
-    data = response["Body"].read()
+    content_hash = object_content_hash(object_key)
+    owns_engine = engine is None
+    if owns_engine:
+        engine = warehouse_engine()
+    try:
+        if not force:
+            skipped = _skip_if_loaded(engine, dataset, object_key, content_hash)
+            if skipped:
+                return skipped
 
-    dataframe = pd.read_csv(io.BytesIO(data), encoding="utf-8-sig")
-    rename_map = RENAME_MAPS[dataset]
-    missing = [column for column in rename_map if column not in dataframe.columns]
-    if missing:
-        raise ValueError(
-            f"CSV missing expected columns for {dataset}: {missing}. Found: {dataframe.columns.tolist()}"
+        timer = StageTimer(COMPONENT, subject=dataset, object_key=object_key)
+        dataframe = read_bronze_frame(object_key=object_key, dataset=dataset, timer=timer)
+        if dataframe.empty:
+            logger.warning("No rows found in object_key=%s for bronze.%s.", object_key, dataset)
+
+        result = replace_bronze_table(
+            engine,
+            dataset=dataset,
+            columns=dataframe.columns.tolist(),
+            write=lambda connection, table: WRITE_METHODS[method](connection, table, dataframe),
+            object_key=object_key,
+            content_hash=content_hash,
+            timer=timer,
         )
+    finally:
+        if owns_engine:
+            engine.dispose()
 
-    dataframe = dataframe.rename(columns=rename_map)
-    dataframe = dataframe.astype(object).where(pd.notna(dataframe), None)
+    logger.info(
+        "Loaded %s rows into bronze.%s from object_key=%s using %s (%s)",
+        result.rows_loaded,
+        dataset,
+        object_key,
+        method,
+        timer.summary(),
+    )
+    return result
 
-    records = [
-        {
-            column: None if value is None else str(value)
-            for column, value in row.items()
-        }
-        for row in dataframe.to_dict(orient="records")
-    ]
 
-    engine = warehouse_engine()
-    try:
-        metadata = MetaData(schema="bronze")
-        bronze_table = Table(
-            dataset,
-            metadata,
-            *(Column(column_name, Text) for column_name in dataframe.columns),
+def iter_decoded_lines(chunks: Iterable[bytes], encoding: str = "utf-8-sig") -> Iterator[str]:
+    """Incrementally decode byte chunks into newline-terminated lines for csv.reader."""
+    decoder = codecs.getincrementaldecoder(encoding)()
+    pending = ""
+    for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line + "\n"
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending
+
+
+def stream_csv_to_bronze(
+    object_key: str,
+    target_table: str,
+    batch_rows: int = DEFAULT_BATCH_ROWS,
+    force: bool = False,
+    engine: Optional[Engine] = None,
+) -> BronzeLoadResult:
+    """
+    Constant-memory load: read the S3 body as a stream, parse and type it row
+    by row with the csv module (no pandas) and COPY it in batches of
+    batch_rows, all in one transaction.
+    """
+    dataset = target_table.lower()
+    if dataset not in RENAME_MAPS:
+        raise ValueError(
+            f"Unsupported target_table: {dataset}. Supported: {supported_datasets()}"
         )
-        metadata.create_all(engine, tables=[bronze_table], checkfirst=True)
 
-        if records:
-            with engine.begin() as connection:
-                connection.execute(bronze_table.insert(), records)
-        else:
-            logger.warning(
-                "No rows found in object_key=%s for bronze.%s; skipping insert.",
-                object_key,
-                dataset,
+    content_hash = object_content_hash(object_key)
+    owns_engine = engine is None
+    if owns_engine:
+        engine = warehouse_engine()
+    try:
+        if not force:
+            skipped = _skip_if_loaded(engine, dataset, object_key, content_hash)
+            if skipped:
+                return skipped
+
+        timer = StageTimer(COMPONENT, subject=dataset, object_key=object_key)
+        with timer.stage("s3_get") as metric:
+            response = s3_client().get_object(Bucket=RAW_BUCKET, Key=object_key)
+            metric.bytes = response.get("ContentLength")
+        reader = csv.reader(iter_decoded_lines(response["Body"].iter_chunks(STREAM_CHUNK_BYTES)))
+
+        header = next(reader, None)
+        if header is None:
+            raise ValueError(f"Object {object_key} is empty; expected a CSV header for {dataset}.")
+
+        rename_map = RENAME_MAPS[dataset]
+        missing = [column for column in rename_map if column not in header]
+        if missing:
+            raise ValueError(
+                f"CSV missing expected columns for {dataset}: {missing}. Found: {header}"
             )
+
+        columns = [rename_map.get(column, column) for column in header]
+        width = len(columns)
+        type_row = row_typer(dataset, columns)
+
+        def write_batches(connection: Connection, table: Table) -> int:
+            rows_written = 0
+            batch: list[list[Optional[str]]] = []
+            for row in reader:
+                if not row:
+                    continue
+                if len(row) > width:
+                    raise ValueError(
+                        f"Row {reader.line_num} of {object_key} has {len(row)} fields; expected {width}."
+                    )
+                batch.append(type_row(row + [""] * (width - len(row))))
+                if len(batch) >= batch_rows:
+                    rows_written += write_rows_with_copy(connection, table, batch)
+                    batch = []
+            if batch:
+                rows_written += write_rows_with_copy(connection, table, batch)
+            return rows_written
+
+        result = replace_bronze_table(
+            engine,
+            dataset=dataset,
+            columns=columns,
+            write=write_batches,
+            object_key=object_key,
+            content_hash=content_hash,
+            timer=timer,
+        )
     finally:
-        engine.dispose()
+        if owns_engine:
+            engine.dispose()
+
+    if result.rows_loaded == 0:
+        logger.warning("No rows found in object_key=%s for bronze.%s.", object_key, dataset)
 
+    # Download, parse and COPY are interleaved here, so they are all inside db_write.
     logger.info(
-        "Loaded %s rows into bronze.%s from object_key=%s",
-        len(dataframe),
+        "Streamed %s rows into bronze.%s from object_key=%s in batches of %s (%s)",
+        result.rows_loaded,
         dataset,
         object_key,
+        batch_rows,
+        timer.summary(),
     )
+    return result
 
 
-def load_latest_to_bronze(target_table: str, prefix: str = "letterboxd/") -> str:
+def record_load_metrics(results: Iterable[BronzeLoadResult]) -> None:
+    """Persist the stage metrics of finished loads to the metadata database, if it is configured."""
+    metrics = [metric for result in results for metric in result.stage_metrics]
+    if not metrics:
+        return
+    try:
+        engine = metadata_engine()
+    except RuntimeError as exc:
+        logger.info("Not persisting %s stage metrics: %s", len(metrics), exc)
+        return
+    try:
+        persist_stage_metrics(engine, metrics)
+    finally:
+        engine.dispose()
+
+
+def load_latest_to_bronze(
+    target_table: str,
+    prefix: str = "letterboxd/",
+    streaming: bool = False,
+    batch_rows: int = DEFAULT_BATCH_ROWS,
+    force: bool = False,
+) -> str:
     dataset = target_table.lower()
     object_key = find_latest_key_for_dataset(dataset=dataset, prefix=prefix, bucket=RAW_BUCKET)
-    load_one_csv_to_bronze(object_key=object_key, target_table=dataset)
+    if streaming:
+        result = stream_csv_to_bronze(object_key=object_key, target_table=dataset, batch_rows=batch_rows, force=force)
+    else:
+        result = load_one_csv_to_bronze(object_key=object_key, target_table=dataset, force=force)
+    record_load_metrics([result])
     return object_key
+
+
+def load_all_latest_to_bronze(
+    datasets: Iterable[str],
+    prefix: str = "letterboxd/",
+    streaming: bool = False,
+    batch_rows: int = DEFAULT_BATCH_ROWS,
+    force: bool = False,
+    workers: int = DEFAULT_LOAD_WORKERS,
+) -> dict[str, BronzeLoadResult]:
+    """
+    Load several datasets from one bucket listing, in parallel, over a single
+    pooled warehouse engine.
+    """
+    requested = sorted({dataset.lower() for dataset in datasets})
+    unsupported = [dataset for dataset in requested if dataset not in RENAME_MAPS]
+    if unsupported:
+        raise ValueError(f"Unsupported datasets: {unsupported}. Supported: {supported_datasets()}")
+
+    object_keys = find_latest_keys_for_datasets(requested, prefix=prefix, bucket=RAW_BUCKET)
+    missing = [dataset for dataset in requested if dataset not in object_keys]
+    if missing:
+        raise FileNotFoundError(
+            f"No object found in bucket='{RAW_BUCKET}' under prefix='{prefix}' for datasets {missing}"
+        )
+
+    results, failures = load_objects_to_bronze(
+        object_keys,
+        streaming=streaming,
+        batch_rows=batch_rows,
+        force=force,
+        workers=workers,
+    )
+    if failures:
+        raise RuntimeError(
+            f"Bronze load failed for datasets {sorted(failures)}: "
+            + "; ".join(f"{dataset}: {exc}" for dataset, exc in sorted(failures.items()))
+        )
+
+    return results
+
+
+def load_objects_to_bronze(
+    object_keys: dict[str, str],
+    streaming: bool = False,
+    batch_rows: int = DEFAULT_BATCH_ROWS,
+    force: bool = False,
+    workers: int = DEFAULT_LOAD_WORKERS,
+) -> tuple[dict[str, BronzeLoadResult], dict[str, Exception]]:
+    """
+    Load exactly the given {dataset: object_key} pairs in parallel over one
+    pooled warehouse engine. Returns (results, failures) per dataset instead of
+    raising, so callers can settle each dataset on its own.
+    """
+    unsupported = [dataset for dataset in object_keys if dataset not in RENAME_MAPS]
+    if unsupported:
+        raise ValueError(f"Unsupported datasets: {unsupported}. Supported: {supported_datasets()}")
+    if not object_keys:
+        return {}, {}
+
+    workers = max(1, min(workers, len(object_keys)))
+    engine = warehouse_engine(pool_size=workers)
+    results: dict[str, BronzeLoadResult] = {}
+    failures: dict[str, Exception] = {}
+    try:
+        # Create the ledger up front so parallel loads don't race on its DDL.
+        ensure_load_ledger(engine)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bronze-load") as executor:
+            futures = {}
+            for dataset, object_key in object_keys.items():
+                if streaming:
+                    future = executor.submit(
+                        stream_csv_to_bronze,
+                        object_key=object_key,
+                        target_table=dataset,
+                        batch_rows=batch_rows,
+                        force=force,
+                        engine=engine,
+                    )
+                else:
+                    future = executor.submit(
+                        load_one_csv_to_bronze,
+                        object_key=object_key,
+                        target_table=dataset,
+                        force=force,
+                        engine=engine,
+                    )
+                futures[future] = dataset
+
+            for future in as_completed(futures):
+                dataset = futures[future]
+                try:
+                    results[dataset] = future.result()
+                except Exception as exc:
+                    logger.exception("Bronze load failed for dataset=%s", dataset)
+                    failures[dataset] = exc
+    finally:
+        engine.dispose()
+
+    record_load_metrics(results.values())
+    return dict(sorted(results.items())), failures
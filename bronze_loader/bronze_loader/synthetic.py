@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import csv
+import math
+import random
+from pathlib import Path
+from typing import Iterator
+
+from bronze_loader.loader import RENAME_MAPS
+
+DATE_COLUMNS = {"list_date", "watched_date", "date_joined"}
+
+WORDS = (
+    "film", "cinema", "shot", "score", "camera", "actor", "performance", "ending",
+    "scene", "light", "color", "sound", "story", "character", "rewatch", "again",
+    "quiet", "loud", "slow", "beautiful", "strange", "perfect", "messy", "tender",
+)
+
+
+def review_text(rng: random.Random) -> str:
+    """
+    Review-shaped text: word counts are log-normal (median ~40 words, long
+    tail into thousands) and include the commas, quotes and line breaks that
+    make real exports expensive to quote and parse.
+    """
+    word_count = min(3_000, max(1, int(rng.lognormvariate(math.log(40), 1.2))))
+    words = [rng.choice(WORDS) for _ in range(word_count)]
+    for index in range(12, word_count, rng.randint(12, 40)):
+        words[index] += rng.choice([",", ".", '."', ".\n\n"])
+    return " ".join(words)
+
+
+def synthetic_value(column: str, rng: random.Random, index: int):
+    if column in DATE_COLUMNS:
+        return f"20{rng.randint(10, 25):02d}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+    if column == "year":
+        return rng.randint(1920, 2025)
+    if column == "rating":
+        return rng.randint(1, 10) / 2
+    if column == "rewatch":
+        return rng.choice(["Yes", None])
+    if column == "letterboxd_uri":
+        return f"https://boxd.it/{index:x}"
+    if column == "review":
+        return review_text(rng)
+    if column == "tags":
+        return rng.choice([None, "theatre", "theatre, 35mm", "rewatch, with friends"])
+    return f"{column} {rng.randint(0, 10_000)}"
+
+
+def iter_synthetic_rows(dataset: str, rows: int, seed: int = 0) -> Iterator[list]:
+    """Rows in RENAME_MAPS column order, deterministic for a given seed."""
+    rng = random.Random(seed)
+    columns = list(RENAME_MAPS[dataset].values())
+    for index in range(rows):
+        yield [synthetic_value(column, rng, index) for column in columns]
+
+
+def write_synthetic_export(path: Path, dataset: str, rows: int, seed: int = 0) -> int:
+    """Write a CSV with the Letterboxd export headers for dataset; returns its size in bytes."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", newline="", encoding="utf-8") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(list(RENAME_MAPS[dataset]))
+        writer.writerows(iter_synthetic_rows(dataset, rows, seed=seed))
+    return path.stat().st_size
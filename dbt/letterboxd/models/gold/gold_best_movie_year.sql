@@ -1,4 +1,8 @@
--- {{ config(materialized='table', schema='gold') }}
+{{ config(
+    materialized='table',
+    schema='gold',
+    indexes=[{'columns': ['year'], 'unique': True}, {'columns': ['avg_rating', 'films_rated']}]
+) }}
 
 SELECT
     year,
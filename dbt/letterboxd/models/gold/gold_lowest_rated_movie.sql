@@ -1,4 +1,8 @@
--- {{ config(materialized='table', schema='gold') }}
+{{ config(
+    materialized='table',
+    schema='gold',
+    indexes=[{'columns': ['rating']}]
+) }}
 
 SELECT
     name,
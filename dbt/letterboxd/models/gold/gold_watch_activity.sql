@@ -1,4 +1,8 @@
--- {{ config(materialized='table', schema='gold') }}
+{{ config(
+    materialized='table',
+    schema='gold',
+    indexes=[{'columns': ['watch_month'], 'unique': True}]
+) }}
 
 SELECT
     DATE_TRUNC('month', watched_date)::date AS watch_month,
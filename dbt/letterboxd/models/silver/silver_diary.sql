@@ -1,39 +1,21 @@
-{{ config(materialized='table', schema='silver') }}
+{{ config(
+    materialized='table',
+    schema='silver',
+    indexes=[{'columns': ['letterboxd_uri', 'watched_date', 'rating']}, {'columns': ['watched_date']}]
+) }}
 
 with src as (
+    -- bronze is typed and trimmed by the loader
     select
-        nullif(trim(list_date::text), '') as list_date_txt,
-        nullif(trim(name::text), '') as name,
-        nullif(trim(year::text), '') as year_txt,
-        nullif(trim(letterboxd_uri::text), '') as letterboxd_uri,
-        nullif(trim(rating::text), '') as rating_txt,
-        nullif(trim(rewatch::text), '') as rewatch_txt,
-        nullif(trim(tags::text), '') as tags,
-        nullif(trim(watched_date::text), '') as watched_date_txt
-    from {{ source('bronze', 'diary') }}
-),
-
-typed as (
-    select
-        case when list_date_txt ~ '^\d{4}-\d{2}-\d{2}$' then list_date_txt::date end as list_date,
+        list_date,
         name,
-        case when year_txt ~ '^\d{4}$' then year_txt::int end as year,
+        year,
         letterboxd_uri,
-        case when rating_txt ~ '^\d+(\.\d+)?$' then rating_txt::numeric(3,1) end as rating,
-
-        case
-            when lower(rewatch_txt) in ('yes','y','true','t','1') then true
-            when lower(rewatch_txt) in ('no','n','false','f','0') then false
-            else null
-        end as rewatch,
-
+        rating,
+        rewatch,
         tags,
-
-        case
-            when watched_date_txt ~ '^\d{4}-\d{2}-\d{2}$' then watched_date_txt::date
-            else null
-        end as watched_date
-    from src
+        watched_date
+    from {{ source('bronze', 'diary') }}
 ),
 
 deduped as (
@@ -45,7 +27,7 @@ deduped as (
                 partition by letterboxd_uri, watched_date, rating
                 order by list_date desc nulls last
             ) as rn
-        from typed
+        from src
     ) t
     where rn = 1
 )
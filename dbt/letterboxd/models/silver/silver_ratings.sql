@@ -1,23 +1,18 @@
-{{ config(materialized='table', schema='silver') }}
+{{ config(
+    materialized='table',
+    schema='silver',
+    indexes=[{'columns': ['letterboxd_uri', 'list_date', 'rating']}, {'columns': ['rating']}]
+) }}
 
 WITH src AS (
+    -- bronze is typed and trimmed by the loader
     select
-        nullif(trim(list_date), '') as list_date_txt,
-        nullif(trim(name), '') as name,
-        nullif(trim(year), '') as year_txt,
-        nullif(trim(letterboxd_uri), '') as letterboxd_uri,
-        nullif(trim(rating), '') as rating_txt
-    from {{ source('bronze', 'ratings') }}
-),
-
-typed as (
-    select
-        case when list_date_txt ~ '^\d{4}-\d{2}-\d{2}$' then list_date_txt::date end as list_date,
+        list_date,
         name,
-        case when year_txt ~ '^\d{4}$' then year_txt::int end as year,
+        year,
         letterboxd_uri,
-        case when rating_txt ~ '^\d+(\.\d+)?$' then rating_txt::numeric(3,1) end as rating
-    from src
+        rating
+    from {{ source('bronze', 'ratings') }}
 ),
 
 deduped as (
@@ -29,7 +24,7 @@ deduped as (
                 partition by letterboxd_uri, list_date, rating
                 order by letterboxd_uri
             ) as rn
-        from typed
+        from src
     ) t
     where rn = 1
 )
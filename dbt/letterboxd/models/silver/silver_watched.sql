@@ -1,25 +1,17 @@
-{{ config(materialized='table', schema='silver') }}
+{{ config(
+    materialized='table',
+    schema='silver',
+    indexes=[{'columns': ['letterboxd_uri']}]
+) }}
 
 with src as (
+    -- bronze is typed and trimmed by the loader
     select
-        nullif(trim(list_date::text), '') as list_date_txt,
-        nullif(trim(name::text), '') as name,
-        nullif(trim(year::text), '') as year_txt,
-        nullif(trim(letterboxd_uri::text), '') as letterboxd_uri
-    from {{ source('bronze', 'watched') }}
-),
-
-typed as (
-    select
-        case
-            when list_date_txt ~ '^\d{4}-\d{2}-\d{2}$' then list_date_txt::date
-        end as list_date,
+        list_date,
         name,
-        case
-            when year_txt ~ '^\d{4}$' then year_txt::int
-        end as year,
+        year,
         letterboxd_uri
-    from src
+    from {{ source('bronze', 'watched') }}
 ),
 
 deduped as (
@@ -31,7 +23,7 @@ deduped as (
                 partition by letterboxd_uri
                 order by list_date desc nulls last
             ) as rn
-        from typed
+        from src
     ) t
     where rn = 1
 )
@@ -1,38 +1,19 @@
 {{ config(
     materialized='table',
-    schema='silver'
+    schema='silver',
+    indexes=[{'columns': ['letterboxd_uri']}, {'columns': ['year']}]
 ) }}
 
 with src as (
 
+    -- bronze is typed and trimmed by the loader
     select
-        nullif(trim(list_date), '')       as list_date_txt,
-        nullif(trim(name), '')            as name,
-        nullif(trim(year), '')            as year_txt,
-        nullif(trim(letterboxd_uri), '')  as letterboxd_uri
-
-    from {{ source('bronze', 'watchlist') }}
-
-),
-
-typed as (
-
-    select
-        case
-            when list_date_txt ~ '^\d{4}-\d{2}-\d{2}$'
-            then list_date_txt::date
-        end as list_date,
-
+        list_date,
         name,
-
-        case
-            when year_txt ~ '^\d{4}$'
-            then year_txt::int
-        end as year,
-
+        year,
         letterboxd_uri
 
-    from src
+    from {{ source('bronze', 'watchlist') }}
 
 ),
 
@@ -46,7 +27,7 @@ deduped as (
                 partition by letterboxd_uri
                 order by list_date desc
             ) as rn
-        from typed
+        from src
     ) t
     where rn = 1
 
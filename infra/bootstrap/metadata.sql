@@ -8,12 +8,141 @@ CREATE TABLE IF NOT EXISTS public.ingestion_runs (
     content_type TEXT,
     status TEXT NOT NULL,
     created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
-    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
-    CONSTRAINT ingestion_runs_bucket_object_key_key UNIQUE (bucket, object_key)
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
 );
 
-CREATE INDEX IF NOT EXISTS idx_ingestion_runs_created_at
-    ON public.ingestion_runs (created_at DESC);
+-- Keyset pagination for GET /ingest/runs: newest first, ingestion_id breaks
+-- created_at ties, optionally after an equality filter on status or source.
+-- These replace the single-column created_at and status indexes.
+DROP INDEX IF EXISTS public.idx_ingestion_runs_created_at;
+DROP INDEX IF EXISTS public.idx_ingestion_runs_status;
 
-CREATE INDEX IF NOT EXISTS idx_ingestion_runs_status
-    ON public.ingestion_runs (status);
+CREATE INDEX IF NOT EXISTS idx_ingestion_runs_created_at_id
+    ON public.ingestion_runs (created_at DESC, ingestion_id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_ingestion_runs_status_created_at_id
+    ON public.ingestion_runs (status, created_at DESC, ingestion_id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_ingestion_runs_source_created_at_id
+    ON public.ingestion_runs (source, created_at DESC, ingestion_id DESC);
+
+-- Dataset recorded at ingest time so the bronze loader can resolve the latest
+-- object per dataset without listing the raw bucket.
+ALTER TABLE public.ingestion_runs
+    ADD COLUMN IF NOT EXISTS dataset TEXT;
+
+CREATE INDEX IF NOT EXISTS idx_ingestion_runs_dataset_created_at
+    ON public.ingestion_runs (dataset, created_at DESC);
+
+-- Full content hash, used to short-circuit re-uploads of identical exports.
+ALTER TABLE public.ingestion_runs
+    ADD COLUMN IF NOT EXISTS sha256 TEXT;
+
+-- At most one uploaded run per dataset and content, so two concurrent uploads
+-- of the same export cannot both be recorded; the API treats a conflict here
+-- as a duplicate. Re-uploading content an older run of the dataset holds
+-- (an export that went A -> B -> A) records a new run on the same object and
+-- marks the older run superseded, hence the partial object_key index below.
+-- Copies recorded before the index existed keep only the newest run as
+-- uploaded. The unique index also serves the dedupe lookup.
+UPDATE public.ingestion_runs AS run
+SET status = 'superseded', updated_at = NOW()
+WHERE run.status = 'uploaded'
+  AND run.sha256 IS NOT NULL
+  AND EXISTS (
+      SELECT 1
+      FROM public.ingestion_runs AS newer
+      WHERE newer.bucket = run.bucket
+        AND newer.dataset = run.dataset
+        AND newer.sha256 = run.sha256
+        AND newer.status = 'uploaded'
+        AND (newer.created_at, newer.ingestion_id) > (run.created_at, run.ingestion_id)
+  );
+
+DROP INDEX IF EXISTS public.idx_ingestion_runs_bucket_sha256;
+DROP INDEX IF EXISTS public.idx_ingestion_runs_uploaded_sha256;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_ingestion_runs_uploaded_dataset_sha256
+    ON public.ingestion_runs (bucket, dataset, sha256)
+    WHERE status = 'uploaded' AND sha256 IS NOT NULL;
+
+ALTER TABLE public.ingestion_runs
+    DROP CONSTRAINT IF EXISTS ingestion_runs_bucket_object_key_key;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_ingestion_runs_uploaded_object_key
+    ON public.ingestion_runs (bucket, object_key)
+    WHERE status = 'uploaded';
+
+-- Per-stage timings and volumes recorded by the API, bronze loader and DAG.
+CREATE TABLE IF NOT EXISTS public.pipeline_stage_metrics (
+    metric_id BIGSERIAL PRIMARY KEY,
+    component TEXT NOT NULL,
+    stage TEXT NOT NULL,
+    subject TEXT,
+    run_id TEXT,
+    ingestion_id UUID,
+    object_key TEXT,
+    duration_ms DOUBLE PRECISION NOT NULL CHECK (duration_ms >= 0),
+    rows_processed BIGINT,
+    bytes_processed BIGINT,
+    recorded_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_pipeline_stage_metrics_stage_recorded_at
+    ON public.pipeline_stage_metrics (component, stage, subject, recorded_at DESC);
+
+CREATE INDEX IF NOT EXISTS idx_pipeline_stage_metrics_ingestion_id
+    ON public.pipeline_stage_metrics (ingestion_id);
+
+-- Bronze load queue. The API enqueues a job in the same transaction as the
+-- ingestion_runs row; the letterboxd_load_queue DAG claims and loads them.
+CREATE TABLE IF NOT EXISTS public.bronze_load_jobs (
+    job_id UUID PRIMARY KEY,
+    ingestion_id UUID NOT NULL UNIQUE REFERENCES public.ingestion_runs (ingestion_id),
+    dataset TEXT NOT NULL,
+    bucket TEXT NOT NULL,
+    object_key TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'queued',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT,
+    enqueued_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    started_at TIMESTAMPTZ,
+    finished_at TIMESTAMPTZ
+);
+
+CREATE INDEX IF NOT EXISTS idx_bronze_load_jobs_queued
+    ON public.bronze_load_jobs (enqueued_at)
+    WHERE status = 'queued';
+
+CREATE INDEX IF NOT EXISTS idx_bronze_load_jobs_running
+    ON public.bronze_load_jobs (started_at)
+    WHERE status = 'running';
+
+-- Resumable browser uploads. One row per S3 multipart upload; the parts
+-- themselves are listed from MinIO, which is the source of truth for them.
+CREATE TABLE IF NOT EXISTS public.upload_sessions (
+    upload_id UUID PRIMARY KEY,
+    ingestion_id UUID NOT NULL UNIQUE,
+    s3_upload_id TEXT NOT NULL,
+    bucket TEXT NOT NULL,
+    object_key TEXT NOT NULL,
+    original_filename TEXT NOT NULL,
+    content_type TEXT,
+    dataset TEXT,
+    size_bytes BIGINT NOT NULL CHECK (size_bytes > 0),
+    sha256 TEXT NOT NULL,
+    part_size_bytes BIGINT NOT NULL CHECK (part_size_bytes > 0),
+    status TEXT NOT NULL DEFAULT 'open',
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+-- Lets a client that lost its upload id resume by content.
+CREATE INDEX IF NOT EXISTS idx_upload_sessions_open_sha256
+    ON public.upload_sessions (bucket, sha256, size_bytes)
+    WHERE status = 'open';
+
+-- The API's sweep aborts sessions left open past UPLOAD_SESSION_EXPIRY_HOURS.
+CREATE INDEX IF NOT EXISTS idx_upload_sessions_open_created_at
+    ON public.upload_sessions (created_at)
+    WHERE status = 'open';
@@ -1,3 +1,17 @@
 CREATE SCHEMA IF NOT EXISTS bronze;
 CREATE SCHEMA IF NOT EXISTS silver;
 CREATE SCHEMA IF NOT EXISTS gold;
+
+-- One row per successful bronze load; the latest row per dataset describes
+-- the export bronze.<dataset> currently holds.
+CREATE TABLE IF NOT EXISTS bronze.load_ledger (
+    load_id UUID PRIMARY KEY,
+    dataset TEXT NOT NULL,
+    object_key TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    rows_loaded BIGINT NOT NULL,
+    loaded_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_load_ledger_dataset_loaded_at
+    ON bronze.load_ledger (dataset, loaded_at);